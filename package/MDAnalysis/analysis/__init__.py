@@ -71,6 +71,10 @@ Available analysis modules
     a bilayer; the algorithm can deal with any deformations as long as
     the two leaflets are topologically distinct.
 
+:mod:`~MDAnalysis.analysis.msd`
+    Mean square displacements of atoms or molecules for all lag times,
+    calculated with FFTs from unwrapped trajectories.
+
 :mod:`~MDAnalysis.analysis.nuclinfo`
     Analyse the nucleic acid for the backbone dihedrals, chi, sugar
     pucker, and Watson-Crick distance (minor and major groove
@@ -120,6 +124,7 @@ __all__ = [
     'helanal',
     'hole',
     'leaflet',
+    'msd',
     'nuclinfo',
     'polymer',
     'psa',
@@ -179,6 +179,9 @@ normal users.
 """
 
 import os.path
+import multiprocessing
+import shutil
+import tempfile
 from six.moves import range, zip, zip_longest
 import numpy as np
 from numpy.lib.utils import deprecate
@@ -305,12 +308,80 @@ def _fit_to(mobile_coordinates, ref_coordinates, mobile_atoms,
                                   weights=weights)
 
     mobile_atoms.translate(-mobile_com)
-    mobile_atoms.rotate(R)
+    mobile_atoms.rotate(R, point=(0, 0, 0))
     mobile_atoms.translate(ref_com)
 
     return mobile_atoms, min_rmsd
 
 
+def _fit_block(xyz, mobile_indices, masses, ref_coordinates, ref_com,
+               weights=None):
+    """Superimpose a block of frames on the reference (in place).
+
+    Parameters
+    ----------
+    xyz : array
+        ``(n_frames, n_atoms, 3)`` coordinates of all atoms, which are
+        translated and rotated in place
+    mobile_indices : array
+        Indices of the atoms in *xyz* that are fitted
+    masses : array
+        Masses of the fitted atoms, used for their centers of mass
+    ref_coordinates : array
+        Centered coordinates of the reference atoms
+    ref_com : array
+        Center of mass of the reference atoms
+    weights : array, optional
+        Weights for the weighted rmsd
+
+    Returns
+    -------
+    rmsd
+        Minimum rmsd of each frame
+    """
+    mobile = xyz[:, mobile_indices].astype(np.float64)
+    mobile_com = np.einsum('fai,a->fi', mobile, masses) / masses.sum()
+    mobile -= mobile_com[:, np.newaxis]
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64) / np.mean(weights)
+    rmsd, R = qcp.BatchCalcRMSDRotationalMatrix(
+        mobile, np.asarray(ref_coordinates, dtype=np.float64),
+        weights=weights, center=False,
+        rotations=True)
+    # x' = (x - mobile_com) R^T + ref_com for all atoms of all frames
+    xyz -= mobile_com[:, np.newaxis].astype(xyz.dtype)
+    xyz[:] = np.einsum('faj,fij->fai', xyz, R) + ref_com
+    return rmsd
+
+
+def _write_block(block, writer, *fit_args):
+    """Fit the timesteps in *block* with :func:`_fit_block` and write them."""
+    xyz = np.array([ts.positions for ts in block])
+    rmsd = _fit_block(xyz, *fit_args)
+    for ts, positions in zip(block, xyz):
+        ts.positions = positions
+        writer.write(ts)
+    return rmsd
+
+
+def _align_part(args):
+    """Align frames ``start:stop:step`` of a trajectory into *filename*."""
+    topology, trajectory, start, stop, step, block_size, filename, fit_args \
+        = args
+    universe = mda.Universe(topology, trajectory)
+    rmsd = []
+    with mda.Writer(filename, universe.atoms.n_atoms) as writer:
+        block = []
+        for ts in universe.trajectory[start:stop if stop >= 0 else None:step]:
+            block.append(ts.copy())
+            if len(block) == block_size:
+                rmsd.append(_write_block(block, writer, *fit_args))
+                block = []
+        if block:
+            rmsd.append(_write_block(block, writer, *fit_args))
+    return np.concatenate(rmsd)
+
+
 def alignto(mobile, reference, select="all", mass_weighted=False,
             subselection=None, tol_mass=0.1, strict=False):
     """Spatially align *mobile* to *reference* by doing a RMSD fit on
@@ -482,11 +553,24 @@ class AlignTraj(AnalysisBase):
     filename : string
         String reflecting the filename of the file where mobile_atoms positions
         will be written to upon running RMSD alignment
+
+    Notes
+    -----
+    With *block_size* > 1 the rotation matrices of blocks of frames are
+    calculated in one call to the parallel batched QCP kernel
+    (:func:`MDAnalysis.lib.qcprot.BatchCalcRMSDRotationalMatrix`) and applied
+    to all atoms of a block at once. An in-memory trajectory is always
+    aligned in this way, directly on the coordinate array of the
+    :class:`~MDAnalysis.coordinates.memory.MemoryReader`.
+
+    .. versionchanged:: 0.16.0
+       Added *block_size* and *nproc*.
     """
 
     def __init__(self, mobile, reference, select='all', filename=None,
                  prefix='rmsfit_', mass_weighted=False, tol_mass=0.1,
-                 strict=False, force=True, in_memory=False, **kwargs):
+                 strict=False, force=True, in_memory=False, block_size=None,
+                 nproc=1, **kwargs):
         """Initialization
 
         Parameters
@@ -527,6 +611,15 @@ class AlignTraj(AnalysisBase):
             performance substantially in some cases. In this case, no file
             is written out (`filename` and `prefix` are ignored) and only
             the coordinates of `mobile` are changed in memory.
+        block_size : int, optional
+            Number of frames that are fitted together; by default an
+            in-memory trajectory is fitted in blocks of 256 frames and other
+            trajectories frame by frame
+        nproc : int, optional
+            Number of processes that align and write contiguous blocks of
+            frames of a XTC or TRR output file in parallel; the parts are
+            concatenated afterwards. `mobile` must have been loaded from
+            files.
 
         Notes
         -----
@@ -570,6 +663,14 @@ class AlignTraj(AnalysisBase):
         self.mobile = mobile.atoms
 
         self.filename = filename
+        self.in_memory = isinstance(self._trajectory, MemoryReader)
+        if block_size is None:
+            block_size = 256 if self.in_memory else 1
+        self.block_size = block_size
+        self.nproc = 1 if self.in_memory else nproc
+        if (self.nproc > 1 and os.path.splitext(self.filename)[1].lower()
+                not in ('.xtc', '.trr')):
+            raise ValueError("nproc > 1 requires a XTC or TRR output file")
 
         natoms = self.mobile.n_atoms
         self.ref_atoms, self.mobile_atoms = get_matching_atoms(
@@ -578,8 +679,9 @@ class AlignTraj(AnalysisBase):
 
         # with self.filename == None (in_memory), the NullWriter is chosen
         # (which just ignores input) and so only the in_memory trajectory is
-        # retained
-        self._writer = mda.Writer(self.filename, natoms)
+        # retained; parallel runs write parts that are joined later
+        self._writer = (mda.Writer(self.filename, natoms)
+                        if self.nproc == 1 else None)
 
         if mass_weighted:
             # if performing a mass-weighted alignment/rmsd calculation
@@ -596,8 +698,22 @@ class AlignTraj(AnalysisBase):
         # allocate the array for selection atom coords
         self.rmsd = np.zeros((self.n_frames,))
 
+    def run(self):
+        """Perform the alignment"""
+        if self.block_size == 1 and self.nproc == 1:
+            return super(AlignTraj, self).run()
+        self._prepare()
+        if self.in_memory:
+            self._align_in_memory()
+        elif self.nproc > 1:
+            self._align_parallel()
+        else:
+            self._align_blocks()
+        self._conclude()
+        return self
+
     def _single_frame(self):
-        index = self._ts.frame
+        index = self._frame_index
         mobile_com = self.mobile_atoms.center_of_mass()
         mobile_coordinates = self.mobile_atoms.positions - mobile_com
         mobile_atoms, self.rmsd[index] = _fit_to(mobile_coordinates,
@@ -608,8 +724,77 @@ class AlignTraj(AnalysisBase):
         # write whole aligned input trajectory system
         self._writer.write(mobile_atoms)
 
+    def _fit_args(self):
+        return (self.mobile_atoms.indices, self.mobile_atoms.masses,
+                self._ref_coordinates, self._ref_com, self._weights)
+
+    def _align_in_memory(self):
+        """Align the coordinate array of the in-memory trajectory in place."""
+        start, stop, step = self._trajectory.check_slice_indices(
+            self.start, self.stop, self.step)
+        order = self._trajectory.stored_order
+        # view of the array in (frame, atom, coordinate) order
+        xyz = np.transpose(self._trajectory.get_array(),
+                           [order.index(axis) for axis in 'fac'])
+        xyz = xyz[start:stop if stop >= 0 else None:step]
+        for i in range(0, self.n_frames, self.block_size):
+            self.rmsd[i:i + self.block_size] = _fit_block(
+                xyz[i:i + self.block_size], *self._fit_args())
+            self._pm.echo(min(i + self.block_size, self.n_frames) - 1)
+        # reload the current frame from the aligned array
+        self._trajectory[self._trajectory.ts.frame]
+
+    def _align_blocks(self):
+        """Align and write the trajectory in blocks of frames."""
+        block = []
+        for i, ts in enumerate(
+                self._trajectory[self.start:self.stop:self.step]):
+            block.append(ts.copy())
+            if len(block) == self.block_size or i == self.n_frames - 1:
+                self.rmsd[i + 1 - len(block):i + 1] = _write_block(
+                    block, self._writer, *self._fit_args())
+                block = []
+            self._pm.echo(i)
+
+    def _align_parallel(self):
+        """Align blocks of frames in parallel into parts of the output file."""
+        universe = self.mobile.universe
+        trajectory = getattr(self._trajectory, 'filenames',
+                             getattr(self._trajectory, 'filename', None))
+        if universe.filename is None or trajectory is None:
+            raise ValueError("nproc > 1 requires a universe read from files")
+        start, stop, step = self._trajectory.check_slice_indices(
+            self.start, self.stop, self.step)
+        frames = np.arange(self.n_frames) * step + start
+        tmpdir = tempfile.mkdtemp(
+            dir=os.path.dirname(os.path.abspath(self.filename)))
+        ext = os.path.splitext(self.filename)[1]
+        try:
+            tasks = [(universe.filename, trajectory, int(block[0]),
+                      int(block[-1]) + step, step, self.block_size,
+                      os.path.join(tmpdir, '{0:d}{1}'.format(k, ext)),
+                      self._fit_args())
+                     for k, block in enumerate(
+                         np.array_split(frames, self.nproc))
+                     if len(block)]
+            pool = multiprocessing.Pool(len(tasks))
+            try:
+                rmsd = pool.map(_align_part, tasks)
+            finally:
+                pool.close()
+                pool.join()
+            self.rmsd[:] = np.concatenate(rmsd)
+            # frames are stored independently in XTC and TRR files
+            with open(self.filename, 'wb') as output:
+                for task in tasks:
+                    with open(task[6], 'rb') as part:
+                        shutil.copyfileobj(part, output)
+        finally:
+            shutil.rmtree(tmpdir)
+
     def _conclude(self):
-        self._writer.close()
+        if self._writer is not None:
+            self._writer.close()
         if not self._verbose:
             logging.disable(logging.NOTSET)
 
@@ -323,3 +323,30 @@ def _filter_baseanalysis_kwargs(function, kwargs):
         base_args[argname] = kwargs.pop(argname, default)
 
     return base_args, kwargs
+
+
+def _merge_moments(n_a, mean_a, scatter_a, n_b, mean_b, scatter_b):
+    """Combine the means and scatters of two sets of samples.
+
+    Uses the pairwise update of Chan, Golub and LeVeque, which is stable for
+    any number and size of the sets. The scatters are either the sums of
+    squared deviations (same shape as the means) or the scatter matrices
+    (outer products of the deviations of 1D means).
+
+    Returns
+    -------
+    n, mean, scatter
+        Number of samples, mean and scatter of the combined set
+    """
+    n = n_a + n_b
+    if n_a == 0:
+        return n_b, np.array(mean_b), np.array(scatter_b)
+    delta = mean_b - mean_a
+    mean = mean_a + delta * (n_b / float(n))
+    if np.ndim(scatter_a) > np.ndim(delta):
+        correction = np.outer(delta, delta)
+    else:
+        correction = delta**2
+    scatter = scatter_a + scatter_b
+    scatter += correction * (n_a * n_b / float(n))
+    return n, mean, scatter
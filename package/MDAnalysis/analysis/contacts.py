@@ -228,6 +228,7 @@ import MDAnalysis
 import MDAnalysis.lib.distances
 from MDAnalysis.lib.util import openany
 from MDAnalysis.analysis.distances import distance_array
+from MDAnalysis.lib.distances import calc_bonds, capped_distance
 from MDAnalysis.core.groups import AtomGroup
 from .base import AnalysisBase
 
@@ -379,10 +380,17 @@ class Contacts(AnalysisBase):
     ----------
     timeseries : list
         list containing *Q* for all refgroup pairs and analyzed frames
+    nonnative : array
+        number of non-native contacts for all refgroup pairs and analyzed
+        frames (only with ``nonnative=True``)
 
+
+    .. versionchanged:: 0.16.0
+       Added *sparse*, *pbc* and *nonnative* keywords.
     """
     def __init__(self, u, selection, refgroup, method="hard_cut", radius=4.5,
-                 kwargs=None, **basekwargs):
+                 kwargs=None, sparse=False, pbc=False, nonnative=False,
+                 **basekwargs):
         """
         Parameters
         ----------
@@ -401,6 +409,21 @@ class Contacts(AnalysisBase):
         kwargs : dict, optional
             dictionary of additional kwargs passed to `method`. Check
             respective functions for reasonable values.
+        sparse : bool, optional
+            If ``True``, store the native contacts as a list of index pairs
+            and only compute the distances of these pairs in each frame,
+            instead of the full distance matrix between both groups. Then
+            :attr:`initial_contacts` holds ``(n_contacts, 2)`` arrays of
+            indices into the two groups and :attr:`r0` the matching
+            reference distances. [``False``]
+        pbc : bool, optional
+            If ``True``, distances are calculated with the minimum image
+            convention. [``False``]
+        nonnative : bool, optional
+            If ``True``, additionally count in each frame the contacts
+            (closer than `radius`) that are not native contacts; the
+            counts are stored in :attr:`nonnative`. Only available
+            with `sparse`. [``False``]
         start : int, optional
             First frame of trajectory to analyse, Default: None becomes 0.
         stop : int, optional
@@ -427,42 +450,85 @@ class Contacts(AnalysisBase):
         self.grA = u.select_atoms(selection[0])
         self.grB = u.select_atoms(selection[1])
 
+        if nonnative and not sparse:
+            raise ValueError("nonnative contacts can only be tracked with "
+                             "sparse=True")
+        self._sparse = sparse
+        self._pbc = pbc
+        self._nonnative = nonnative
+        self.radius = radius
+
         # contacts formed in reference
         self.r0 = []
         self.initial_contacts = []
 
         if isinstance(refgroup[0], AtomGroup):
-            refA, refB = refgroup
-            self.r0.append(distance_array(refA.positions, refB.positions))
-            self.initial_contacts.append(contact_matrix(self.r0[-1], radius))
-        else:
-            for refA, refB in refgroup:
-                self.r0.append(distance_array(refA.positions, refB.positions))
+            refgroup = [refgroup]
+        for refA, refB in refgroup:
+            box = refA.dimensions if pbc else None
+            if sparse:
+                pairs = capped_distance(refA.positions, refB.positions,
+                                        radius, box=box,
+                                        return_distances=False)
+                # same order as the contacts of a dense contact matrix
+                pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+                self.initial_contacts.append(pairs)
+                # same kernel as the distances of each frame, so that the
+                # reference frame gives exactly r == r0
+                self.r0.append(calc_bonds(refA.positions[pairs[:, 0]],
+                                          refB.positions[pairs[:, 1]],
+                                          box=box))
+            else:
+                self.r0.append(distance_array(refA.positions, refB.positions,
+                                              box=box))
                 self.initial_contacts.append(contact_matrix(self.r0[-1],
                                                             radius))
 
+        if nonnative:
+            # native contacts encoded as single integers for fast lookup
+            self._native_keys = [np.unique(c[:, 0] * len(self.grB) + c[:, 1])
+                                 for c in self.initial_contacts]
+
         self.fraction_kwargs = kwargs if kwargs is not None else {}
         self.timeseries = []
+        self.nonnative = []
 
     def _single_frame(self):
-        # compute distance array for a frame
-        d = distance_array(self.grA.positions, self.grB.positions)
+        box = self._ts.dimensions if self._pbc else None
+        posA = self.grA.positions
+        posB = self.grB.positions
+        if not self._sparse:
+            # compute distance array for a frame
+            d = distance_array(posA, posB, box=box)
 
         y = np.empty(len(self.r0) + 1)
         y[0] = self._ts.frame
         for i, (initial_contacts, r0) in enumerate(zip(self.initial_contacts,
                                                        self.r0)):
             # select only the contacts that were formed in the reference state
-            r = d[initial_contacts]
-            r0 = r0[initial_contacts]
+            if self._sparse:
+                r = calc_bonds(posA[initial_contacts[:, 0]],
+                               posB[initial_contacts[:, 1]], box=box)
+            else:
+                r = d[initial_contacts]
+                r0 = r0[initial_contacts]
             y[i + 1] = self.fraction_contacts(r, r0, **self.fraction_kwargs)
 
+        if self._nonnative:
+            pairs = capped_distance(posA, posB, self.radius, box=box,
+                                    return_distances=False)
+            keys = pairs[:, 0] * len(self.grB) + pairs[:, 1]
+            self.nonnative.append([len(keys) - np.in1d(keys, native).sum()
+                                   for native in self._native_keys])
+
         if len(y) == 1:
             y = y[0]
         self.timeseries.append(y)
 
     def _conclude(self):
         self.timeseries = np.array(self.timeseries, dtype=float)
+        if self._nonnative:
+            self.nonnative = np.array(self.nonnative, dtype=int)
 
     def save(self, outfile):
         """save contacts timeseries
@@ -486,7 +552,7 @@ def _new_selections(u_orig, selections, frame):
 
 
 def q1q2(u, selection='all', radius=4.5,
-         start=None, stop=None, step=None):
+         start=None, stop=None, step=None, sparse=False, pbc=False):
     """Perform a q1-q2 analysis.
 
     Compares native contacts between the starting structure and final structure
@@ -506,12 +572,20 @@ def q1q2(u, selection='all', radius=4.5,
         Last frame of trajectory to analyse, Default: -1
     step : int, optional
         Step between frames to analyse, Default: 1
+    sparse : bool, optional
+        Only evaluate the distances of native contacts, see
+        :class:`Contacts`. Default: ``False``
+    pbc : bool, optional
+        Use the minimum image convention. Default: ``False``
 
     Returns
     -------
     contacts : :class:`Contacts`
         Contact Analysis that is set up for a q1-q2 analysis
 
+
+    .. versionchanged:: 0.16.0
+       Added *sparse* and *pbc* keywords.
     """
     selection = (selection, selection)
     first_frame_refs = _new_selections(u, selection, 0)
@@ -520,7 +594,7 @@ def q1q2(u, selection='all', radius=4.5,
                     (first_frame_refs, last_frame_refs),
                     radius=radius, method=radius_cut_q,
                     start=start, stop=stop, step=step,
-                    kwargs={'radius': radius})
+                    kwargs={'radius': radius}, sparse=sparse, pbc=pbc)
 
 ################################################################################
 ################################################################################
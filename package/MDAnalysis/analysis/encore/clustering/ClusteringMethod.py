@@ -157,6 +157,98 @@ class AffinityPropagationNative(ClusteringMethod):
         details = {}
         return clusters, details
 
+
+class SparseAffinityPropagationNative(ClusteringMethod):
+    """
+    Interface to the natively implemented Affinity propagation procedure on
+    a sparse similarity graph, for ensembles that are too large for
+    :class:`AffinityPropagationNative`.
+
+    Each conformation is only connected to its nearest neighbors and/or
+    to the conformations within a distance cutoff (see
+    :meth:`encore.utils.TriangularMatrix.neighbor_graph`), and messages are
+    only exchanged along these connections. The distance matrix is read in
+    blocks of rows, so that it can be a memory-mapped matrix on disk.
+
+    .. versionadded:: 0.16.0
+    """
+    def __init__(self,
+                 damping=0.9, preference=-1.0,
+                 max_iter=500, convergence_iter=50,
+                 add_noise=True, n_neighbors=50, cutoff=None):
+        """
+        Parameters
+        ----------
+
+        damping : float, optional
+            Damping factor (default is 0.9). Parameter for the Affinity
+            Propagation for clustering.
+
+        preference : float, optional
+            Preference parameter used in the Affinity Propagation algorithm for
+            clustering  (default -1.0). A high preference value results in
+            many clusters, a low preference will result in fewer numbers of
+            clusters.
+
+        max_iter : int, optional
+            Maximum number of iterations for affinity propagation (default is
+            500).
+
+        convergence_iter : int, optional
+            Minimum number of unchanging iterations to achieve convergence
+            (default is 50). Parameter in the Affinity Propagation for
+            clustering.
+
+        add_noise : bool, optional
+            Apply noise to similarity matrix before running clustering
+            (default is True)
+
+        n_neighbors : int or None, optional
+            Number of nearest neighbors of each conformation in the
+            similarity graph (default is 50).
+
+        cutoff : float or None, optional
+            Only connect conformations up to this distance (default is None).
+
+        """
+        if n_neighbors is None and cutoff is None:
+            raise ValueError("n_neighbors or cutoff must be given")
+        self.damping = damping
+        self.preference = preference
+        self.max_iter = max_iter
+        self.convergence_iter = convergence_iter
+        self.add_noise = add_noise
+        self.n_neighbors = n_neighbors
+        self.cutoff = cutoff
+
+    def __call__(self, distance_matrix):
+        """
+        Parameters
+        ----------
+
+        distance_matrix : encore.utils.TriangularMatrix
+            conformational distance matrix
+
+
+        Returns
+        -------
+        numpy.array
+            list of cluster indices
+        """
+        distances, indices, indptr = distance_matrix.neighbor_graph(
+            n_neighbors=self.n_neighbors, cutoff=self.cutoff)
+        clusters = affinityprop.SparseAffinityPropagation().run(
+            similarities=distances * -1.,   # invert sign
+            indices=indices,
+            indptr=indptr,
+            preference=self.preference,
+            lam=self.damping,
+            max_iterations = self.max_iter,
+            convergence = self.convergence_iter,
+            noise=int(self.add_noise))
+        details = {}
+        return clusters, details
+
 if sklearn:
 
     class AffinityPropagation(ClusteringMethod):
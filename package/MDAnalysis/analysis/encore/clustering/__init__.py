@@ -25,7 +25,8 @@ from . import ClusterCollection
 __all__ = [
     'ClusterCollection.ClusterCollection',
     'ClusterCollection.Cluster',
-    'ClusteringMethod.AffinityPropagationNative'
-    'ClusteringMethod.AffinityPropagation'
+    'ClusteringMethod.AffinityPropagationNative',
+    'ClusteringMethod.SparseAffinityPropagationNative',
+    'ClusteringMethod.AffinityPropagation',
     'ClusteringMethod.DBSCAN']
 
@@ -139,3 +139,106 @@ cdef class AffinityPropagation(object):
         logging.info("Preference %3.2f: converged in %d iterations" % (preference, iterations))
 
         return clusters
+
+
+cdef class SparseAffinityPropagation(object):
+    """
+    Affinity propagation clustering algorithm on a sparse similarity graph. Messages are only exchanged along the edges of the graph (see ap.c), so that memory and time per iteration grow with the number of edges instead of with the square of the number of elements. The sparse variant of the algorithm is described in the paper:
+
+    Clustering by Passing Messages Between Data Points.
+    Brendan J. Frey and Delbert Dueck, University of Toronto
+    Science 315, 972–976, February 2007
+
+    .. versionadded:: 0.16.0
+
+    """
+
+    def run(self, similarities, indices, indptr, preference, float lam, int max_iterations, int convergence, int noise=1):
+        """
+        Run the clustering algorithm.
+
+        Parameters
+        ----------
+
+        similarities : numpy.array of floats
+		    Similarity values of the edges of the graph, in compressed sparse row format (see encore.utils.TriangularMatrix.neighbor_graph). The graph must contain the edge of every element to itself; its value is replaced by the preference.
+
+        indices : numpy.array of int
+		    Column of each edge; the columns of the edges of row i are indices[indptr[i]:indptr[i+1]]
+
+        indptr : numpy.array of int
+		    Index of the first edge of each row, followed by the total number of edges
+
+	preference : numpy.array of floats or float
+		    Preference values, which the determine the number of clusters. If a single value is given, all the preference values are set to that. Otherwise, the list is used to set the preference values (one value per element, so the list must be of the same size as the number of elements)
+
+        lam : float
+		    Floating point value that defines how much damping is applied to the solution at each iteration. Must be ]0,1]
+
+        max_iterations : int
+		    Maximum number of iterations
+
+        convergence : int
+		    Number of iterations in which the cluster centers must remain the same in order to reach convergence
+
+        noise : int
+		    Whether to apply noise to the input similarities, such there are no equal values. 1 is for yes, 0 is for no.
+
+
+        Returns
+        -------
+
+        elements : list of int or None
+		    List of cluster-assigned elements, which can be used by encore.utils.ClustersCollection to generate Cluster objects. See these classes for more details.
+
+	"""
+        cdef int cn = len(indptr) - 1
+
+        # Prepare input and ouput arrays
+        cdef numpy.ndarray[numpy.float32_t, ndim=1] simndarray = numpy.array(similarities, dtype=numpy.float32)
+        cdef numpy.ndarray[int, ndim=1] indndarray = numpy.ascontiguousarray(indices, dtype=numpy.intc)
+        cdef numpy.ndarray[long, ndim=1] ptrndarray = numpy.ascontiguousarray(indptr, dtype=long)
+        cdef numpy.ndarray[long, ndim=1] clusters = numpy.zeros((cn), dtype=long)
+
+        # Assign preference values to the edges of the elements to themselves
+        rows = numpy.repeat(numpy.arange(cn), numpy.diff(ptrndarray))
+        cdef numpy.ndarray[long, ndim=1] diagonal = numpy.flatnonzero(indndarray == rows).astype(long)
+        if diagonal.shape[0] != cn:
+            raise ValueError("The graph must contain the edge of every element to itself")
+        if isinstance(preference, float):
+            simndarray[diagonal] = preference
+        else:
+            try:
+                simndarray[diagonal] = numpy.asarray(preference, dtype=numpy.float32)
+            except ValueError:
+                raise TypeError("Preference should be a float or one float per element")
+
+        logging.info("Starting sparse Affinity Propagation on {0:d} edges".format(simndarray.shape[0]))
+
+        # run C module Affinity Propagation
+        iterations = caffinityprop.CSparseAffinityPropagation(<float*>simndarray.data, <long*>ptrndarray.data, <int*>indndarray.data, <long*>diagonal.data, cn, lam, max_iterations, convergence, noise, <long*>clusters.data)
+
+        # Provide warning in case of lack of convergence
+        if iterations < 0:
+            logging.info("Sparse Affinity Propagation could not converge in %d iterations" % (-iterations))
+            import warnings
+            warnings.warn("Clustering did not fully converge in {0:d} iterations".format(-iterations))
+
+        # Assign each element to the most similar centroid among its
+        # neighbors; elements without such neighbors keep the centroid found
+        # by the C module
+        centroids = numpy.unique(clusters)
+        is_centroid = numpy.zeros(cn, dtype=bool)
+        is_centroid[centroids] = True
+        edges = numpy.flatnonzero(is_centroid[indndarray])
+        order = numpy.lexsort((-simndarray[edges], rows[edges]))
+        edges = edges[order]
+        first = numpy.unique(rows[edges], return_index=True)[1]
+        clusters[rows[edges[first]]] = indndarray[edges[first]]
+
+        # Centroids should point to themselves
+        clusters[centroids] = centroids
+
+        logging.info("Sparse Affinity Propagation converged in %d iterations" % (iterations))
+
+        return clusters
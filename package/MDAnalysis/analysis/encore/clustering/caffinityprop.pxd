@@ -40,3 +40,4 @@ cdef extern from "ap.h":
     float min(float*, int)
     float max(float*, int)
     int CAffinityPropagation(float*, int, float, int, int, bint, long*)
+    int CSparseAffinityPropagation(float*, long*, int*, long*, int, float, int, int, bint, long*)
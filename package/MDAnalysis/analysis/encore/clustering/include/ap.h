@@ -28,3 +28,5 @@ float min(float*, int);
 float max(float*, int);
 
 int CAffinityPropagation(float*, int, float, int, int, int, float*);
+
+int CSparseAffinityPropagation(float*, long*, int*, long*, int, float, int, int, int, long*);
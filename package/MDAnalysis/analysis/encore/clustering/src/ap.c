@@ -276,3 +276,161 @@ int CAffinityPropagation(float *s, int n, float lambda, int max_iterations, int
 
     return conv_reached == 1 ? currit : -currit;
 }
+
+int CSparseAffinityPropagation(float *s, long *indptr, int *indices, long *diagonal, int n, float lambda, int max_iterations, int convergence, int noise, long* clusters) { // Affinity Propagation on a sparse similarity graph
+
+    /* n: number of elements
+       s: similarities of the edges, for the rows of the graph in CSR format
+       indptr: the edges of row i are indptr[i] to indptr[i+1]-1
+       indices: column of each edge
+       diagonal: index of the edge (i,i) of each row; s of these edges holds the preferences
+       lambda: damping parameter ([0.5;1.0[)
+       max_iterations: maximum number of iterations
+       convergence: convergence reached when centroids are stable for convergence iterations
+       noise: apply noise to input similarities to eliminate redundancy
+       clusters: for each element, the column of its edge with the largest r+a
+
+       Responsibilities and availabilities are only kept for the edges of the graph,
+       so that memory grows with the number of edges instead of with n*n */
+
+    long n_edges = indptr[n];
+	float *r =              (float *)  calloc( n_edges , sizeof(float));  // responsibilities of the edges
+	float *a  =             (float *)  calloc( n_edges , sizeof(float));  // availabilities of the edges
+	float *colsum =         (float *)  malloc( n   * sizeof(float));      // N array of the column sums of the positive responsibilities
+    int *exemplars =          (int *)  malloc( n   * sizeof(int));        // N array of exemplars
+    int *old_exemplars =      (int *)  malloc( n   * sizeof(int));        // N array of old exemplars, for convergence checking
+
+    long e = 0;                       // index over edges
+    long argmax = 0;                  // edge of the largest s+a of a row
+    int k = 0;                        // column index
+    int currit = 0;                   // current iteration number
+    int conv_count = 0;               // number of iterations with constant centroids so far
+	float tmp = 0.0;                  // temporary value
+	float maxsim = 0.0;
+	float max1 = 0;
+	float max2 = 0;
+	int conv_reached = 0;        // convergence flag
+	int has_cluster = 0;         // found clusters flag
+	float lamprev = 1.0 - lambda;     // 1-lambda
+
+    if (noise != 0) { // Add noise to data
+        for (e=0;e<n_edges;e++) {
+            s[e] = s[e] + (1e-16*s[e] )*(rand()/((float)RAND_MAX+1));
+        }
+    }
+
+    for (int i=0;i<n;i++) { // Initialize exemplars
+		exemplars[i] = -1;
+	}
+
+	while (currit < max_iterations && conv_reached == 0) { // Start iterations
+
+	// Update r, row by row
+
+		for (int i=0;i<n;i++) {
+			max1 = -FLT_MAX;
+			max2 = -FLT_MAX;
+			argmax = indptr[i];
+			for (e=indptr[i];e<indptr[i+1];e++) {
+				tmp = s[e]+a[e];
+				if (tmp > max1) {
+					max2 = max1;
+					max1 = tmp;
+					argmax = e;
+				}
+				else if (tmp > max2) {
+					max2 = tmp;
+				}
+			}
+			for (e=indptr[i];e<indptr[i+1];e++) {
+				if (e == argmax)
+					r[e] = lambda*r[e] + lamprev*(s[e] - max2);
+				else
+					r[e] = lambda*r[e] + lamprev*(s[e] - max1);
+			}
+		}
+
+	// Update a: sum r(k,k) and the positive r(j,k) of the edges of every column k
+
+		for (k=0;k<n;k++) {
+			colsum[k] = 0.0;
+		}
+		for (int i=0;i<n;i++) {
+			for (e=indptr[i];e<indptr[i+1];e++) {
+				if (e == diagonal[i])
+					colsum[indices[e]] += r[e];
+				else if (r[e] > 0.0)
+					colsum[indices[e]] += r[e];
+			}
+		}
+		for (int i=0;i<n;i++) {
+			for (e=indptr[i];e<indptr[i+1];e++) {
+				k = indices[e];
+				if (e != diagonal[i]) { // remove r(i,k) from the sum
+					tmp = colsum[k];
+					if (r[e] > 0.0)
+						tmp = tmp - r[e];
+					if (tmp < 0.0)
+						a[e] = lambda*a[e] + lamprev*tmp;
+					else
+						a[e] = lambda*a[e];
+				}
+				else // remove r(k,k) from the sum
+					a[e] = lambda*a[e] + lamprev*(colsum[k] - r[e]);
+			}
+		}
+
+    //Check for convergence
+
+        int* tmp_exemplars = old_exemplars; // current exemplars become old, before calculating the new ones
+        old_exemplars = exemplars;
+        exemplars = tmp_exemplars;
+
+        has_cluster = 0;
+        for (int i=0;i<n;i++) { // identify exemplars
+            e = diagonal[i];
+            if (r[e] + a[e] > 0.0) {
+                exemplars[i] = 1;
+                has_cluster = 1;
+            }
+            else
+                exemplars[i] = 0;
+        }
+
+        if (has_cluster != 0) {
+            conv_count++;
+            for (int j=0;j<n;j++) { // reset convergence counter if exemplars have changed
+                if (exemplars[j] != old_exemplars[j]) {
+                    conv_count = 0;
+                    break;
+                }
+            }
+        }
+        else conv_count = 0;
+
+        if (conv_count == convergence) conv_reached = 1; // check convergence
+
+        currit++; // increment iteration number
+    } // start a new iteration. If convergence or max_iterations reached
+
+    for (int i=0;i<n;i++) { // assign elements to the edge with the largest r+a
+        maxsim = -FLT_MAX;
+        clusters[i] = i;
+        for (e=indptr[i];e<indptr[i+1];e++) {
+            tmp = r[e]+a[e];
+            if (tmp >= maxsim) {
+                clusters[i] = indices[e];
+                maxsim = tmp;
+            }
+        }
+    }
+
+    //Free memory anyway
+    free(r);
+    free(a);
+    free(colsum);
+    free(exemplars);
+    free(old_exemplars);
+
+    return conv_reached == 1 ? currit : -currit;
+}
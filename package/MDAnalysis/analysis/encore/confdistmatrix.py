@@ -35,7 +35,10 @@ class to compute an RMSD matrix in such a way is also available.
 
 """
 
-from joblib import Parallel, delayed
+from six import string_types
+import ctypes
+import multiprocessing
+from multiprocessing.sharedctypes import RawArray
 import numpy as np
 from getpass import getuser
 from socket import gethostname
@@ -47,14 +50,20 @@ from ...core.universe import Universe
 
 from ..align import rotation_matrix
 
+from ...lib.log import ProgressMeter
+
 from .cutils import PureRMSD
 from .utils import TriangularMatrix, trm_indices
 
+# state of the pool workers, set by _init_matrix_worker
+_worker_state = {}
+
 
 def conformational_distance_matrix(ensemble,
                                    conf_dist_function, selection="",
                                    superimposition_selection="", n_jobs=1, pairwise_align=True,
-                                   mass_weighted=True, metadata=True, verbose=False):
+                                   mass_weighted=True, metadata=True, verbose=False,
+                                   dtype=np.float64, filename=None):
     """
     Run the conformational distance matrix calculation.
     args and kwargs are passed to conf_dist_function.
@@ -79,12 +88,28 @@ def conformational_distance_matrix(ensemble,
     n_jobs : int
         Number of cores to be used for parallel calculation
         Default is 1. -1 uses all available cores
+    verbose : bool
+        Report the progress of the calculation. Default is False.
+    dtype : numpy.dtype
+        Data type of the matrix elements. Default is numpy.float64;
+        numpy.float32 halves the memory used.
+    filename : str or None
+        Write the matrix elements to a memory-mapped ``.npy`` file instead
+        of keeping them in memory (see encore.utils.TriangularMatrix).
+        Default is None.
 
     Returns
     -------
     conf_dist_matrix : encore.utils.TriangularMatrix object
         Conformational distance matrix in triangular representation.
 
+
+    .. versionchanged:: 0.16.0
+       The rows of the matrix are split into blocks of about the same
+       number of elements, which are handed out to a pool of *n_jobs*
+       processes that write directly into a shared buffer. Added *dtype*
+       and *filename*.
+
     """
 
     # framesn: number of frames
@@ -139,30 +164,110 @@ def conformational_distance_matrix(ensemble,
         masses = np.ones((ensemble.trajectory.timeseries(
             ensemble.select_atoms(selection))[0].shape[0])).astype(np.float64)
         if pairwise_align:
-            subset_masses = np.ones((fit_coords[0].shape[0])).astype(np.float64)
+            subset_masses = np.ones((fitting_coordinates[0].shape[0])).astype(np.float64)
         else:
             subset_masses = None
 
-    # Allocate for output matrix
-    matsize = framesn * (framesn + 1) / 2
-    distmat = np.empty(matsize, np.float64)
-
+    if n_jobs == -1:
+        n_jobs = multiprocessing.cpu_count()
+    n_jobs = max(1, min(n_jobs, framesn))
+
+    # Each task fills a block of rows; aim for several blocks per worker
+    # so that the load stays balanced even though the rows grow longer
+    matsize = framesn * (framesn + 1) // 2
+    blocks = _row_blocks(framesn, -(-matsize // (16 * n_jobs)))
+    pm = ProgressMeter(len(blocks), interval=1, verbose=verbose,
+                       format="Computed matrix block {step:5d}/{numsteps} "
+                       "[{percentage:5.1f}%]")
+    args = (conf_dist_function, rmsd_coordinates, masses,
+            fitting_coordinates, subset_masses)
+
+    # The workers rebuild the output array from the shared buffer or reopen
+    # the memory-mapped file, so that they do not fill pickled copies when
+    # the processes are not forked
+    if filename is not None:
+        conf_dist_matrix = TriangularMatrix(framesn, metadata=metadata,
+                                            dtype=dtype, filename=filename)
+        distmat = conf_dist_matrix._elements
+        shared = filename
+    elif n_jobs > 1:
+        # Allocate the output matrix in shared memory, the workers only
+        # return the rows they have completed
+        itemsize = np.dtype(dtype).itemsize
+        shared = RawArray(ctypes.c_char, matsize * itemsize)
+        distmat = np.frombuffer(shared, dtype=dtype)
+        conf_dist_matrix = TriangularMatrix(distmat, metadata=metadata)
+    else:
+        distmat = np.empty(matsize, dtype)
+        conf_dist_matrix = TriangularMatrix(distmat, metadata=metadata)
 
-    # Initialize workers. Simple worker doesn't perform fitting,
-    # fitter worker does.
-    indices = trm_indices((0, 0), (framesn - 1, framesn - 1))
-    Parallel(n_jobs=n_jobs, verbose=verbose)(delayed(conf_dist_function)(
-        element,
-        rmsd_coordinates,
-        distmat,
-        masses,
-        fitting_coordinates,
-        subset_masses,
-        masses) for element in indices)
+    if n_jobs == 1:
+        for step, rows in enumerate(blocks):
+            _set_matrix_rows(rows, distmat, *args)
+            pm.echo(step)
+    else:
+        pool = multiprocessing.Pool(n_jobs, initializer=_init_matrix_worker,
+                                    initargs=(shared, dtype) + args)
+        try:
+            for step, rows in enumerate(pool.imap_unordered(
+                    _run_matrix_block, blocks)):
+                pm.echo(step)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    if filename is not None:
+        distmat.flush()
+
+    # When the workers have finished, return the TriangularMatrix object
+    return conf_dist_matrix
+
+
+def _row_blocks(n, block_size):
+    """Split the rows of a triangular matrix of size *n* into ranges
+    ``(start, stop)`` of at least *block_size* elements (except the last)"""
+    blocks = []
+    start = 0
+    while start < n:
+        stop = start
+        n_elements = 0
+        while stop < n and n_elements < block_size:
+            stop += 1
+            n_elements += stop
+        blocks.append((start, stop))
+        start = stop
+    return blocks
+
+
+def _set_matrix_rows(rows, distmat, conf_dist_function, coords, masses,
+                     fit_coords, fit_masses):
+    """Fill rows ``rows[0]`` to ``rows[1] - 1`` of the condensed matrix
+    *distmat* with *conf_dist_function*"""
+    start, stop = rows
+    for element in trm_indices((start, 0), (stop - 1, stop - 1)):
+        conf_dist_function(element, coords, distmat, masses,
+                           fit_coords, fit_masses)
+
+
+def _init_matrix_worker(shared, dtype, *args):
+    """Store the output array and the arguments of :func:`_set_matrix_rows`
+    in a pool worker.
+
+    *shared* is either a :class:`multiprocessing.sharedctypes.RawArray`
+    holding the elements of type *dtype*, or the name of the ``.npy`` file
+    to which they are memory-mapped.
+    """
+    if isinstance(shared, string_types):
+        _worker_state['distmat'] = np.load(shared, mmap_mode='r+')
+    else:
+        _worker_state['distmat'] = np.frombuffer(shared, dtype=dtype)
+    _worker_state['args'] = args
 
 
-    # When the workers have finished, return a TriangularMatrix object
-    return TriangularMatrix(distmat, metadata=metadata)
+def _run_matrix_block(rows):
+    """Fill the block of rows *rows* in a pool worker"""
+    _set_matrix_rows(rows, _worker_state['distmat'], *_worker_state['args'])
+    return rows
 
 
 def set_rmsd_matrix_elements(tasks, coords, rmsdmat, masses, fit_coords=None,
@@ -195,8 +300,9 @@ def set_rmsd_matrix_elements(tasks, coords, rmsdmat, masses, fit_coords=None,
         Array of atomic masses, having the same order as the
         coordinates array
 
-    rmsdmat : encore.utils.TriangularMatrix
-        Memory-shared triangular matrix object
+    rmsdmat : numpy.array
+        Elements of the triangular matrix in row-major order, possibly in
+        memory shared between processes
 
     fit_coords : numpy.array or None
         Array of the coordinates used for fitting
@@ -209,7 +315,7 @@ def set_rmsd_matrix_elements(tasks, coords, rmsdmat, masses, fit_coords=None,
 
     if fit_coords is None and fit_masses is None:
         summasses = np.sum(masses)
-        rmsdmat[(i + 1) * i / 2 + j] = PureRMSD(coords[i].astype(np.float64),
+        rmsdmat[(i + 1) * i // 2 + j] = PureRMSD(coords[i].astype(np.float64),
                                                 coords[j].astype(np.float64),
                                                 coords[j].shape[0],
                                                 masses,
@@ -229,7 +335,7 @@ def set_rmsd_matrix_elements(tasks, coords, rmsdmat, masses, fit_coords=None,
         rotamat = rotation_matrix(subset1_coords, subset2_coords,
                                   subset_weights)[0]
         rotated_i = np.transpose(np.dot(rotamat, np.transpose(translated_i)))
-        rmsdmat[(i + 1) * i / 2 + j] = PureRMSD(
+        rmsdmat[(i + 1) * i // 2 + j] = PureRMSD(
             rotated_i.astype(np.float64), translated_j.astype(np.float64),
             coords[j].shape[0], masses, summasses)
     else:
@@ -246,6 +352,7 @@ def get_distance_matrix(ensemble,
                         mass_weighted=True,
                         n_jobs=1,
                         verbose=False,
+                        dtype=np.float64,
                         *conf_dist_args,
                         **conf_dist_kwargs):
     """
@@ -271,10 +378,13 @@ def get_distance_matrix(ensemble,
         Atom selection string in the MDAnalysis format. Default is "name CA"
     load_matrix : str, optional
         Load similarity/dissimilarity matrix from numpy binary file instead
-        of calculating it (default is None). A filename is required.
+        of calculating it (default is None). A filename is required. A
+        ``.npy`` file is memory-mapped instead of being read.
     save_matrix : bool, optional
         Save calculated matrix as numpy binary file (default is None). A
-        filename is required.
+        filename is required. The elements of a ``.npy`` file are written
+        directly to the memory-mapped file during the calculation (without
+        metadata).
     superimpose : bool, optional
         Whether to superimpose structures before calculating distance
         (default is True).
@@ -288,12 +398,19 @@ def get_distance_matrix(ensemble,
         Maximum number of cores to be used (default is 1). If -1 use all cores.
     verbose : bool, optional
         print progress
+    dtype : numpy.dtype, optional
+        Data type of the calculated matrix elements (default is
+        numpy.float64).
 
     Returns
     -------
 
     confdistmatrix : encore.utils.TriangularMatrix
         Conformational distance matrix. .
+
+
+    .. versionchanged:: 0.16.0
+       Added *dtype*; ``.npy`` files are memory-mapped.
     """
 
     # Load the matrix if required
@@ -307,9 +424,10 @@ def get_distance_matrix(ensemble,
                     format='fac').shape[0],
                 loadfile=load_matrix)
         logging.info("        Done!")
-        for key in confdistmatrix.metadata.dtype.names:
-            logging.info("        {0} : {1}".format(
-                key, str(confdistmatrix.metadata[key][0])))
+        if confdistmatrix.metadata is not None:
+            for key in confdistmatrix.metadata.dtype.names:
+                logging.info("        {0} : {1}".format(
+                    key, str(confdistmatrix.metadata[key][0])))
 
         # Check matrix size for consistency
         if not confdistmatrix.size == \
@@ -334,6 +452,11 @@ def get_distance_matrix(ensemble,
                     .format(superimposition_subset))
         logging.info("    Calculating similarity matrix . . .")
 
+        if save_matrix and save_matrix.endswith('.npy'):
+            matrix_file = save_matrix
+        else:
+            matrix_file = None
+
         # Use superimposition subset, if necessary. If the pairwise alignment
         # is not required, it will not be performed anyway.
         confdistmatrix = conformational_distance_matrix(ensemble,
@@ -342,11 +465,13 @@ def get_distance_matrix(ensemble,
                                                         pairwise_align=superimpose,
                                                         mass_weighted=mass_weighted,
                                                         n_jobs=n_jobs,
-                                                        verbose=verbose)
+                                                        verbose=verbose,
+                                                        dtype=dtype,
+                                                        filename=matrix_file)
 
         logging.info("    Done!")
 
-        if save_matrix:
+        if save_matrix and matrix_file is None:
             confdistmatrix.savez(save_matrix)
 
     return confdistmatrix
@@ -89,7 +89,9 @@ class StochasticProximityEmbeddingNative(DimensionalityReductionMethod):
                  min_lam = 0.1,
                  max_lam = 2.0,
                  ncycle = 100,
-                 nstep = 10000,):
+                 nstep = 10000,
+                 n_threads = 1,
+                 n_neighbors = None,):
         """
         Parameters
         ----------
@@ -111,6 +113,23 @@ class StochasticProximityEmbeddingNative(DimensionalityReductionMethod):
         nstep : int, optional
             Number of steps per cycle (default is 10000)
 
+        n_threads : int, optional
+            Number of threads that share the steps of each cycle (default is
+            1). The threads update the coordinates without locking.
+
+        n_neighbors : int or None, optional
+            If given, only the distances between each conformation and its
+            *n_neighbors* nearest neighbors within *distance_cutoff* are
+            used (see :meth:`encore.utils.TriangularMatrix.neighbor_graph`);
+            half of the steps update a conformation and one of its neighbors
+            and the other pairs are only pushed apart up to
+            *distance_cutoff*. The embedding is then calculated without
+            accessing the distance matrix (default is None).
+
+
+        .. versionchanged:: 0.16.0
+           Added *n_threads* and *n_neighbors*.
+
         """
         self.dimension = dimension
         self.distance_cutoff = distance_cutoff
@@ -118,6 +137,8 @@ class StochasticProximityEmbeddingNative(DimensionalityReductionMethod):
         self.max_lam = max_lam
         self.ncycle = ncycle
         self.nstep = nstep
+        self.n_threads = n_threads
+        self.n_neighbors = n_neighbors
         self.stressfreq = -1
 
     def __call__(self, distance_matrix):
@@ -135,6 +156,25 @@ class StochasticProximityEmbeddingNative(DimensionalityReductionMethod):
             coordinates in reduced space
 
         """
+        if self.n_neighbors is not None:
+            distances, indices, indptr = distance_matrix.neighbor_graph(
+                n_neighbors=self.n_neighbors, cutoff=self.distance_cutoff)
+            final_stress, coordinates = \
+                stochasticproxembed.NeighbourStochasticProximityEmbedding().run(
+                distances=distances,
+                indices=indices,
+                indptr=indptr,
+                rco=self.distance_cutoff,
+                dim=self.dimension,
+                minlam = self.min_lam,
+                maxlam = self.max_lam,
+                ncycle = self.ncycle,
+                nstep = self.nstep,
+                stressfreq = self.stressfreq,
+                nthreads = self.n_threads
+            )
+            return coordinates, {"final_stress": final_stress}
+
         final_stress, coordinates = \
             stochasticproxembed.StochasticProximityEmbedding().run(
             s=distance_matrix,
@@ -144,7 +184,8 @@ class StochasticProximityEmbeddingNative(DimensionalityReductionMethod):
             maxlam = self.max_lam,
             ncycle = self.ncycle,
             nstep = self.nstep,
-            stressfreq = self.stressfreq
+            stressfreq = self.stressfreq,
+            nthreads = self.n_threads
         )
         return coordinates, {"final_stress": final_stress}
 
@@ -50,3 +50,5 @@ cdef extern from "spe.h":
     int* nearest_neighbours(double*, int, int)
     int cmp_ivwrapper(void*,void*)
     double CStochasticProximityEmbedding(double*, double*, double, int, int, double, double, int, int, int)
+    double CParallelStochasticProximityEmbedding(double*, double*, double, int, int, double, double, int, int, int, int, unsigned int) nogil
+    double CNeighbourStochasticProximityEmbedding(double*, int*, long*, double*, double, int, int, double, double, int, int, int, int, unsigned int) nogil
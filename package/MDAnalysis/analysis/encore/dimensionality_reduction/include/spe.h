@@ -44,3 +44,37 @@ double CStochasticProximityEmbedding(
         int,
         int,
         int);
+
+double parallel_neighbours_stress(double*, double*, int, int, double, int);
+
+double graph_stress(double*, int*, long*, double*, int, int, int);
+
+double CParallelStochasticProximityEmbedding(
+        double*,
+        double*,
+        double,
+        int,
+        int,
+        double,
+        double,
+        int,
+        int,
+        int,
+        int,
+        unsigned int);
+
+double CNeighbourStochasticProximityEmbedding(
+        double*,
+        int*,
+        long*,
+        double*,
+        double,
+        int,
+        int,
+        double,
+        double,
+        int,
+        int,
+        int,
+        int,
+        unsigned int);
@@ -26,6 +26,12 @@
 #include <time.h>
 #include <sys/types.h>
 #include <time.h>
+#ifdef PARALLEL
+#include <omp.h>
+#define THREAD_NUM omp_get_thread_num()
+#else
+#define THREAD_NUM 0
+#endif
 
 #define EPSILON 1e-8
 
@@ -227,3 +233,194 @@ double CStochasticProximityEmbedding(
     //printf("Calculation finished. - Residual stress: %.3f\n", finalstress);
     return(finalstress);
 }
+
+
+/* Multithreaded variants. The random pair updates of every cycle are shared
+   among the threads, which update the coordinates without locking
+   ("Hogwild"): concurrent updates of the same element are rare and only
+   perturb a step of a stochastic algorithm. Each thread has its own random
+   number generator, and indices into the triangular matrix are long so that
+   large matrices can be used. The coordinates must be initialized by the
+   caller. */
+
+static inline unsigned int xorshift(unsigned long long *state) { // per-thread random number generator
+    *state ^= *state >> 12;
+    *state ^= *state << 25;
+    *state ^= *state >> 27;
+    return (unsigned int)((*state * 2685821657736338717ULL) >> 32);
+}
+
+static inline long trmIndexLong(long row, long col) {  // array index for large triangular matrix
+	return (row) > (col) ? ((row)+1)*(row)/2+(col) : ((col)+1)*(col)/2+(row);
+}
+
+static inline void spe_update(double* d_coords, int a, int b, int dim, double rab, double rco, double lam) {
+    double dab = ed(d_coords, a, b, dim);
+    double t = 0.0, delta = 0.0;
+    int idxa = a * dim;
+    int idxb = b * dim;
+
+    if (rab <= rco || dab < rab) {
+        t = lam * 0.5 * (rab - dab) / (dab + EPSILON);
+        for (int k=0; k<dim; k++) {
+            delta = d_coords[idxa+k] - d_coords[idxb+k];
+            d_coords[idxa+k] += t*delta;
+            d_coords[idxb+k] -= t*delta;
+        }
+    }
+}
+
+double parallel_neighbours_stress(double *s, double *d_coords, int dim, int elemsn, double rco, int nthreads) {
+    double denom = 0.0;
+    double numer = 0.0;
+
+    #pragma omp parallel for num_threads(nthreads) schedule(dynamic, 64) reduction(+:numer,denom)
+    for (int i=0; i<elemsn; i++) {
+        long k = trmIndexLong(i, 0);
+        double dab = 0.0, delta = 0.0;
+        for (int j=0; j<i; j++) {
+            dab = ed(d_coords, i, j, dim);
+            if (s[k+j] <= rco || dab < s[k+j]) {
+                denom += s[k+j];
+                delta = dab - s[k+j];
+                numer += delta*delta / s[k+j];
+            }
+        }
+    }
+    return( numer/denom );
+}
+
+double graph_stress(double *values, int *indices, long *indptr, double *d_coords, int dim, int elemsn, int nthreads) {
+    double denom = 0.0;
+    double numer = 0.0;
+
+    #pragma omp parallel for num_threads(nthreads) schedule(dynamic, 64) reduction(+:numer,denom)
+    for (int i=0; i<elemsn; i++) {
+        double dab = 0.0, delta = 0.0;
+        for (long e=indptr[i]; e<indptr[i+1]; e++) {
+            if (indices[e] < i && values[e] > 0.0) {
+                dab = ed(d_coords, i, indices[e], dim);
+                denom += values[e];
+                delta = dab - values[e];
+                numer += delta*delta / values[e];
+            }
+        }
+    }
+    return( denom > 0.0 ? numer/denom : 0.0 );
+}
+
+double CParallelStochasticProximityEmbedding(
+        double* s,
+        double* d_coords,
+        double rco,
+        int nelem,
+        int dim,
+        double maxlam,
+        double minlam,
+        int ncycle,
+        int nstep,
+        int stressfreq,
+        int nthreads,
+        unsigned int seed) {
+
+    double lam = maxlam;
+    unsigned long long *states = (unsigned long long *) malloc(nthreads * sizeof(unsigned long long));
+
+    for (int t=0; t<nthreads; t++) {
+        states[t] = 0x9E3779B97F4A7C15ULL * (seed + 1ULL) + 0xBF58476D1CE4E5B9ULL * (t + 1ULL);
+    }
+
+    /* start self organization */
+    for (int i=0; i<ncycle; i++) {
+        #pragma omp parallel num_threads(nthreads)
+        {
+            // a private copy of the state avoids false sharing of states[]
+            unsigned long long state = states[THREAD_NUM];
+            #pragma omp for schedule(static)
+            for (int j=0; j<nstep; j++) {
+                int a = xorshift(&state) % nelem;
+                int b = xorshift(&state) % (nelem - 1);
+                if (b >= a) b++;
+                spe_update(d_coords, a, b, dim, s[trmIndexLong(a, b)], rco, lam);
+            }
+            states[THREAD_NUM] = state;
+        }
+        lam = lam - (maxlam - minlam) / (double)(ncycle - 1);
+        if (i % stressfreq == 0 && i != 0 && stressfreq > 0)
+	  printf("Cycle %d - Residual stress: %.3f, lambda %.3f\n", i, parallel_neighbours_stress(s, d_coords, dim, nelem, rco, nthreads),lam);
+    }
+    free(states);
+    return(parallel_neighbours_stress(s, d_coords, dim, nelem, rco, nthreads));
+}
+
+double CNeighbourStochasticProximityEmbedding(
+        double* values,
+        int* indices,
+        long* indptr,
+        double* d_coords,
+        double rco,
+        int nelem,
+        int dim,
+        double maxlam,
+        double minlam,
+        int ncycle,
+        int nstep,
+        int stressfreq,
+        int nthreads,
+        unsigned int seed) {
+
+    /* values, indices, indptr: graph of the neighbours of each element in
+       CSR format, with the columns of each row in increasing order. It must
+       contain all the pairs within rco; pairs that are not in the graph are
+       treated as distant pairs at rco, which are only pushed apart. Half of
+       the pairs are an element and one of its neighbours, the others are
+       random pairs. */
+
+    double lam = maxlam;
+    unsigned long long *states = (unsigned long long *) malloc(nthreads * sizeof(unsigned long long));
+
+    for (int t=0; t<nthreads; t++) {
+        states[t] = 0x9E3779B97F4A7C15ULL * (seed + 1ULL) + 0xBF58476D1CE4E5B9ULL * (t + 1ULL);
+    }
+
+    for (int i=0; i<ncycle; i++) {
+        #pragma omp parallel num_threads(nthreads)
+        {
+            // a private copy of the state avoids false sharing of states[]
+            unsigned long long state = states[THREAD_NUM];
+            #pragma omp for schedule(static)
+            for (int j=0; j<nstep; j++) {
+                int a = xorshift(&state) % nelem;
+                int b = a;
+                long lo = indptr[a], hi = indptr[a+1], mid = 0;
+                double rab = rco;
+                if (xorshift(&state) & 1U && hi > lo) { // a neighbour
+                    mid = lo + xorshift(&state) % (hi - lo);
+                    b = indices[mid];
+                    rab = values[mid];
+                }
+                else { // any other element, looked up among the neighbours
+                    b = xorshift(&state) % (nelem - 1);
+                    if (b >= a) b++;
+                    while (lo < hi) {
+                        mid = lo + (hi - lo) / 2;
+                        if (indices[mid] < b) lo = mid + 1;
+                        else hi = mid;
+                    }
+                    if (lo < indptr[a+1] && indices[lo] == b)
+                        rab = values[lo];
+                    else if (rab <= rco)
+                        rab = rco + EPSILON;
+                }
+                if (b != a)
+                    spe_update(d_coords, a, b, dim, rab, rco, lam);
+            }
+            states[THREAD_NUM] = state;
+        }
+        lam = lam - (maxlam - minlam) / (double)(ncycle - 1);
+        if (i % stressfreq == 0 && i != 0 && stressfreq > 0)
+	  printf("Cycle %d - Residual stress: %.3f, lambda %.3f\n", i, graph_stress(values, indices, indptr, d_coords, dim, nelem, nthreads),lam);
+    }
+    free(states);
+    return(graph_stress(values, indices, indptr, d_coords, dim, nelem, nthreads));
+}
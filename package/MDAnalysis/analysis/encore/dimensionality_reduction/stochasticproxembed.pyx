@@ -50,7 +50,7 @@ cdef class StochasticProximityEmbedding:
     """
 
 
-    def run(self, s, double rco, int dim, double maxlam, double minlam, int ncycle, int nstep, int stressfreq):
+    def run(self, s, double rco, int dim, double maxlam, double minlam, int ncycle, int nstep, int stressfreq, int nthreads=1):
         """
         Run stochastic proximity embedding.
 
@@ -92,6 +92,14 @@ cdef class StochasticProximityEmbedding:
 	    stressfreq : int
 	    	calculate and report stress value every stressfreq cycle
 
+	    nthreads : int
+	    	number of threads sharing the coordinate updates of each cycle
+	    	(see CParallelStochasticProximityEmbedding in spe.c). The
+	    	parallel variant starts from coordinates drawn with numpy.random.
+
+
+	    .. versionchanged:: 0.16.0
+	       Added *nthreads*.
 
 	    """
 
@@ -103,7 +111,113 @@ cdef class StochasticProximityEmbedding:
         cdef numpy.ndarray[numpy.float64_t,  ndim=1] matndarray = numpy.ascontiguousarray(s._elements, dtype=numpy.float64)
         cdef numpy.ndarray[numpy.float64_t,   ndim=1] d_coords   = numpy.zeros((nelem*dim),dtype=numpy.float64)
 
-        finalstress = cstochasticproxembed.CStochasticProximityEmbedding( <double*>matndarray.data, <double*>d_coords.data, rco, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq)
+        cdef unsigned int seed = 0
+
+        if nthreads < 1:
+            raise ValueError("nthreads must be at least 1")
+        if nthreads == 1:
+            finalstress = cstochasticproxembed.CStochasticProximityEmbedding( <double*>matndarray.data, <double*>d_coords.data, rco, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq)
+        else:
+            if nelem < 2:
+                raise ValueError("At least two elements are required")
+            seed = numpy.random.randint(2**31)
+            d_coords[:] = numpy.random.random_sample(nelem*dim)
+            with nogil:
+                finalstress = cstochasticproxembed.CParallelStochasticProximityEmbedding( <double*>matndarray.data, <double*>d_coords.data, rco, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq, nthreads, seed)
+
+        logging.info("Stochastic Proximity Embedding finished. Residual stress: %.3f" % finalstress)
+
+        return (finalstress, d_coords.reshape((-1,dim)).T)
+
+    def __call__(self, *args):
+        return self.run(*args)
+
+
+cdef class NeighbourStochasticProximityEmbedding:
+    """
+    Stochastic proximity embedding on a sparse graph of the neighbours of
+    each element, which never accesses the full distance matrix: half of the
+    random pairs are an element and one of its neighbours, for the others
+    only the neighbours are searched (see
+    CNeighbourStochasticProximityEmbedding in spe.c). The pair updates of
+    each cycle are shared among threads.
+
+    .. versionadded:: 0.16.0
+    """
+
+    def run(self, distances, indices, indptr, double rco, int dim, double maxlam, double minlam, int ncycle, int nstep, int stressfreq, int nthreads=1):
+        """
+        Run stochastic proximity embedding.
+
+	    Parameters:
+	    ----------
+
+	    distances : numpy.array of floats
+	    	Distances of the edges of the graph, in compressed sparse row
+	    	format (see encore.utils.TriangularMatrix.neighbor_graph). The
+	    	graph must contain all the pairs within rco; the other pairs
+	    	are only pushed apart up to rco.
+
+	    indices : numpy.array of int
+	    	Column of each edge; the columns of the edges of row i are
+	    	indices[indptr[i]:indptr[i+1]], in increasing order
+
+	    indptr : numpy.array of int
+	    	Index of the first edge of each row, followed by the total number
+	    	of edges
+
+	    rco : float
+	    	neighborhood distance cut-off
+
+	    dim : int
+	    	number of dimensions for the embedded space
+
+	    minlam  : float
+	    	final learning parameter
+
+	    maxlam  : float
+	    	starting learning parameter
+
+	    ncycle : int
+	    	number of cycles. Each cycle is composed of nstep steps. At the end
+	    	of each cycle, the lerning parameter lambda is updated.
+
+	    nstep : int
+		    number of coordinate update steps for each cycle
+
+	    stressfreq : int
+	    	calculate and report stress value every stressfreq cycle
+
+	    nthreads : int
+	    	number of threads sharing the coordinate updates of each cycle
+
+	    Returns
+	    -------
+
+	    space : (float, numpy.array)
+	    	float is the final stress obtained on the edges of the graph; the
+	    	array are the coordinates of the elements in the embedded space
+
+	    """
+
+        cdef int nelem = len(indptr) - 1
+        cdef double finalstress = 0.0
+        cdef unsigned int seed = numpy.random.randint(2**31)
+
+        if nelem < 2:
+            raise ValueError("At least two elements are required")
+        if nthreads < 1:
+            raise ValueError("nthreads must be at least 1")
+
+        logging.info("Starting Stochastic Proximity Embedding on {0:d} neighbours".format(len(indices)))
+
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] valndarray = numpy.ascontiguousarray(distances, dtype=numpy.float64)
+        cdef numpy.ndarray[int, ndim=1] indndarray = numpy.ascontiguousarray(indices, dtype=numpy.intc)
+        cdef numpy.ndarray[long, ndim=1] ptrndarray = numpy.ascontiguousarray(indptr, dtype=long)
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] d_coords = numpy.random.random_sample(nelem*dim)
+
+        with nogil:
+            finalstress = cstochasticproxembed.CNeighbourStochasticProximityEmbedding( <double*>valndarray.data, <int*>indndarray.data, <long*>ptrndarray.data, <double*>d_coords.data, rco, nelem, dim, maxlam, minlam, ncycle, nstep, stressfreq, nthreads, seed)
 
         logging.info("Stochastic Proximity Embedding finished. Residual stress: %.3f" % finalstress)
 
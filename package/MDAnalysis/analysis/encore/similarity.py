@@ -1103,6 +1103,18 @@ def ces(ensembles,
         eps=0.5:  [[ 0.          0.25331629]
         [ 0.25331629  0.        ]]"
 
+    Large ensembles can be clustered on a sparse graph of nearest
+    neighbors, using a single precision distance matrix that is
+    memory-mapped from a ``.npy`` file: ::
+
+        >>> CES, details = encore.ces([ens1,ens2],
+                                      clustering_method=encore.SparseAffinityPropagationNative(
+                                          preference=-2.0, n_neighbors=30),
+                                      distance_matrix=encore.get_distance_matrix(
+                                          encore.merge_universes([ens1, ens2]),
+                                          save_matrix="rmsd.npy",
+                                          dtype=np.float32))
+
     """
 
     for ensemble in ensembles:
@@ -21,13 +21,19 @@
 #
 from six.moves import range
 from multiprocessing.sharedctypes import SynchronizedArray
-from multiprocessing import Process, Manager
+import multiprocessing
 from joblib import cpu_count
 import numpy as np
+import os
 import sys
 
 import MDAnalysis as mda
 from ...coordinates.memory import MemoryReader
+from ...lib.log import ProgressMeter
+
+# state of the pool workers, set by the pool initializers; with the fork
+# start method it is inherited rather than pickled
+_worker_state = {}
 
 
 class TriangularMatrix(object):
@@ -38,9 +44,23 @@ class TriangularMatrix(object):
     facilities to conveniently load/write a matrix from/to file. It can be
     accessed using the [] and () operators, similarly to a normal numpy array.
 
+    The elements can also be kept in a :class:`numpy.memmap` on disk (see
+    the *filename* argument), for instance in single precision, so that
+    matrices of very large ensembles do not have to fit in memory. Such a
+    matrix is stored as a plain ``.npy`` file, which is opened again
+    without reading it (see :meth:`load`). :meth:`iter_rows` iterates over
+    blocks of full rows for consumers that cannot use the triangular
+    representation directly.
+
+
+    .. versionchanged:: 0.16.0
+       Added *dtype* and *filename* to keep the elements in a memory-mapped
+       file; added :meth:`save`, :meth:`load`, :meth:`rows`,
+       :meth:`iter_rows` and :meth:`neighbor_graph`.
     """
 
-    def __init__(self, size, metadata=None, loadfile=None):
+    def __init__(self, size, metadata=None, loadfile=None, dtype=np.float64,
+                 filename=None):
         """Class constructor.
 
         Parameters
@@ -56,7 +76,16 @@ class TriangularMatrix(object):
         loadfile : str or None
             Load the matrix from this file. All the attributes and data will
             be determined by the matrix file itself (i.e. metadata will be
-            ignored); size has to be provided though.
+            ignored); size has to be provided though. ``.npy`` files are
+            memory-mapped (see :meth:`load`), other files are read with
+            :meth:`loadz`.
+        dtype : numpy.dtype
+            Data type of the elements of a new matrix (default is
+            ``numpy.float64``); ``numpy.float32`` halves the memory used.
+        filename : str or None
+            Keep the elements of a new matrix of *size* rows in a
+            :class:`numpy.memmap` backed by this ``.npy`` file instead of
+            in memory.
 
         """
         if isinstance(metadata, dict):
@@ -66,10 +95,18 @@ class TriangularMatrix(object):
 
         self.size = size
         if loadfile:
-            self.loadz(loadfile)
+            if loadfile.endswith('.npy'):
+                self.load(loadfile)
+            else:
+                self.loadz(loadfile)
         elif isinstance(size, int):
             self.size = size
-            self._elements = np.zeros((size + 1) * size / 2, dtype=np.float64)
+            n_elements = (size + 1) * size // 2
+            if filename is not None:
+                self._elements = np.lib.format.open_memmap(
+                    filename, mode='w+', dtype=dtype, shape=(n_elements,))
+            else:
+                self._elements = np.zeros(n_elements, dtype=dtype)
         elif isinstance(size, SynchronizedArray):
             self._elements = np.array(size.get_obj(), dtype=np.float64)
             self.size = int((np.sqrt(1 + 8 * len(size)) - 1) / 2)
@@ -83,20 +120,183 @@ class TriangularMatrix(object):
         x, y = args
         if x < y:
             x, y = y, x
-        return self._elements[x * (x + 1) / 2 + y]
+        return self._elements[x * (x + 1) // 2 + y]
 
     def __setitem__(self, args, val):
         x, y = args
         if x < y:
             x, y = y, x
-        self._elements[x * (x + 1) / 2 + y] = val
+        self._elements[x * (x + 1) // 2 + y] = val
 
     def as_array(self):
         """Return standard numpy array equivalent"""
-        a = np.zeros((self.size, self.size))
-        a[np.tril_indices(self.size)] = self._elements
-        a[np.triu_indices(self.size)] = a.T[np.triu_indices(self.size)]
-        return a
+        return self.rows(0, self.size)
+
+    def rows(self, start, stop):
+        """Return full rows of the square matrix.
+
+        Only the elements of the rows are read, so that a block of rows of
+        a memory-mapped matrix can be used without loading the rest of it.
+
+        Parameters
+        ----------
+
+        start : int
+            First row.
+        stop : int
+            Row after the last one.
+
+        Returns
+        -------
+
+        rows : numpy.array
+            ``(stop - start, size)`` array with rows *start* to *stop* - 1
+        """
+        stop = min(stop, self.size)
+        block = np.empty((max(stop - start, 0), self.size),
+                         dtype=self._elements.dtype)
+        # row j holds the elements (j, 0..j); elements (i, j) of the block
+        # with j > i are the contiguous stretch (j, start..) of row j
+        for j in range(start, stop):
+            offset = j * (j + 1) // 2
+            block[j - start, :j + 1] = self._elements[offset:offset + j + 1]
+            block[:j - start, j] = self._elements[offset + start:offset + j]
+        if stop < self.size:
+            j = np.arange(stop, self.size, dtype=np.int64)
+            index = (j * (j + 1) // 2)[:, np.newaxis] + np.arange(start, stop)
+            block[:, stop:] = self._elements[index].T
+        return block
+
+    def iter_rows(self, block_size=1024):
+        """Iterate over blocks of full rows of the square matrix.
+
+        Parameters
+        ----------
+
+        block_size : int
+            Number of rows in each block (default is 1024).
+
+        Yields
+        ------
+
+        (start, rows) : tuple (int, numpy.array)
+            index of the first row and the rows, see :meth:`rows`
+        """
+        for start in range(0, self.size, block_size):
+            yield start, self.rows(start, start + block_size)
+
+    def neighbor_graph(self, n_neighbors=None, cutoff=None, block_size=None):
+        """Sparse graph of the smallest elements of each row, e.g. the
+        nearest neighbors in a distance matrix.
+
+        Every element is connected to its *n_neighbors* nearest neighbors
+        and/or to all elements within *cutoff*; the graph is made symmetric
+        and contains the diagonal. The matrix is read in blocks of rows (see
+        :meth:`iter_rows`), so that the full square matrix is never in
+        memory.
+
+        Parameters
+        ----------
+
+        n_neighbors : int or None
+            Number of neighbors of each element (besides itself).
+        cutoff : float or None
+            Only keep elements up to this value. If both *n_neighbors* and
+            *cutoff* are given, the neighbors farther than *cutoff* are
+            dropped.
+        block_size : int or None
+            Number of rows read at once; by default about :math:`2^{24}`
+            elements are read at once.
+
+        Returns
+        -------
+
+        (values, indices, indptr) : tuple of numpy.array
+            graph in compressed sparse row format: the columns of the edges
+            of row i are ``indices[indptr[i]:indptr[i+1]]`` (in increasing
+            order) and the matrix elements are the corresponding
+            ``values``
+        """
+        if n_neighbors is None and cutoff is None:
+            raise ValueError("n_neighbors or cutoff must be given")
+        if block_size is None:
+            block_size = max(1, 2**24 // max(self.size, 1))
+        if n_neighbors is not None:
+            n_neighbors = min(n_neighbors, self.size - 1)
+
+        index = np.arange(self.size, dtype=np.int64)
+        row_list = [index]
+        col_list = [index]
+        for start, rows in self.iter_rows(block_size):
+            block_index = index[start:start + len(rows)]
+            if n_neighbors is None:
+                selected = np.ones(rows.shape, dtype=bool)
+            else:
+                selected = np.zeros(rows.shape, dtype=bool)
+                if n_neighbors > 0:
+                    rows[block_index - start, block_index] = np.inf
+                    nearest = np.argpartition(rows, n_neighbors - 1,
+                                              axis=1)[:, :n_neighbors]
+                    selected[np.arange(len(rows))[:, np.newaxis],
+                             nearest] = True
+            if cutoff is not None:
+                selected &= rows <= cutoff
+            i, j = np.nonzero(selected)
+            row_list.extend((i + start, j))
+            col_list.extend((j, i + start))
+
+        # symmetrize and sort the edges by row and column
+        keys = np.unique(np.concatenate(row_list) * self.size +
+                         np.concatenate(col_list))
+        edge_rows = keys // self.size
+        indices = keys % self.size
+        low = np.minimum(edge_rows, indices)
+        high = np.maximum(edge_rows, indices)
+        values = np.asarray(self._elements[high * (high + 1) // 2 + low])
+        indptr = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(edge_rows, minlength=self.size), out=indptr[1:])
+        return values, indices.astype(np.int32), indptr
+
+    def save(self, fname):
+        """Save the elements in the numpy ``.npy`` format, which can be
+        memory-mapped by :meth:`load`. Metadata are not saved.
+
+        Parameters
+        ----------
+
+        fname : str
+            Name of the file to be saved.
+        """
+        if (isinstance(self._elements, np.memmap) and
+                self._elements.filename is not None and
+                os.path.abspath(fname) == self._elements.filename):
+            if self._elements.mode in ('r+', 'w+'):
+                self._elements.flush()
+                return
+            # the file cannot be rewritten while it is mapped
+            self._elements = np.array(self._elements)
+        np.save(fname, self._elements)
+
+    def load(self, fname, mmap_mode='c'):
+        """Memory-map the elements of a matrix saved in the numpy ``.npy``
+        format, e.g. by :meth:`save`. The elements are not read, so that
+        opening the matrix takes the same time for any size.
+
+        Parameters
+        ----------
+
+        fname : str
+            Name of the file to be loaded.
+        mmap_mode : {'c', 'r', 'r+'}
+            Mode of the :class:`numpy.memmap` (default is 'c'): changes of
+            the elements are only kept in memory with 'c' (copy-on-write),
+            are not allowed with 'r' and are written to the file with 'r+'.
+        """
+        elements = np.load(fname, mmap_mode=mmap_mode)
+        if elements.ndim != 1 or \
+                self.size * (self.size + 1) // 2 != len(elements):
+            raise TypeError
+        self._elements = elements
 
     def savez(self, fname):
         """Save matrix in the npz compressed numpy format. Save metadata and
@@ -126,7 +326,7 @@ class TriangularMatrix(object):
                 raise TypeError
             self.metadata = loaded['metadata']
         else:
-            if self.size*(self.size-1)/2+self.size != len(loaded['elements']):
+            if self.size*(self.size-1)//2+self.size != len(loaded['elements']):
                 raise TypeError
         self._elements = loaded['elements']
 
@@ -139,9 +339,7 @@ class TriangularMatrix(object):
         scalar : float
             Scalar to be added.
         """
-        newMatrix = self.__class__(self.size)
-        newMatrix._elements = self._elements + scalar;
-        return newMatrix
+        return self.__class__(np.asarray(self._elements + scalar))
 
     def __iadd__(self, scalar):
         """Add scalar to matrix elements.
@@ -165,9 +363,7 @@ class TriangularMatrix(object):
         scalar : float
             Scalar to multiply with.
         """
-        newMatrix = self.__class__(self.size)
-        newMatrix._elements = self._elements * scalar;
-        return newMatrix
+        return self.__class__(np.asarray(self._elements * scalar))
 
     def __imul__(self, scalar):
         """Multiply with scalar.
@@ -210,9 +406,18 @@ class ParallelCalculation(object):
     nruns : int
         Number of runs to be performed. Must be equal to len(args) and
         len(kwargs).
+    verbose : bool
+        Report the progress of the runs with a
+        :class:`~MDAnalysis.lib.log.ProgressMeter`.
+
+
+    .. versionchanged:: 0.16.0
+       Runs are distributed by a :class:`multiprocessing.Pool` instead of
+       worker processes that share a manager queue; added *verbose*.
     """
 
-    def __init__(self, n_jobs, function, args=None, kwargs=None):
+    def __init__(self, n_jobs, function, args=None, kwargs=None,
+                 verbose=False):
         """
         Parameters
         ----------
@@ -227,6 +432,8 @@ class ParallelCalculation(object):
         kwargs : list of dicts or None
             kwargs for function; see the ParallelCalculation
             class description.
+        verbose : bool, optional
+            Report the progress of the runs (default is False).
         """
 
         # args[i] should be a list of args, one for each run
@@ -234,17 +441,17 @@ class ParallelCalculation(object):
         if self.n_jobs == -1:
             self.n_jobs = cpu_count()
 
-        self.functions = function
-        if not hasattr(self.functions, '__iter__'):
-            self.functions = [self.functions]*len(args)
-        if len(self.functions) != len(args):
-            self.functions = self.functions[:]*(len(args)/len(self.functions))
-
         # Arguments should be present
         if args is None:
             args = []
         self.args = args
 
+        self.functions = function
+        if not hasattr(self.functions, '__iter__'):
+            self.functions = [self.functions]*len(args)
+        if len(self.functions) != len(args):
+            self.functions = self.functions[:]*(len(args)//len(self.functions))
+
         # If kwargs are not present, use empty dicts
         if kwargs:
             self.kwargs = kwargs
@@ -252,34 +459,37 @@ class ParallelCalculation(object):
             self.kwargs = [{} for i in self.args]
 
         self.nruns = len(args)
+        self.verbose = verbose
 
-    def worker(self, q, results):
+    def worker(self, i):
         """
         Generic worker. Will run function with the prescribed args and kwargs.
 
         Parameters
         ----------
 
-        q : multiprocessing.Manager.Queue object
-                work queue, from which the worker fetches arguments and
-                messages
+        i : int
+                index of the run to be performed
 
-        results : multiprocessing.Manager.Queue object
-                results queue, where results are put after each calculation is
-                finished
+        Returns
+        -------
 
-        """
-        while True:
-            i = q.get()
-            if i == 'STOP':
-                return
+        result : tuple (int, object)
+                *i* and the return value of function(\*args[i],
+                \*\*kwargs[i])
 
-            results.put((i, self.functions[i](*self.args[i], **self.kwargs[i])))
+        """
+        return i, self.functions[i](*self.args[i], **self.kwargs[i])
 
     def run(self):
         """
         Run parallel calculation.
 
+        The runs are handed out one at a time to a pool of *n_jobs*
+        processes; only the run indices and the results are sent between
+        the processes, because the workers inherit the functions and their
+        arguments.
+
         Returns
         -------
 
@@ -289,35 +499,39 @@ class ParallelCalculation(object):
                 corresponding calculation. For instance, in (3, output), output
                 is the return of function(\*args[3], \*\*kwargs[3]).
         """
+        pm = ProgressMeter(max(self.nruns, 1), interval=1,
+                           verbose=self.verbose,
+                           format="Completed run {step:5d}/{numsteps} "
+                           "[{percentage:5.1f}%]")
         results_list = []
-        if self.n_jobs == 1:
+        n_jobs = min(self.n_jobs, self.nruns)
+        if n_jobs <= 1:
             for i in range(self.nruns):
-                results_list.append((i, self.functions[i](*self.args[i],
-                                                          **self.kwargs[i])))
+                results_list.append(self.worker(i))
+                pm.echo(i)
         else:
-            manager = Manager()
-            q = manager.Queue()
-            results = manager.Queue()
+            pool = multiprocessing.Pool(n_jobs, initializer=_init_worker,
+                                        initargs=(self,))
+            try:
+                for step, result in enumerate(
+                        pool.imap_unordered(_run_worker, range(self.nruns))):
+                    results_list.append(result)
+                    pm.echo(step)
+            finally:
+                pool.terminate()
+                pool.join()
 
-            workers = [Process(target=self.worker, args=(q, results)) for i in
-                       range(self.n_jobs)]
-
-            for i in range(self.nruns):
-                q.put(i)
-            for w in workers:
-                q.put('STOP')
+        return tuple(sorted(results_list, key=lambda x: x[0]))
 
-            for w in workers:
-                w.start()
 
-            for w in workers:
-                w.join()
+def _init_worker(calculation):
+    """Store the :class:`ParallelCalculation` in a pool worker"""
+    _worker_state['calculation'] = calculation
 
-            results.put('STOP')
-            for i in iter(results.get, 'STOP'):
-                results_list.append(i)
 
-        return tuple(sorted(results_list, key=lambda x: x[0]))
+def _run_worker(i):
+    """Perform run *i* of the :class:`ParallelCalculation` of the worker"""
+    return _worker_state['calculation'].worker(i)
 
 
 def trm_indices(a, b):
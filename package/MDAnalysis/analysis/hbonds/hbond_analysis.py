@@ -58,7 +58,10 @@ The results are
     that is bonded to the heavy atom donor,
   - the **angle** donor-hydrogen-acceptor angle (180º is linear).
 
-Hydrogen bond data are returned per frame, which is stored in
+All hydrogen bonds are stored compactly in the structured array
+:attr:`HydrogenBondAnalysis.hbonds` (one row per hydrogen bond with the
+frame, the 0-based atom indices, the distance and the angle). From it, the
+hydrogen bond data per frame with atom labels are generated as
 :attr:`HydrogenBondAnalysis.timeseries` (In the following description, ``#``
 indicates comments that are not part of the output.)::
 
@@ -258,6 +261,15 @@ Classes
       :attr:`~HydrogenBondAnalysis.timeseries` to find the specific time point
       of a hydrogen bond existence, or see :attr:`~HydrogenBondAnalysis.table`.
 
+   .. attribute:: hbonds
+
+      Results of the hydrogen bond analysis as a structured
+      :class:`numpy.ndarray` with one row per hydrogen bond and the fields
+      "frame", "donor_heavy_index", "donor_index" (the hydrogen),
+      "acceptor_index", "distance" and "angle". All indices are 0-based.
+
+      .. versionadded:: 0.16.0
+
    .. attribute:: timeseries
 
       Results of the hydrogen bond analysis, stored for each frame. In
@@ -343,8 +355,7 @@ Classes
         for version 0.16.0
 
 """
-import six
-from six.moves import range, zip, map, cPickle
+from six.moves import range, zip, cPickle
 
 from collections import defaultdict
 import numpy as np
@@ -352,10 +363,12 @@ import warnings
 import logging
 
 from MDAnalysis import MissingDataWarning, NoDataError, SelectionError, SelectionWarning
-from MDAnalysis.lib.util import parse_residue
 from MDAnalysis.lib.mdamath import norm, angle
+from MDAnalysis.lib.distances import calc_bonds, calc_angles, capped_distance
 from MDAnalysis.lib.log import ProgressMeter, _set_verbose
 from MDAnalysis.lib.NeighborSearch import AtomNeighborSearch
+from .hbond_autocorrel import (hbond_existence, intermittent_autocorrelation,
+                               continuous_autocorrelation)
 
 
 logger = logging.getLogger('MDAnalysis.analysis.hbonds')
@@ -428,7 +441,8 @@ class HydrogenBondAnalysis(object):
                  distance=3.0, angle=120.0,
                  forcefield='CHARMM27', donors=None, acceptors=None,
                  start=None, stop=None, step=None,
-                 debug=None, detect_hydrogens='distance', verbose=None):
+                 debug=None, detect_hydrogens='distance', verbose=None,
+                 pbc=False):
         """Set up calculation of hydrogen bonds between two selections in a universe.
 
         The timeseries is accessible as the attribute :attr:`HydrogenBondAnalysis.timeseries`.
@@ -531,6 +545,9 @@ class HydrogenBondAnalysis(object):
             attoms ("heavy") or between donor hydrogen and acceptor heavy
             atom ("hydrogen"). If using "heavy" then one should set the *distance*
             cutoff to a higher value such as 3.5 Å. ["hydrogen"]
+          *pbc*
+            Apply the minimum image convention to all distances and angles
+            [``False``]
 
         :Raises: :exc:`SelectionError` is raised for each static selection without
                  the required donors and/or acceptors.
@@ -567,6 +584,9 @@ class HydrogenBondAnalysis(object):
            *verbose* keyword argument is now comsistently used to toggle
            progress meters throuthout the library.
 
+        .. versionchanged:: 0.16.0
+           New *pbc* keyword.
+
         .. _`Issue 138`: https://github.com/MDAnalysis/mdanalysis/issues/138
         """
         warnings.warn(
@@ -594,6 +614,7 @@ class HydrogenBondAnalysis(object):
         self.distance = distance
         self.distance_type = distance_type  # note: everything except 'heavy' will give the default behavior
         self.angle = angle
+        self.pbc = pbc
         self.traj_slice = slice(start if isinstance(start, int) else None,  # internal frames are 0 based
                                 stop if isinstance(stop, int) else None,
                                 step)
@@ -612,7 +633,8 @@ class HydrogenBondAnalysis(object):
         elif self.selection1_type not in ('both', 'donor', 'acceptor'):
             raise ValueError('HydrogenBondAnalysis: Invalid selection type {0!s}'.format(self.selection1_type))
 
-        self.timeseries = None  # final result
+        self.hbonds = None  # final result
+        self._timeseries = None  # labelled results, generated on demand
         self.timesteps = None  # time for each frame
 
         self.table = None  # placeholder for output table
@@ -792,6 +814,8 @@ class HydrogenBondAnalysis(object):
                 tmp = self._get_bonded_hydrogens(d)
                 if tmp:
                     self._s1_donors_h[i] = tmp
+            self._s1_donors_ix, self._s1_donors_h_ix = self._donor_hydrogen_indices(
+                self._s1_donors, self._s1_donors_h)
             self.logger_debug("Selection 1 donors: {0}".format(len(self._s1_donors)))
             self.logger_debug("Selection 1 donor hydrogens: {0}".format(len(self._s1_donors_h)))
         if self.selection1_type in ('acceptor', 'both'):
@@ -825,9 +849,29 @@ class HydrogenBondAnalysis(object):
                 tmp = self._get_bonded_hydrogens(d)
                 if tmp:
                     self._s2_donors_h[i] = tmp
+            self._s2_donors_ix, self._s2_donors_h_ix = self._donor_hydrogen_indices(
+                self._s2_donors, self._s2_donors_h)
             self.logger_debug("Selection 2 donors: {0:d}".format(len(self._s2_donors)))
             self.logger_debug("Selection 2 donor hydrogens: {0:d}".format(len(self._s2_donors_h)))
 
+    @staticmethod
+    def _donor_hydrogen_indices(donors, donors_h):
+        """Flat arrays of (donor heavy atom, hydrogen) indices.
+
+        *donors* and *donors_h* are the donor list and the dict of bonded
+        hydrogens as stored for each selection.
+
+        .. versionadded:: 0.16.0
+        """
+        donor_ix = []
+        hydrogen_ix = []
+        for i, hydrogens in donors_h.items():
+            for h in hydrogens:
+                donor_ix.append(donors[i].index)
+                hydrogen_ix.append(h.index)
+        return (np.array(donor_ix, dtype=np.intp),
+                np.array(hydrogen_ix, dtype=np.intp))
+
     def logger_debug(self, *args):
         if self.debug:
             logger.debug(*args)
@@ -868,6 +912,13 @@ class HydrogenBondAnalysis(object):
            one. Previous use of *verbose* now corresponds to the new keyword
            argument *debug*.
 
+        .. versionchanged:: 0.16.0
+           Hydrogen bonds are found with one neighbor search per frame and
+           batched angle calculations, and stored in
+           :attr:`~HydrogenBondAnalysis.hbonds`; the labelled
+           :attr:`~HydrogenBondAnalysis.timeseries` is only generated when
+           it is accessed.
+
         """
         logger.info("HBond analysis: starting")
         logger.debug("HBond analysis: donors    %r", self.donors)
@@ -884,7 +935,7 @@ class HydrogenBondAnalysis(object):
         if not self.debug:
             logger.debug("HBond analysis: For full step-by-step debugging output use debug=True")
 
-        self.timeseries = []
+        self.hbonds = None
         self.timesteps = []
 
         logger.info("checking trajectory...")  # n_frames can take a while!
@@ -919,13 +970,11 @@ class HydrogenBondAnalysis(object):
                     (self.traj_slice.start or 0),
                     (self.traj_slice.stop or self.u.trajectory.n_frames), self.traj_slice.step or 1)
 
+        # rows are appended to a preallocated array that grows as needed
+        hbonds = np.empty(1024, dtype=self._hbond_dtype)
+        n_hbonds = 0
+        hbonds_per_frame = []
         for ts in self.u.trajectory[self.traj_slice]:
-            # all bonds for this timestep
-            frame_results = []
-            # dict of tuples (atomid, atomid) for quick check if
-            # we already have the bond (to avoid duplicates)
-            already_found = {}
-
             frame = ts.frame
             timestep = _get_timestep()
             self.timesteps.append(timestep)
@@ -937,57 +986,141 @@ class HydrogenBondAnalysis(object):
             if self.update_selection2:
                 self._update_selection_2()
 
+            # no minimum image convention without a unit cell
+            box = ts.dimensions if self.pbc and ts.dimensions[:3].all() else None
+            frame_results = []
             if self.selection1_type in ('donor', 'both') and self._s2_acceptors:
                 self.logger_debug("Selection 1 Donors <-> Acceptors")
-                ns_acceptors = AtomNeighborSearch(self._s2_acceptors)
-                for i, donor_h_set in self._s1_donors_h.items():
-                    d = self._s1_donors[i]
-                    for h in donor_h_set:
-                        res = ns_acceptors.search(h, self.distance)
-                        for a in res:
-                            angle = self.calc_angle(d, h, a)
-                            donor_atom = h if self.distance_type != 'heavy' else d
-                            dist = self.calc_eucl_distance(donor_atom, a)
-                            if angle >= self.angle and dist <= self.distance:
-                                self.logger_debug(
-                                    "S1-D: {0!s} <-> S2-A: {1!s} {2:f} A, {3:f} DEG".format(h.index + 1, a.index + 1, dist, angle))
-                                #self.logger_debug("S1-D: %r <-> S2-A: %r %f A, %f DEG" % (h, a, dist, angle))
-                                frame_results.append(
-                                    [h.index + 1, a.index + 1, h.index, a.index,
-                                    '{0!s}{1!s}:{2!s}'.format(h.resname, repr(h.resid), h.name),
-                                    '{0!s}{1!s}:{2!s}'.format(a.resname, repr(a.resid), a.name),
-                                    dist, angle])
-
-                                already_found[(h.index + 1, a.index + 1)] = True
+                frame_results.append(self._find_hbonds(
+                    ts, self._s1_donors_ix, self._s1_donors_h_ix,
+                    self._s2_acceptors.indices, box))
             if self.selection1_type in ('acceptor', 'both') and self._s1_acceptors:
                 self.logger_debug("Selection 1 Acceptors <-> Donors")
-                ns_acceptors = AtomNeighborSearch(self._s1_acceptors)
-                for i, donor_h_set in self._s2_donors_h.items():
-                    d = self._s2_donors[i]
-                    for h in donor_h_set:
-                        res = ns_acceptors.search(h, self.distance)
-                        for a in res:
-                            if remove_duplicates and (
-                                    (h.index + 1, a.index + 1) in already_found
-                                    or (a.index + 1, h.index + 1) in already_found):
-                                continue
-                            angle = self.calc_angle(d, h, a)
-                            donor_atom = h if self.distance_type != 'heavy' else d
-                            dist = self.calc_eucl_distance(donor_atom, a)
-                            if angle >= self.angle and dist <= self.distance:
-                                self.logger_debug(
-                                    "S1-A: {0!s} <-> S2-D: {1!s} {2:f} A, {3:f} DEG".format(a.index + 1, h.index + 1, dist, angle))
-                                #self.logger_debug("S1-A: %r <-> S2-D: %r %f A, %f DEG" % (a, h, dist, angle))
-                                frame_results.append(
-                                    [h.index + 1, a.index + 1, h.index, a.index,
-                                    '{0!s}{1!s}:{2!s}'.format(h.resname, repr(h.resid), h.name),
-                                    '{0!s}{1!s}:{2!s}'.format(a.resname, repr(a.resid), a.name),
-                                    dist, angle])
-
-            self.timeseries.append(frame_results)
-
-        logger.info("HBond analysis: complete; timeseries with %d hbonds in %s.timeseries",
-                    self.count_by_time().count.sum(), self.__class__.__name__)
+                found = self._find_hbonds(
+                    ts, self._s2_donors_ix, self._s2_donors_h_ix,
+                    self._s1_acceptors.indices, box)
+                if remove_duplicates and frame_results:
+                    # drop bonds already found between selection 1 donors
+                    # and selection 2 acceptors
+                    n = self.u.atoms.n_atoms
+                    first = frame_results[0]
+                    known = np.concatenate([
+                        first['donor_index'] * n + first['acceptor_index'],
+                        first['acceptor_index'] * n + first['donor_index']])
+                    new = ~np.in1d(found['donor_index'] * n +
+                                   found['acceptor_index'], known)
+                    found = found[new]
+                frame_results.append(found)
+            if frame_results:
+                frame_results = np.concatenate(frame_results)
+            else:
+                frame_results = np.empty(0, dtype=self._hbond_dtype)
+            frame_results['frame'] = frame
+            self.logger_debug("Frame %(frame)d: %(n)d hydrogen bonds",
+                              {'frame': frame, 'n': len(frame_results)})
+
+            if n_hbonds + len(frame_results) > len(hbonds):
+                grown = np.empty(max(2 * len(hbonds), n_hbonds + len(frame_results)),
+                                 dtype=self._hbond_dtype)
+                grown[:n_hbonds] = hbonds[:n_hbonds]
+                hbonds = grown
+            hbonds[n_hbonds:n_hbonds + len(frame_results)] = frame_results
+            n_hbonds += len(frame_results)
+            hbonds_per_frame.append(len(frame_results))
+
+        self.hbonds = hbonds[:n_hbonds].copy()
+        self._hbonds_per_frame = np.array(hbonds_per_frame, dtype=np.int64)
+        self._timeseries = None
+
+        logger.info("HBond analysis: complete; %d hbonds in %s.hbonds",
+                    len(self.hbonds), self.__class__.__name__)
+
+    #: Fields of :attr:`HydrogenBondAnalysis.hbonds`; "donor_index" is the
+    #: index of the hydrogen atom and "donor_heavy_index" the index of the
+    #: heavy atom it is bonded to (as in the tables).
+    _hbond_dtype = [('frame', np.int64), ('donor_heavy_index', np.int64),
+                    ('donor_index', np.int64), ('acceptor_index', np.int64),
+                    ('distance', np.float64), ('angle', np.float64)]
+
+    def _find_hbonds(self, ts, donor_ix, hydrogen_ix, acceptor_ix, box=None):
+        """Find all hydrogen bonds between donor hydrogens and acceptors.
+
+        A single neighbor search between all hydrogens in *hydrogen_ix* and
+        all acceptors in *acceptor_ix* yields the candidate pairs, for which
+        the D-H-A angles (and the D-A distances for *distance_type* "heavy")
+        are calculated in one call each.
+
+        :Returns: structured array with the fields of
+                  :attr:`HydrogenBondAnalysis.hbonds`, sorted by hydrogen and
+                  acceptor index
+
+        .. versionadded:: 0.16.0
+        """
+        out = np.empty(0, dtype=self._hbond_dtype)
+        if len(hydrogen_ix) == 0 or len(acceptor_ix) == 0:
+            return out
+        positions = ts.positions
+        pairs, distances = capped_distance(positions[hydrogen_ix],
+                                           positions[acceptor_ix],
+                                           self.distance, box=box)
+        donors = donor_ix[pairs[:, 0]]
+        hydrogens = hydrogen_ix[pairs[:, 0]]
+        acceptors = acceptor_ix[pairs[:, 1]]
+        if self.distance_type == 'heavy':
+            distances = calc_bonds(positions[donors], positions[acceptors],
+                                   box=box)
+        with np.errstate(invalid='ignore'):
+            angles = np.rad2deg(calc_angles(positions[donors],
+                                            positions[hydrogens],
+                                            positions[acceptors], box=box))
+            found = (angles >= self.angle) & (distances <= self.distance)
+
+        order = np.lexsort((acceptors[found], hydrogens[found]))
+        out = np.empty(len(order), dtype=self._hbond_dtype)
+        out['donor_heavy_index'] = donors[found][order]
+        out['donor_index'] = hydrogens[found][order]
+        out['acceptor_index'] = acceptors[found][order]
+        out['distance'] = distances[found][order]
+        out['angle'] = angles[found][order]
+        return out
+
+    @property
+    def timeseries(self):
+        """Labelled hydrogen bond data per frame (see :ref:`Analysis Output`).
+
+        The nested lists are generated from :attr:`hbonds` when they are
+        first accessed.
+
+        .. versionchanged:: 0.16.0
+           Generated on demand from :attr:`hbonds`.
+        """
+        if self._timeseries is None and self.hbonds is not None:
+            self._timeseries = self._make_timeseries()
+        return self._timeseries
+
+    @timeseries.setter
+    def timeseries(self, value):
+        self._timeseries = value
+
+    def _make_timeseries(self):
+        """Build the nested per-frame lists with atom labels from :attr:`hbonds`."""
+        hbonds = self.hbonds
+        atoms = self.u.atoms
+        labels = {}
+        for kind in ('donor_index', 'acceptor_index'):
+            ix = hbonds[kind]
+            labels[kind] = ['{0!s}{1!s}:{2!s}'.format(resname, resid, name)
+                            for resname, resid, name in zip(
+                                atoms.resnames[ix], atoms.resids[ix].tolist(),
+                                atoms.names[ix])]
+        rows = [[h + 1, a + 1, h, a, hl, al, dist, angle]
+                for h, a, hl, al, dist, angle in zip(
+                    hbonds['donor_index'].tolist(),
+                    hbonds['acceptor_index'].tolist(),
+                    labels['donor_index'], labels['acceptor_index'],
+                    hbonds['distance'].tolist(), hbonds['angle'].tolist())]
+        bounds = np.concatenate([[0], np.cumsum(self._hbonds_per_frame)])
+        return [rows[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
 
     @staticmethod
     def calc_angle(d, h, a):
@@ -1003,6 +1136,38 @@ class HydrogenBondAnalysis(object):
         """Calculate the Euclidean distance between two atoms. """
         return norm(a2.position - a1.position)
 
+    def _check_results(self):
+        """Warn and return ``False`` if :meth:`run` has not been called yet."""
+        if self.hbonds is None:
+            msg = "No timeseries computed, do run() first."
+            warnings.warn(msg, category=MissingDataWarning)
+            logger.warn(msg)
+            return False
+        return True
+
+    def _frame_positions(self):
+        """Position in :attr:`timesteps` of the frame of each hydrogen bond."""
+        return np.repeat(np.arange(len(self._hbonds_per_frame)),
+                         self._hbonds_per_frame)
+
+    def _fill_atom_columns(self, out, hbonds):
+        """Fill the index and residue/atom name columns of a table."""
+        atoms = self.u.atoms
+        donors = hbonds['donor_index']
+        acceptors = hbonds['acceptor_index']
+        out['donor_idx'] = donors + 1
+        out['acceptor_idx'] = acceptors + 1
+        out['donor_index'] = donors
+        out['acceptor_index'] = acceptors
+        out['donor_resnm'] = atoms.resnames[donors]
+        out['donor_resid'] = atoms.resids[donors]
+        out['donor_atom'] = atoms.names[donors]
+        out['acceptor_resnm'] = atoms.resnames[acceptors]
+        out['acceptor_resid'] = atoms.resids[acceptors]
+        out['acceptor_atom'] = atoms.names[acceptors]
+        if 'donor_heavy_atom' in out.dtype.names:
+            out['donor_heavy_atom'] = atoms.names[hbonds['donor_heavy_index']]
+
     def generate_table(self):
         """Generate a normalised table of the results.
 
@@ -1026,14 +1191,14 @@ class HydrogenBondAnalysis(object):
           11. "angle"
 
         .. _recsql: http://pypi.python.org/pypi/RecSQL
+
+        .. versionchanged:: 0.16.0
+           Columns are filled directly from :attr:`hbonds`.
         """
-        if self.timeseries is None:
-            msg = "No timeseries computed, do run() first."
-            warnings.warn(msg, category=MissingDataWarning)
-            logger.warn(msg)
+        if not self._check_results():
             return
 
-        num_records = np.sum([len(hframe) for hframe in self.timeseries])
+        num_records = len(self.hbonds)
         # build empty output table
         dtype = [
             ("time", float), ("donor_idx", int), ("acceptor_idx", int),
@@ -1041,17 +1206,11 @@ class HydrogenBondAnalysis(object):
             ("donor_resnm", "|U4"), ("donor_resid", int), ("donor_atom", "|U4"),
             ("acceptor_resnm", "|U4"), ("acceptor_resid", int), ("acceptor_atom", "|U4"),
             ("distance", float), ("angle", float)]
-        # according to Lukas' notes below, using a recarray at this stage is ineffective
-        # and speedups of ~x10 can be achieved by filling a standard array, like this:
         out = np.empty((num_records,), dtype=dtype)
-        cursor = 0  # current row
-        for t, hframe in zip(self.timesteps, self.timeseries):
-            for (donor_idx, acceptor_idx, donor_index, acceptor_index, donor,
-            acceptor, distance, angle) in hframe:
-                out[cursor] = (t, donor_idx, acceptor_idx, donor_index, acceptor_index) + \
-                parse_residue(donor) + parse_residue(acceptor) + (distance, angle)
-                cursor += 1
-        assert cursor == num_records, "Internal Error: Not all HB records stored"
+        out['time'] = np.asarray(self.timesteps, dtype=float)[self._frame_positions()]
+        self._fill_atom_columns(out, self.hbonds)
+        out['distance'] = self.hbonds['distance']
+        out['angle'] = self.hbonds['angle']
         self.table = out.view(np.recarray)
         logger.debug("HBond: Stored results as table with %(num_records)d entries.", vars())
 
@@ -1069,57 +1228,78 @@ class HydrogenBondAnalysis(object):
             self.generate_table()
         cPickle.dump(self.table, open(filename, 'wb'), protocol=cPickle.HIGHEST_PROTOCOL)
 
+    def save_hbonds(self, filename="hbonds.npz"):
+        """Save :attr:`~HydrogenBondAnalysis.hbonds` to a binary file.
+
+        The compact results and the time steps are written with
+        :func:`numpy.savez_compressed` and can be read back with
+        :meth:`load_hbonds`.
+
+        .. versionadded:: 0.16.0
+        """
+        if not self._check_results():
+            return
+        np.savez_compressed(filename, hbonds=self.hbonds,
+                            timesteps=np.asarray(self.timesteps, dtype=float),
+                            hbonds_per_frame=self._hbonds_per_frame)
+
+    def load_hbonds(self, filename):
+        """Load results written by :meth:`save_hbonds`.
+
+        The atom indices refer to the universe of this analysis, which
+        should therefore be the same system as the one that was analysed.
+
+        .. versionadded:: 0.16.0
+        """
+        with np.load(filename) as data:
+            self.hbonds = data['hbonds']
+            self.timesteps = data['timesteps'].tolist()
+            self._hbonds_per_frame = data['hbonds_per_frame']
+        self._timeseries = None
+        self.table = None
+
     def count_by_time(self):
         """Counts the number of hydrogen bonds per timestep.
 
         :Returns: a class:`numpy.recarray`
         """
-
-        if self.timeseries is None:
-            msg = "No timeseries computed, do run() first."
-            warnings.warn(msg, category=MissingDataWarning)
-            logger.warn(msg)
+        if not self._check_results():
             return
 
         out = np.empty((len(self.timesteps),), dtype=[('time', float), ('count', int)])
-        for cursor, time_count in enumerate(zip(self.timesteps,
-                                                map(len, self.timeseries))):
-            out[cursor] = time_count
+        out['time'] = self.timesteps
+        out['count'] = self._hbonds_per_frame
         return out.view(np.recarray)
 
+    def _sorted_by_type(self):
+        """Hydrogen bonds sorted by (donor, acceptor), keeping time order."""
+        return np.lexsort((self.hbonds['acceptor_index'],
+                           self.hbonds['donor_index']))
+
     def count_by_type(self):
         """Counts the frequency of hydrogen bonds of a specific type.
 
-        Processes :attr:`HydrogenBondAnalysis.timeseries` and returns
+        Processes :attr:`HydrogenBondAnalysis.hbonds` and returns
         a :class:`numpy.recarray` containing atom indices, residue
         names, residue numbers (for donors and acceptors) and the
         fraction of the total time during which the hydrogen bond was
         detected.
 
         :Returns: a class:`numpy.recarray`
+
+        .. versionchanged:: 0.16.0
+           Hydrogen bonds are grouped by sorting :attr:`hbonds`; the donor
+           heavy atom is the one recorded for each hydrogen bond.
         """
-        if self.timeseries is None:
-            msg = "No timeseries computed, do run() first."
-            warnings.warn(msg, category=MissingDataWarning)
-            logger.warn(msg)
+        if not self._check_results():
             return
 
-        hbonds = defaultdict(int)
-        for hframe in self.timeseries:
-            for (donor_idx, acceptor_idx, donor_index, acceptor_index, donor,
-                acceptor, distance, angle) in hframe:
-                donor_resnm, donor_resid, donor_atom = parse_residue(donor)
-                acceptor_resnm, acceptor_resid, acceptor_atom = parse_residue(acceptor)
-                # generate unambigous key for current hbond \
-                # (the donor_heavy_atom placeholder '?' is added later)
-                # idx_zero is redundant for an unambigous key, but included for
-                # consistency.
-                hb_key = (
-                    donor_idx, acceptor_idx, donor_index, acceptor_index,
-                    donor_resnm, donor_resid, "?", donor_atom,
-                    acceptor_resnm, acceptor_resid, acceptor_atom)
-
-                hbonds[hb_key] += 1
+        hbonds = self.hbonds[self._sorted_by_type()]
+        new_type = np.ones(len(hbonds), dtype=bool)
+        new_type[1:] = ((hbonds['donor_index'][1:] != hbonds['donor_index'][:-1]) |
+                        (hbonds['acceptor_index'][1:] != hbonds['acceptor_index'][:-1]))
+        first = np.flatnonzero(new_type)
+        counts = np.diff(np.append(first, len(hbonds)))
 
         # build empty output table
         dtype = [
@@ -1129,62 +1309,31 @@ class HydrogenBondAnalysis(object):
             ('acceptor_resnm', 'U4'), ('acceptor_resid', int), ('acceptor_atom', 'U4'),
             ('frequency', float)
         ]
-        out = np.empty((len(hbonds),), dtype=dtype)
-
-        # float because of division later
-        tsteps = float(len(self.timesteps))
-        for cursor, (key, count) in enumerate(six.iteritems(hbonds)):
-            out[cursor] = key + (count / tsteps,)
+        out = np.empty((len(first),), dtype=dtype)
+        self._fill_atom_columns(out, hbonds[first])
+        # float because of division
+        out['frequency'] = counts / float(len(self.timesteps))
 
         # return array as recarray
-        # The recarray has not been used within the function, because accessing the
-        # the elements of a recarray (3.65 us) is much slower then accessing those
-        # of a ndarray (287 ns).
-        r = out.view(np.recarray)
-
-        # patch in donor heavy atom names (replaces '?' in the key)
-        h2donor = self._donor_lookup_table_byindex()
-        r.donor_heavy_atom[:] = [h2donor[idx] for idx in r.donor_index]
-
-        return r
+        return out.view(np.recarray)
 
     def timesteps_by_type(self):
         """Frames during which each hydrogen bond existed, sorted by hydrogen bond.
 
-        Processes :attr:`HydrogenBondAnalysis.timeseries` and returns
+        Processes :attr:`HydrogenBondAnalysis.hbonds` and returns
         a :class:`numpy.recarray` containing atom indices, residue
         names, residue numbers (for donors and acceptors) and a list
         of timesteps at which the hydrogen bond was detected.
 
         :Returns: a class:`numpy.recarray`
-        """
 
-        if self.timeseries is None:
-            msg = "No timeseries computed, do run() first."
-            warnings.warn(msg, category=MissingDataWarning)
-            logger.warn(msg)
+        .. versionchanged:: 0.16.0
+           Rows are obtained by sorting :attr:`hbonds`.
+        """
+        if not self._check_results():
             return
 
-        hbonds = defaultdict(list)
-        for (t, hframe) in zip(self.timesteps, self.timeseries):
-            for (donor_idx, acceptor_idx, donor_index, acceptor_index, donor,
-            acceptor, distance, angle) in hframe:
-                donor_resnm, donor_resid, donor_atom = parse_residue(donor)
-                acceptor_resnm, acceptor_resid, acceptor_atom = parse_residue(acceptor)
-                # generate unambigous key for current hbond
-                # (the donor_heavy_atom placeholder '?' is added later)
-                # idx_zero is redundant for key but added for consistency
-                hb_key = (
-                    donor_idx, acceptor_idx,
-                    donor_index, acceptor_index,
-                    donor_resnm, donor_resid, "?", donor_atom,
-                    acceptor_resnm, acceptor_resid, acceptor_atom)
-                hbonds[hb_key].append(t)
-
-        out_nrows = 0
-        # count number of timesteps per key to get length of output table
-        for ts_list in six.itervalues(hbonds):
-            out_nrows += len(ts_list)
+        order = self._sorted_by_type()
 
         # build empty output table
         dtype = [
@@ -1192,25 +1341,45 @@ class HydrogenBondAnalysis(object):
             ('acceptor_index', int), ('donor_resnm', 'U4'), ('donor_resid', int),
             ('donor_heavy_atom', 'U4'), ('donor_atom', 'U4'),('acceptor_resnm', 'U4'),
             ('acceptor_resid', int), ('acceptor_atom', 'U4'), ('time', float)]
-        out = np.empty((out_nrows,), dtype=dtype)
-
-        out_row = 0
-        for (key, times) in six.iteritems(hbonds):
-            for tstep in times:
-                out[out_row] = key + (tstep,)
-                out_row += 1
+        out = np.empty((len(order),), dtype=dtype)
+        self._fill_atom_columns(out, self.hbonds[order])
+        times = np.asarray(self.timesteps, dtype=float)[self._frame_positions()]
+        out['time'] = times[order]
 
         # return array as recarray
-        # The recarray has not been used within the function, because accessing the
-        # the elements of a recarray (3.65 us) is much slower then accessing those
-        # of a ndarray (287 ns).
-        r = out.view(np.recarray)
+        return out.view(np.recarray)
+
+    def autocorrelation(self, bond_type='intermittent', max_tau=None):
+        """Hydrogen bond autocorrelation averaged over all time origins.
 
-        # patch in donor heavy atom names (replaces '?' in the key)
-        h2donor = self._donor_lookup_table_byindex()
-        r.donor_heavy_atom[:] = [h2donor[idx - 1] for idx in r.donor_idx]
+        The hydrogen bonds in :attr:`hbonds` are turned into an existence
+        matrix (see
+        :func:`~MDAnalysis.analysis.hbonds.hbond_autocorrel.hbond_existence`)
+        from which the *intermittent* or *continuous* autocorrelation is
+        computed.
+
+        :Arguments:
+          *bond_type*
+            "intermittent" or "continuous" ["intermittent"]
+          *max_tau*
+            Largest lag in analysed frames; ``None`` uses all frames [``None``]
 
-        return r
+        :Returns: array of the autocorrelation for lags ``0 ... max_tau``
+                  (in analysed frames)
+
+        .. versionadded:: 0.16.0
+        """
+        if bond_type not in ('intermittent', 'continuous'):
+            raise ValueError("bond_type must be either 'continuous' or "
+                             "'intermittent'")
+        if not self._check_results():
+            return
+        pairs, existence = hbond_existence(
+            self._frame_positions(), self.hbonds['donor_index'],
+            self.hbonds['acceptor_index'], n_frames=len(self.timesteps))
+        if bond_type == 'intermittent':
+            return intermittent_autocorrelation(existence, max_tau=max_tau)
+        return continuous_autocorrelation(existence, max_tau=max_tau)
 
     def _donor_lookup_table_byres(self):
         """Look-up table to identify the donor heavy atom from resid and hydrogen name.
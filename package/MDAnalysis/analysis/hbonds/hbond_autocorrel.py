@@ -151,8 +151,24 @@ Examples
    .. automethod:: save_results
 
 
+Autocorrelation from existence matrices
+---------------------------------------
+
+Given all hydrogen bonds observed along a trajectory (e.g. the
+:attr:`~MDAnalysis.analysis.hbonds.hbond_analysis.HydrogenBondAnalysis.hbonds`
+of a :class:`~MDAnalysis.analysis.hbonds.hbond_analysis.HydrogenBondAnalysis`),
+the following functions compute the intermittent and continuous
+autocorrelations averaged over all time origins. Each pair's existence
+timeseries becomes a row of a boolean matrix; intermittent correlations are
+computed with FFTs and continuous ones from run lengths, processing the
+pairs in chunks.
+
+.. autofunction:: hbond_existence
+.. autofunction:: intermittent_autocorrelation
+.. autofunction:: continuous_autocorrelation
+
 """
-from six.moves import zip
+from six.moves import zip, range
 import numpy as np
 import warnings
 
@@ -533,3 +549,163 @@ class HydrogenBondAutoCorrel(object):
         return ("<MDAnalysis HydrogenBondAutoCorrel analysis measuring the "
                 "{btype} lifetime of {n} different hydrogens>"
                 "".format(btype=self.bond_type, n=len(self.h)))
+
+
+def hbond_existence(frames, donors, acceptors, n_frames=None):
+    """Existence matrix of hydrogen bonds.
+
+    Parameters
+    ----------
+    frames : array
+        Frame (0-based position in the analysed trajectory) of each
+        observed hydrogen bond.
+    donors : array
+        Donor (hydrogen) index of each observed hydrogen bond.
+    acceptors : array
+        Acceptor index of each observed hydrogen bond.
+    n_frames : int, optional
+        Number of frames; defaults to one more than the largest frame.
+
+    Returns
+    -------
+    pairs : ndarray
+        ``(P, 2)`` array of the distinct (donor, acceptor) pairs
+    existence : ndarray
+        ``(P, n_frames)`` boolean array, ``True`` where a pair is hydrogen
+        bonded
+
+    .. versionadded:: 0.16.0
+    """
+    frames = np.asarray(frames, dtype=np.intp)
+    donors = np.asarray(donors, dtype=np.int64)
+    acceptors = np.asarray(acceptors, dtype=np.int64)
+    if n_frames is None:
+        n_frames = frames.max() + 1 if len(frames) else 0
+
+    order = np.lexsort((acceptors, donors))
+    new_pair = np.ones(len(order), dtype=bool)
+    new_pair[1:] = ((donors[order][1:] != donors[order][:-1]) |
+                    (acceptors[order][1:] != acceptors[order][:-1]))
+    pair_ix = np.empty(len(order), dtype=np.intp)
+    pair_ix[order] = np.cumsum(new_pair) - 1
+
+    first = order[new_pair]
+    pairs = np.column_stack((donors[first], acceptors[first]))
+    existence = np.zeros((len(pairs), n_frames), dtype=bool)
+    existence[pair_ix, frames] = True
+    return pairs, existence
+
+
+def _origin_counts(existence, max_tau, chunksize):
+    """Number of bonds at all time origins usable for each lag."""
+    n_frames = existence.shape[1]
+    per_frame = np.zeros(n_frames, dtype=np.int64)
+    for start in range(0, len(existence), chunksize):
+        per_frame += existence[start:start + chunksize].sum(axis=0)
+    # origins t with t + tau still inside the trajectory; float so that
+    # dividing integer counts by it is not floored on Python 2
+    counts = np.cumsum(per_frame)[n_frames - 1 - np.arange(max_tau + 1)]
+    return counts.astype(np.float64)
+
+
+def intermittent_autocorrelation(existence, max_tau=None, chunksize=1024):
+    """Intermittent hydrogen bond autocorrelation from an existence matrix.
+
+    .. math::
+       C_i(\\tau) = \\frac{\\sum_{ij} \\sum_t h_{ij}(t) h_{ij}(t + \\tau)}
+                        {\\sum_{ij} \\sum_t h_{ij}(t)}
+
+    where both sums over :math:`t` run over all time origins for which
+    :math:`t + \\tau` is inside the trajectory. The correlation of each
+    pair is obtained with a FFT, which makes the cost
+    :math:`O(P \\cdot T \\log T)` for *P* pairs and *T* frames.
+
+    Parameters
+    ----------
+    existence : ndarray
+        ``(P, T)`` boolean array as returned by :func:`hbond_existence`
+    max_tau : int, optional
+        Largest lag (in frames) to calculate; defaults to ``T - 1``.
+    chunksize : int, optional
+        Number of pairs transformed at once, which bounds memory use.
+
+    Returns
+    -------
+    C : ndarray
+        Autocorrelation for lags ``0 ... max_tau``; ``nan`` for lags
+        without any bonds at the time origins.
+
+    .. versionadded:: 0.16.0
+    """
+    existence = np.asarray(existence, dtype=bool)
+    n_frames = existence.shape[1]
+    if max_tau is None:
+        max_tau = n_frames - 1
+    max_tau = min(max_tau, n_frames - 1)
+
+    # zero padding to at least 2T avoids circular wrap around
+    n = 1
+    while n < 2 * n_frames:
+        n *= 2
+    correlated = np.zeros(max_tau + 1)
+    for start in range(0, len(existence), chunksize):
+        f = np.fft.rfft(existence[start:start + chunksize], n=n, axis=1)
+        ac = np.fft.irfft(f * f.conj(), n=n, axis=1)[:, :max_tau + 1]
+        correlated += np.rint(ac).sum(axis=0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return correlated / _origin_counts(existence, max_tau, chunksize)
+
+
+def continuous_autocorrelation(existence, max_tau=None, chunksize=1024):
+    """Continuous hydrogen bond autocorrelation from an existence matrix.
+
+    .. math::
+       C_c(\\tau) = \\frac{\\sum_{ij} \\sum_t h_{ij}(t) h'_{ij}(t + \\tau)}
+                        {\\sum_{ij} \\sum_t h_{ij}(t)}
+
+    where :math:`h'_{ij}(t + \\tau) = 1` only if the bond existed without
+    interruption from :math:`t` to :math:`t + \\tau`. The bonds are run-length
+    encoded: an uninterrupted run of *L* frames contributes :math:`L - \\tau`
+    to the numerator for every :math:`\\tau < L`, so that only a histogram
+    of run lengths is needed.
+
+    Parameters
+    ----------
+    existence : ndarray
+        ``(P, T)`` boolean array as returned by :func:`hbond_existence`
+    max_tau : int, optional
+        Largest lag (in frames) to calculate; defaults to ``T - 1``.
+    chunksize : int, optional
+        Number of pairs encoded at once, which bounds memory use.
+
+    Returns
+    -------
+    C : ndarray
+        Autocorrelation for lags ``0 ... max_tau``; ``nan`` for lags
+        without any bonds at the time origins.
+
+    .. versionadded:: 0.16.0
+    """
+    existence = np.asarray(existence, dtype=bool)
+    n_frames = existence.shape[1]
+    if max_tau is None:
+        max_tau = n_frames - 1
+    max_tau = min(max_tau, n_frames - 1)
+
+    runs = np.zeros(n_frames + 1, dtype=np.int64)
+    for start in range(0, len(existence), chunksize):
+        chunk = existence[start:start + chunksize].astype(np.int8)
+        edges = np.diff(np.pad(chunk, ((0, 0), (1, 1)), 'constant'), axis=1)
+        lengths = np.nonzero(edges.ravel() == -1)[0] - np.nonzero(edges.ravel() == 1)[0]
+        runs += np.bincount(lengths, minlength=n_frames + 1)
+
+    # sum over runs longer than tau of (L - tau)
+    L = np.arange(n_frames + 1)
+    n_longer = np.cumsum(runs[::-1])[::-1]
+    frames_longer = np.cumsum((runs * L)[::-1])[::-1]
+    tau = np.arange(max_tau + 1)
+    correlated = frames_longer[tau + 1] - tau * n_longer[tau + 1]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return correlated / _origin_counts(existence, max_tau, chunksize)
@@ -0,0 +1,301 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- http://www.mdanalysis.org
+# Copyright (c) 2006-2016 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+"""
+Mean square displacement --- :mod:`MDAnalysis.analysis.msd`
+===========================================================
+
+Calculation of the mean square displacement (MSD)
+
+.. math::
+   \\mathrm{MSD}(\\tau) = \\langle |\\mathbf{r}(t + \\tau) -
+                          \\mathbf{r}(t)|^2 \\rangle_{t}
+
+of atoms or of the centers of mass of compounds (residues, segments or
+fragments), averaged over all time origins *t*. The slope of the MSD
+yields the self-diffusion coefficient through the Einstein relation
+:math:`\\mathrm{MSD}(\\tau) = 2 d D \\tau` in *d* dimensions.
+
+Positions are unwrapped while the trajectory is read: the displacement of
+each atom between consecutive analysed frames is replaced by its minimum
+image in the unit cell of the current frame, so that atoms crossing the
+periodic boundaries keep continuous trajectories (also when the box
+changes). Frames must therefore be close enough that no atom moves more than
+half a box length between them.
+
+The MSD for all lag times is then calculated with the FFT algorithm of
+[Calandrini2011]_ (see :func:`msd_fft`), which needs :math:`O(T \\log T)`
+operations for *T* frames instead of :math:`O(T^2)`. The transforms are
+done for chunks of particles to bound the additional memory, but the
+unwrapped positions of all particles in all frames (``T x N x d`` float64
+values for *N* particles) must be stored, because the MSD of a particle
+needs its whole trajectory. For long trajectories of many particles they
+can be written to a memory-mapped ``.npy`` file with the *filename* keyword
+instead of being held in memory, and ``per_particle=False`` only
+accumulates the mean MSD instead of the ``T x N`` MSD of every particle.
+
+Example
+-------
+Self-diffusion of water molecules::
+
+  import MDAnalysis as mda
+  from MDAnalysis.analysis.msd import MSD
+
+  u = mda.Universe(TPR, XTC)
+  msd = MSD(u.select_atoms("resname SOL"), grouping='residues')
+  msd.run()
+  # MSD in A^2 against the lag time in ps
+  plot(msd.lagtimes, msd.msd)
+
+
+.. rubric:: References
+
+.. [Calandrini2011] V. Calandrini, E. Pellegrini, P. Calligari, K. Hinsen, and
+                    G. R. Kneller. nMoldyn - Interfacing spectroscopic
+                    experiments, molecular dynamics simulations and models
+                    for time correlation functions. *École thématique de la
+                    Société Française de la Neutronique*, 12:201–232, 2011.
+                    doi:`10.1051/sfn/201112010`_
+
+.. _`10.1051/sfn/201112010`: http://dx.doi.org/10.1051/sfn/201112010
+
+
+Classes and functions
+---------------------
+
+.. autoclass:: MSD
+   :members:
+
+.. autofunction:: msd_fft
+
+"""
+from __future__ import division, absolute_import
+from six.moves import range
+
+import numpy as np
+
+from ..core.groups import _compound_centers
+from ..lib.distances import minimize_vectors
+from .base import AnalysisBase
+
+
+class MSD(AnalysisBase):
+    """Mean square displacement of atoms or compounds
+
+    MSD(atomgroup, grouping='atoms', msd_type='xyz', unwrap=True,
+        chunksize=None, per_particle=True, filename=None)
+
+    Parameters
+    ----------
+    atomgroup : AtomGroup
+        Atoms to analyse
+    grouping : str {'atoms', 'residues', 'segments', 'fragments'}
+        Calculate the MSD of the individual atoms or of the centers of mass
+        of the compounds (only the atoms in *atomgroup* contribute) ['atoms']
+    msd_type : str {'xyz', 'xy', 'yz', 'xz', 'x', 'y', 'z'}
+        Components of the displacements that are included ['xyz']
+    unwrap : bool
+        Remove jumps across the periodic boundaries using the minimum image
+        of the displacement between consecutive frames [``True``]
+    chunksize : int
+        Number of particles transformed at once (see :func:`msd_fft`)
+    per_particle : bool
+        Also store the MSD of each particle in :attr:`msd_by_particle`;
+        with ``False`` only the mean is accumulated [``True``]
+    filename : str
+        Store the unwrapped positions in a memory-mapped ``.npy`` file of
+        this name instead of in memory; the file is kept after the analysis
+        [``None``]
+    start : int
+        The frame to start at [0]
+    stop : int
+        The frame to end at [-1]
+    step : int
+        The step size through the trajectory in frames [0]
+
+    Attributes
+    ----------
+    msd : numpy.ndarray
+        MSD for lags of ``0 ... n_frames - 1`` analysed frames, averaged
+        over all particles
+    msd_by_particle : numpy.ndarray
+        ``(n_frames, n_particles)`` MSD of each particle (only with
+        ``per_particle=True``)
+    lagtimes : numpy.ndarray
+        Lag times corresponding to :attr:`msd`
+    n_particles : int
+        Number of atoms or compounds
+
+    .. versionadded:: 0.16.0
+    """
+
+    def __init__(self, atomgroup, grouping='atoms', msd_type='xyz',
+                 unwrap=True, chunksize=None, per_particle=True,
+                 filename=None, **kwargs):
+        super(MSD, self).__init__(atomgroup.universe.trajectory, **kwargs)
+        if grouping not in ('atoms', 'residues', 'segments', 'fragments'):
+            raise ValueError("grouping must be one of 'atoms', 'residues', "
+                             "'segments' or 'fragments', not "
+                             "{0!r}".format(grouping))
+        if (not msd_type or len(set(msd_type)) != len(msd_type) or
+                not set(msd_type) <= set('xyz')):
+            raise ValueError("msd_type must be a combination of 'x', 'y' and "
+                             "'z' such as 'xyz' or 'xy', not "
+                             "{0!r}".format(msd_type))
+        self._ag = atomgroup
+        self.grouping = grouping
+        self.msd_type = msd_type
+        self._dims = ['xyz'.index(dim) for dim in msd_type]
+        self.unwrap = unwrap
+        self.chunksize = chunksize
+        self.per_particle = per_particle
+        self.filename = filename
+
+        if grouping == 'atoms':
+            self._compound_ix = None
+            self.n_particles = atomgroup.n_atoms
+        else:
+            compounds = atomgroup._get_compound_indices(grouping)
+            unique, self._compound_ix = np.unique(compounds,
+                                                  return_inverse=True)
+            self.n_particles = len(unique)
+
+    def _prepare(self):
+        self._masses = (None if self._compound_ix is None
+                        else self._ag.masses.astype(np.float64))
+        shape = (self.n_frames, self.n_particles, len(self._dims))
+        if self.filename is None:
+            self._positions = np.empty(shape, dtype=np.float64)
+        else:
+            self._positions = np.lib.format.open_memmap(
+                self.filename, mode='w+', dtype=np.float64, shape=shape)
+        self._times = np.empty(self.n_frames, dtype=np.float64)
+        self._wrapped = None
+        self._unwrapped = None
+
+    def _single_frame(self):
+        wrapped = self._ag.positions.astype(np.float64)
+        box = self._ts.dimensions
+        if self._unwrapped is None or not self.unwrap:
+            self._unwrapped = wrapped
+        elif box[:3].all():
+            self._unwrapped = self._unwrapped + minimize_vectors(
+                wrapped - self._wrapped, box)
+        else:
+            self._unwrapped = self._unwrapped + (wrapped - self._wrapped)
+        self._wrapped = wrapped
+
+        if self._compound_ix is None:
+            positions = self._unwrapped
+        else:
+            positions = _compound_centers(self._unwrapped, self._compound_ix,
+                                          self.n_particles, self._masses)
+        self._positions[self._frame_index] = positions[:, self._dims]
+        self._times[self._frame_index] = self._ts.time
+
+    def _conclude(self):
+        if self.per_particle:
+            self.msd_by_particle = msd_fft(self._positions, self.chunksize)
+            self.msd = self.msd_by_particle.mean(axis=1)
+        else:
+            self.msd = msd_fft(self._positions, self.chunksize, average=True)
+        if self.filename is not None:
+            self._positions.flush()
+        self.lagtimes = self._times - self._times[0]
+        del self._positions, self._wrapped, self._unwrapped
+
+
+def msd_fft(positions, chunksize=None, average=False):
+    """Mean square displacements for all lag times with FFTs.
+
+    For each particle the MSD
+
+    .. math::
+       \\mathrm{MSD}(m) = \\frac{1}{T - m} \\sum_{k=0}^{T-m-1}
+                          |\\mathbf{r}_{k+m} - \\mathbf{r}_k|^2
+                        = S_1(m) - 2 S_2(m)
+
+    is split into a sum :math:`S_1` of squared positions, which is
+    accumulated from both ends of the trajectory, and the position
+    autocorrelation :math:`S_2`, which is calculated with a FFT
+    [Calandrini2011]_.
+
+    Parameters
+    ----------
+    positions : array_like
+        ``(T, N, d)`` positions of *N* particles in *T* equally spaced frames
+        (or ``(T, d)`` for a single particle)
+    chunksize : int, optional
+        Number of particles transformed at once, which bounds memory use;
+        by default about :math:`2^{24}` values are transformed at once.
+        Only one chunk of *positions* is converted to float64 at a time, so
+        they can also be a :class:`numpy.memmap`.
+    average : bool, optional
+        Only accumulate the MSD averaged over all particles instead of
+        returning the MSD of each particle.
+
+    Returns
+    -------
+    msd : numpy.ndarray
+        ``(T, N)`` (or ``(T,)``) MSD of each particle for lags of
+        ``0 ... T - 1`` frames; ``(T,)`` mean MSD with ``average=True``
+
+    .. versionadded:: 0.16.0
+    """
+    if not isinstance(positions, np.ndarray):
+        positions = np.asarray(positions, dtype=np.float64)
+    single = positions.ndim == 2
+    if single:
+        positions = positions[:, None, :]
+    n_frames, n_particles, n_dims = positions.shape
+
+    # zero padding to at least 2T avoids circular wrap around
+    n = 1
+    while n < 2 * n_frames:
+        n *= 2
+    if chunksize is None:
+        chunksize = max(1, 2**24 // (n * n_dims))
+    origins = (n_frames - np.arange(n_frames))[:, None]
+
+    if average:
+        msd = np.zeros(n_frames, dtype=np.float64)
+    else:
+        msd = np.empty((n_frames, n_particles), dtype=np.float64)
+    for start in range(0, n_particles, chunksize):
+        r = np.asarray(positions[:, start:start + chunksize],
+                       dtype=np.float64)
+        # the MSD does not depend on the origin; centering keeps S1 and S2
+        # small so that little precision is lost in their difference
+        r = r - r.mean(axis=0)
+        squared = np.square(r).sum(axis=2)
+        s1 = np.empty_like(squared)
+        s1[0] = 2 * squared.sum(axis=0)
+        # S1 drops the squared positions at both ends of the trajectory
+        s1[1:] = s1[0] - np.cumsum(squared[:-1] + squared[:0:-1], axis=0)
+        f = np.fft.rfft(r, n=n, axis=0)
+        s2 = np.fft.irfft(f * f.conj(), n=n, axis=0)[:n_frames].sum(axis=2)
+        if average:
+            msd += (s1 - 2 * s2).sum(axis=1) / origins[:, 0]
+        else:
+            msd[:, start:start + chunksize] = (s1 - 2 * s2) / origins
+    if average:
+        return msd / n_particles
+    return msd[:, 0] if single else msd
@@ -105,9 +105,8 @@ import numpy as np
 
 from MDAnalysis import Universe
 from MDAnalysis.analysis.align import _fit_to
-from MDAnalysis.lib.log import ProgressMeter
 
-from .base import AnalysisBase
+from .base import AnalysisBase, _merge_moments
 
 
 class PCA(AnalysisBase):
@@ -125,17 +124,17 @@ class PCA(AnalysisBase):
 
     Attributes
     ----------
-    p_components: array, (n_components, n_atoms * 3)
-        The principal components of the feature space,
+    p_components: array, (n_atoms * 3, n_components)
+        The principal components of the feature space (in the columns),
         representing the directions of maximum variance in the data.
     variance : array (n_components, )
         The raw variance explained by each eigenvector of the covariance
         matrix.
     cumulated_variance : array, (n_components, )
-        Percentage of variance explained by the selected components and the sum
-        of the components preceding it. If a subset of components is not chosen
-        then all components are stored and the cumulated variance will converge
-        to 1.
+        Fraction of the total variance explained by the selected components
+        and the sum of the components preceding it. If a subset of components
+        is not chosen then all components are stored and the cumulated
+        variance will converge to 1.
     pca_space : array (n_frames, n_components)
         After running :meth:`pca.transform` the projection of the
         positions onto the principal components will exist here.
@@ -149,15 +148,23 @@ class PCA(AnalysisBase):
         Take an atomgroup or universe with the same number of atoms as was
         used for the calculation in :meth:`PCA.run` and project it onto the
         principal components.
+    merge(other)
+        Combine with a PCA of other frames of the same atoms, e.g. one that
+        was run in parallel on another part of the trajectory.
 
 
     Notes
     -----
-    Computation can be speed up by supplying a precalculated mean structure
+    The covariance matrix is accumulated in a single pass over the
+    trajectory: blocks of *chunksize* frames are added with one matrix
+    product each, while the mean is updated with the stable pairwise
+    algorithm of Chan et al. If *n_components* is much smaller than the
+    number of coordinates, only those eigenvectors are calculated (with the
+    Lanczos method if scipy is installed).
     """
 
     def __init__(self, universe, select='all', align=False, mean=None,
-                 n_components=None, **kwargs):
+                 n_components=None, chunksize=256, **kwargs):
         """
         Parameters
         ----------
@@ -175,6 +182,9 @@ class PCA(AnalysisBase):
         n_components : int, optional
             The number of principal components to be saved, default saves
             all principal components, Default: None
+        chunksize : int, optional
+            Number of frames that are added to the covariance matrix at once,
+            Default: 256
         start : int, optional
             First frame of trajectory to use for generation
             of covariance matrix, Default: None
@@ -202,44 +212,31 @@ class PCA(AnalysisBase):
         self._atoms = self._u.select_atoms(select)
         self.n_components = n_components
         self._n_atoms = self._atoms.n_atoms
+        self._chunksize = chunksize
         self._calculated = False
 
         if mean is None:
             self.mean = np.zeros(self._n_atoms*3)
             self._calc_mean = True
         else:
-            self.mean = mean.positions
+            self.mean = mean.positions.ravel().astype(np.float64)
             self._calc_mean = False
 
     def _prepare(self):
         n_dim = self._n_atoms * 3
+        # scatter matrix (sum of outer products of the deviations from the
+        # mean) until _conclude() turns it into the covariance
         self.cov = np.zeros((n_dim, n_dim))
+        if self._calc_mean:
+            self.mean = np.zeros(n_dim)
+        self._n_added = 0
+        self._chunk = np.empty((max(1, min(self._chunksize, self.n_frames)),
+                                n_dim))
+        self._n_chunk = 0
         self._ref_atom_positions = self._reference.positions
         self._ref_cog = self._reference.center_of_geometry()
         self._ref_atom_positions -= self._ref_cog
 
-        if self._calc_mean:
-            interval = int(self.n_frames // 100)
-            interval = interval if interval > 0 else 1
-            format = ("Mean Calculation Step"
-                      "%(step)5d/%(numsteps)d [%(percentage)5.1f%%]\r")
-            mean_pm = ProgressMeter(self.n_frames if self.n_frames else 1,
-                                    interval=interval, verbose=self._verbose,
-                                    format=format)
-            for i, ts in enumerate(self._u.trajectory[self.start:self.stop:
-                                                      self.step]):
-                if self.align:
-                    mobile_cog = self._atoms.center_of_geometry()
-                    mobile_atoms, old_rmsd = _fit_to(self._atoms.positions,
-                                                     self._ref_atom_positions,
-                                                     self._atoms,
-                                                     mobile_com=mobile_cog,
-                                                     ref_com=self._ref_cog)
-                else:
-                    self.mean += self._atoms.positions.ravel()
-                mean_pm.echo(i)
-            self.mean /= self.n_frames
-
         self.mean_atoms = self._atoms
         self.mean_atoms.positions = self._atoms.positions
 
@@ -255,24 +252,91 @@ class PCA(AnalysisBase):
             x = mobile_atoms.positions.ravel()
         else:
             x = self._atoms.positions.ravel()
-        x -= self.mean
-        self.cov += np.dot(x[:, np.newaxis], x[:, np.newaxis].T)
+        self._chunk[self._n_chunk] = x
+        self._n_chunk += 1
+        if self._n_chunk == len(self._chunk):
+            self._add_chunk()
+
+    def _add_chunk(self):
+        """Add the buffered frames to the mean and the scatter matrix."""
+        x = self._chunk[:self._n_chunk]
+        self._n_chunk = 0
+        if len(x) == 0:
+            return
+        if self._calc_mean:
+            # stable streaming update of the mean and scatter matrix
+            mean = x.mean(axis=0)
+            x = x - mean
+            self._n_added, self.mean, self.cov = _merge_moments(
+                self._n_added, self.mean, self.cov,
+                len(x), mean, np.dot(x.T, x))
+        else:
+            x = x - self.mean
+            self._n_added += len(x)
+            # X^T X of a whole chunk is a single (syrk) BLAS call
+            self.cov += np.dot(x.T, x)
 
     def _conclude(self):
-        self.cov /= self.n_frames - 1
-        e_vals, e_vects = np.linalg.eig(self.cov)
-        sort_idx = np.argsort(e_vals)[::-1]
-        self.variance = e_vals[sort_idx]
-        self.variance = self.variance[:self.n_components]
-        self.p_components = e_vects[:self.n_components, sort_idx]
-        self.cumulated_variance = (np.cumsum(self.variance) /
-                                   np.sum(self.variance))
+        self._add_chunk()
+        del self._chunk
+        self.cov /= self._n_added - 1
+        self._solve()
         self._calculated = True
 
+    def _solve(self):
+        """Principal components from the covariance matrix."""
+        self.variance, self.p_components = _top_eigenpairs(self.cov,
+                                                           self.n_components)
+        self.cumulated_variance = (np.cumsum(self.variance) /
+                                   np.trace(self.cov))
+
+    def merge(self, other):
+        """Add the frames analysed by another PCA of the same atoms
+
+        Partial results, e.g. for blocks of frames analysed in parallel with
+        separate *start* and *stop*, are combined into the covariance of all
+        frames and the principal components are recalculated.
+
+        Parameters
+        ----------
+        other : PCA
+            A PCA of the same number of atoms, after :meth:`PCA.run`. If a
+            *mean* was supplied, it must be the same in both.
+
+        Returns
+        -------
+        self : PCA
+        """
+        if not (self._calculated and other._calculated):
+            raise ValueError('Both PCAs must be run before they are merged')
+        if self._n_atoms != other._n_atoms:
+            raise ValueError('PCA has been fit for {0} atoms, the other PCA '
+                             'for {1} atoms'.format(self._n_atoms,
+                                                    other._n_atoms))
+        if (self._calc_mean != other._calc_mean or not self._calc_mean and
+                not np.allclose(self.mean, other.mean)):
+            raise ValueError('Both PCAs must use the same mean')
+        n_a, n_b = self._n_added, other._n_added
+        scatter_a = self.cov * (n_a - 1)
+        scatter_b = other.cov * (n_b - 1)
+        if self._calc_mean:
+            n, self.mean, scatter = _merge_moments(n_a, self.mean, scatter_a,
+                                                   n_b, other.mean, scatter_b)
+        else:
+            n, scatter = n_a + n_b, scatter_a + scatter_b
+        self._n_added = n
+        self.cov = scatter / (n - 1)
+        self._solve()
+        return self
+
     def transform(self, atomgroup, n_components=None, start=None, stop=None,
-                  step=None):
+                  step=None, chunksize=None, filename=None):
         """Apply the dimensionality reduction on a trajectory
 
+        Frames are read in chunks (with the bulk :meth:`timeseries` of the
+        DCD and in-memory readers) and each chunk is projected with a single
+        matrix product.
+
         Parameters
         ----------
         atomgroup: MDAnalysis atomgroup/ Universe
@@ -290,6 +354,14 @@ class PCA(AnalysisBase):
         step: int, optional
             Number of frames to skip over for PCA transform. Default: None
             becomes 1.
+        chunksize: int, optional
+            Number of frames projected at once. Default: None uses the
+            *chunksize* of the PCA.
+        filename: str, optional
+            If given, the projection is written to a ``.npy`` file of this
+            name through a memory map, which is returned instead of an
+            in-memory array (it can be opened again with
+            ``numpy.load(filename, mmap_mode='r')``). Default: None
 
         Returns
         -------
@@ -311,18 +383,82 @@ class PCA(AnalysisBase):
 
         traj = atomgroup.universe.trajectory
         start, stop, step = traj.check_slice_indices(start, stop, step)
-        n_frames = len(range(start, stop, step))
+        frames = np.arange(start, stop, step)
+        n_frames = len(frames)
 
-        dim = (n_components if n_components is not None else
-               self.p_components.shape[1])
+        components = self.p_components[:, :n_components]
+        dim = components.shape[1]
 
-        dot = np.zeros((n_frames, dim))
+        if filename is None:
+            dot = np.zeros((n_frames, dim))
+        else:
+            dot = np.lib.format.open_memmap(filename, mode='w+',
+                                            dtype=np.float64,
+                                            shape=(n_frames, dim))
+
+        chunksize = chunksize if chunksize is not None else self._chunksize
+        for i in range(0, n_frames, chunksize):
+            chunk = frames[i:i + chunksize]
+            xyz = _read_positions(atomgroup, int(chunk[0]), int(chunk[-1]),
+                                  step)
+            dot[i:i + len(chunk)] = np.dot(xyz - self.mean, components)
+
+        if filename is not None:
+            dot.flush()
+        return dot
 
-        for i, ts in enumerate(traj[start:stop:step]):
-            xyz = atomgroup.positions.ravel() - self.mean
-            dot[i] = np.dot(xyz, self.p_components[:, :n_components])
 
-        return dot
+def _read_positions(atomgroup, first, last, step):
+    """Positions of an atomgroup in the frames ``first, first + step, ...,
+    last`` (inclusive) as an array of shape (number of frames, n_atoms * 3).
+
+    The DCD and in-memory readers provide all frames in one call to their
+    :meth:`timeseries` method; for other readers the frames are iterated.
+    """
+    traj = atomgroup.universe.trajectory
+    fmt = getattr(traj, 'format', None)
+    if fmt == 'DCD' and step > 0:
+        xyz = traj.timeseries(atomgroup, start=first, stop=last + 1,
+                              step=step, format='fac')
+    elif fmt == 'MEMORY' and step > 0:
+        # stop is inclusive for the in-memory reader
+        xyz = traj.timeseries(atomgroup, start=first, stop=last, step=step,
+                              format='fac')
+    else:
+        stop = last + step
+        xyz = np.array([atomgroup.positions for ts in
+                        traj[first:stop if stop >= 0 else None:step]])
+    return xyz.reshape(len(xyz), -1)
+
+
+def _top_eigenpairs(cov, n_components=None):
+    """Largest eigenvalues and eigenvectors of a symmetric matrix.
+
+    Only *n_components* eigenpairs are calculated with the Lanczos method
+    (:func:`scipy.sparse.linalg.eigsh`) if scipy is available and only a
+    small part of the spectrum is requested; otherwise all of them are
+    calculated with :func:`numpy.linalg.eigh`.
+
+    Returns
+    -------
+    e_vals : array (n_components, )
+        eigenvalues in descending order
+    e_vects : array (n, n_components)
+        corresponding eigenvectors in the columns
+    """
+    n_dim = len(cov)
+    if n_components is not None and n_components < n_dim // 2:
+        try:
+            from scipy.sparse.linalg import eigsh
+        except ImportError:
+            pass
+        else:
+            e_vals, e_vects = eigsh(cov, k=n_components, which='LA')
+            sort_idx = np.argsort(e_vals)[::-1]
+            return e_vals[sort_idx], e_vects[:, sort_idx]
+    e_vals, e_vects = np.linalg.eigh(cov)
+    sort_idx = np.argsort(e_vals)[::-1][:n_components]
+    return e_vals[sort_idx], e_vects[:, sort_idx]
 
 
 def cosine_content(pca_space, i):
@@ -213,10 +213,14 @@ from six.moves import range, cPickle
 
 import numpy as np
 import warnings,numbers
+import ctypes
+import multiprocessing
+import time
 
 import MDAnalysis
 import MDAnalysis.analysis.align
 from MDAnalysis import NoDataError
+from MDAnalysis.lib.c_pathmetrics import hausdorff_sq, discrete_frechet_sq
 
 import os
 
@@ -329,6 +333,22 @@ def get_coord_axes(path):
     return N, axis
 
 
+def _flat_path(path):
+    """Return *path* as a C-contiguous (frames, 3N) array for the compiled
+    path metrics; ``float32`` paths are not converted."""
+    path = np.asarray(path)
+    dtype = np.float32 if path.dtype == np.float32 else np.float64
+    return np.ascontiguousarray(path.reshape(len(path), -1), dtype=dtype)
+
+
+def _common_dtype(P, Q):
+    """Flattened paths *P* and *Q* with the same dtype."""
+    P, Q = _flat_path(P), _flat_path(Q)
+    if P.dtype != Q.dtype:
+        P, Q = P.astype(np.float64), Q.astype(np.float64)
+    return P, Q
+
+
 def hausdorff(P, Q):
     r"""Calculate the Hausdorff distance between two paths.
 
@@ -361,11 +381,19 @@ def hausdorff(P, Q):
      4.7786639840135905
      >>> hausdorff(P,Q[::-1]) # hausdorff distance w/ reversed 2nd trajectory
      4.7786639840135905
+
+    Notes
+    -----
+    The distance is calculated with the early break algorithm of
+    :func:`MDAnalysis.lib.c_pathmetrics.hausdorff_sq`, which does not store
+    the matrix of all pairwise distances and usually only calculates a small
+    fraction of them.
+
+    .. versionchanged:: 0.16.0
+       Use the compiled early break algorithm.
     """
     N, axis = get_coord_axes(P)
-    d = get_msd_matrix(P, Q, axis=axis)
-    return ( max( np.amax(np.amin(d, axis=0)),                                  \
-                  np.amax(np.amin(d, axis=1)) ) / N  )**0.5
+    return (hausdorff_sq(*_common_dtype(P, Q)) / N)**0.5
 
 
 def hausdorff_wavg(P, Q):
@@ -517,41 +545,19 @@ def discrete_frechet(P, Q):
      4.7786639840135905
      >>> discrete_frechet(P,Q[::-1]) # frechet distance w/ 2nd trj reversed 2nd
      6.8429011177113832
-    """
-    N, axis = get_coord_axes(P)
-    Np, Nq = len(P), len(Q)
-    d = get_msd_matrix(P, Q, axis=axis)
-    ca = -np.ones((Np, Nq))
 
-    def c(i, j):
-        """Compute the coupling distance for two partial paths formed by *P* and
-        *Q*, where both begin at frame 0 and end (inclusive) at the respective
-        frame indices :math:`i-1` and :math:`j-1`. The partial path of *P* (*Q*)
-        up to frame *i* (*j*) is formed by the slicing ``P[0:i]`` (``Q[0:j]``).
+    Notes
+    -----
+    The coupling distances are calculated iteratively with
+    :func:`MDAnalysis.lib.c_pathmetrics.discrete_frechet_sq`, which only keeps
+    two rows of the coupling distance matrix in memory.
 
-        :func:`c` is called recursively to compute the coupling distance
-        between the two full paths *P* and *Q*  (i.e., the discrete Frechet
-        distance) in terms of coupling distances between their partial paths.
-
-        :Arguments:
-          *i*
-             int, partial path of *P* through final frame *i-1*
-          *j*
-             int, partial path of *Q* through final frame *j-1*
-
-        :Returns:
-          float, the coupling distance between partial paths ``P[0:i]`` and
-          ``Q[0:j]``
-        """
-        if ca[i,j] != -1 : return ca[i,j]
-        if i > 0:
-            if j > 0: ca[i,j] = max( min(c(i-1,j),c(i,j-1),c(i-1,j-1)), d[i,j] )
-            else:     ca[i,j] = max( c(i-1,0), d[i,0] )
-        elif j > 0:   ca[i,j] = max( c(0,j-1), d[0,j] )
-        else:         ca[i,j] = d[0,0]
-        return        ca[i,j]
-
-    return ( c(Np-1, Nq-1) / N )**0.5
+    .. versionchanged:: 0.16.0
+       Use a compiled iterative algorithm instead of memoized recursion, which
+       was limited by the maximum recursion depth.
+    """
+    N, axis = get_coord_axes(P)
+    return (discrete_frechet_sq(*_common_dtype(P, Q)) / N)**0.5
 
 
 def dist_mat_to_vec(N, i, j):
@@ -601,6 +607,90 @@ def dist_mat_to_vec(N, i, j):
         raise ValueError(err_str)
 
 
+_worker_state = {}
+
+
+def _share_paths(paths):
+    """Copy *paths* into one block of shared memory.
+
+    :Returns:
+      ``(buffer, dtype, offsets, shapes)``, which are turned back into
+      arrays with :func:`_shared_paths`
+    """
+    dtype = np.result_type(*paths)
+    offsets = np.cumsum([0] + [path.size for path in paths])
+    buf = multiprocessing.RawArray(ctypes.c_char,
+                                   max(1, int(offsets[-1]) * dtype.itemsize))
+    data = np.frombuffer(buf, dtype=dtype)
+    for path, offset in zip(paths, offsets):
+        data[offset:offset + path.size] = path.ravel()
+    return buf, dtype.str, offsets, [path.shape for path in paths]
+
+
+def _shared_paths(buf, dtype, offsets, shapes):
+    """Views of the paths in a buffer filled by :func:`_share_paths`."""
+    data = np.frombuffer(buf, dtype=dtype)
+    return [data[offset:offset + int(np.prod(shape))].reshape(shape)
+            for offset, shape in zip(offsets, shapes)]
+
+
+def _init_pair_worker(shared, task, param):
+    _worker_state['paths'] = _shared_paths(*shared)
+    _worker_state['task'] = task
+    _worker_state['param'] = param
+
+
+def _run_pair(pair):
+    return _worker_state['task'](_worker_state['paths'],
+                                 _worker_state['param'], pair)
+
+
+def _pair_distance(paths, metric, pair):
+    """Distance of the pair ``(k, i, j)`` of *paths*."""
+    k, i, j = pair
+    return k, metric(paths[i], paths[j])
+
+
+def _pair_neighbors(paths, npaths, pair):
+    """Nearest neighbors and Hausdorff pair of the pair ``(k, i, j)``."""
+    k, i, j = pair
+    pp = PSAPair(i, j, npaths)
+    pp.compute_nearest_neighbors(paths[i], paths[j], npaths)
+    pp.find_hausdorff_pair()
+    return k, pp
+
+
+def _map_pairs(task, pairs, paths, param, nproc=1):
+    """Iterate over ``task(paths, param, pair)`` for all *pairs*.
+
+    With *nproc* > 1 the pairs are distributed over a
+    :class:`multiprocessing.Pool` whose workers share one copy of the paths;
+    the results are then yielded in the order in which they are completed.
+    """
+    if nproc == 1 or len(pairs) < 2:
+        for pair in pairs:
+            yield task(paths, param, pair)
+        return
+    pool = multiprocessing.Pool(min(nproc, len(pairs)), _init_pair_worker,
+                                (_share_paths(paths), task, param))
+    try:
+        for result in pool.imap_unordered(_run_pair, pairs):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _pairs(npaths, done=None):
+    """All pairs ``(k, i, j)`` of paths with ``i < j`` in distance vector
+    order *k*, without the pairs for which *done* is ``True``."""
+    rows, cols = np.triu_indices(npaths, 1)
+    pairs = zip(range(len(rows)), rows.tolist(), cols.tolist())
+    if done is None:
+        return list(pairs)
+    return [pair for pair in pairs if not done[pair[0]]]
+
+
 class Path(object):
     """Pre-process a :class:`MDAnalysis.Universe` object: (1) fit the
     trajectory to a reference structure, (2) convert fitted time series to a
@@ -1269,31 +1359,90 @@ class PSAnalysis(object):
              boolean; if ``True`` then writes :attr:`PSAnalysis.D` to text and
              compressed npz (numpy) files [``True``]
           *filename*
-             string, filename to save :attr:`PSAnalysis.D`
+             string, filename to save :attr:`PSAnalysis.D`; by default the
+             name of the *metric* (or of the *metric* function)
+          *nproc*
+             number of processes that compare pairs of paths in parallel; the
+             paths are shared between the processes and a *metric* function
+             must be defined at the top level of a module [1]
+          *resume*
+             boolean; if ``True`` then only the pairs of paths that are
+             missing in the distances of an interrupted run (with the same
+             *filename*) are compared [``False``]
+
+        With *store*, the distance of every compared pair of paths is written
+        immediately to the memory mapped, condensed distance vector
+        "*filename*_partial.npy" in the "/distance_matrices" subdirectory of
+        :attr:`PSAnalysis.targetdir`, where missing distances are ``NaN``. The
+        file is removed once all pairs have been compared.
+
+        .. versionchanged:: 0.16.0
+           Added *nproc* and *resume*.
         """
         metric = kwargs.pop('metric', 'hausdorff')
         start = kwargs.pop('start', None)
         stop = kwargs.pop('stop', None)
         step = kwargs.pop('step', None)
         store = kwargs.pop('store', True)
+        filename = kwargs.pop('filename',
+                              str(getattr(metric, '__name__', metric)))
+        nproc = kwargs.pop('nproc', 1)
+        resume = kwargs.pop('resume', False)
 
         if type(metric) is str:
             metric_func = get_path_metric_func(metric)
         else:
             metric_func = metric
         numpaths = self.npaths
-        D = np.zeros((numpaths,numpaths))
-
-        for i in range(0, numpaths-1):
-            for j in range(i+1, numpaths):
-                P = self.paths[i][start:stop:step]
-                Q = self.paths[j][start:stop:step]
-                D[i,j] = metric_func(P, Q)
-                D[j,i] = D[i,j]
+        npairs = numpaths * (numpaths - 1) // 2
+        paths = [path[start:stop:step] for path in self.paths]
+
+        if store:
+            partial = self._partial_distances(filename, npairs, resume)
+        else:
+            partial = np.empty(npairs)
+            partial.fill(np.nan)
+        pairs = _pairs(numpaths, done=~np.isnan(partial))
+        if len(pairs) < npairs:
+            logger.info("Resuming with %d of %d pairs of paths", len(pairs),
+                        npairs)
+
+        flushed = time.time()
+        for k, distance in _map_pairs(_pair_distance, pairs, paths,
+                                      metric_func, nproc):
+            partial[k] = distance
+            if store and time.time() - flushed > 1.:
+                partial.flush()
+                flushed = time.time()
+
+        D = np.zeros((numpaths, numpaths))
+        D[np.triu_indices(numpaths, 1)] = partial
+        D += D.T
         self.D = D
         if store:
-            filename = kwargs.pop('filename', str(metric))
             self.save_result(filename=filename)
+            del partial
+            os.remove(self._partial_filename(filename))
+
+    def _partial_filename(self, filename):
+        head = self.targetdir + self.datadirs['distance_matrices']
+        return os.path.join(head, filename + '_partial.npy')
+
+    def _partial_distances(self, filename, npairs, resume=False):
+        """Memory mapped condensed distances of a (partial) run."""
+        partial_file = self._partial_filename(filename)
+        if resume and os.path.exists(partial_file):
+            partial = np.load(partial_file, mmap_mode='r+')
+            if partial.shape == (npairs,):
+                return partial
+            warnings.warn("Distances in {0} do not match the number of pairs "
+                          "of paths; starting over".format(partial_file))
+            del partial
+        partial = np.lib.format.open_memmap(partial_file, mode='w+',
+                                            dtype=np.float64, shape=(npairs,))
+        partial[:] = np.nan
+        partial.flush()
+        return partial
 
 
     def run_pairs_analysis(self, **kwargs):
@@ -1320,30 +1469,33 @@ class PSAnalysis(object):
           *hausdorff_pairs*
              boolean; if ``True``, then stores dictionary of Hausdorff pair
              frames/distances in :attr:`PSAnalysis.HP` [``False``]
+          *nproc*
+             number of processes that compare pairs of paths in parallel [1]
+
+        .. versionchanged:: 0.16.0
+           Added *nproc*.
         """
         start = kwargs.pop('start', None)
         stop = kwargs.pop('stop', None)
         step = kwargs.pop('step', None)
         neighbors = kwargs.pop('neighbors', False)
         hausdorff_pairs = kwargs.pop('hausdorff_pairs', False)
+        nproc = kwargs.pop('nproc', 1)
 
         numpaths = self.npaths
         self._NN = [] # list of nearest neighbors pairs
         self._HP = [] # list of Hausdorff pairs
-        self._psa_pairs = [] # list of PSAPairs
-
-        for i in range(0, numpaths-1):
-            for j in range(i+1, numpaths):
-                pp = PSAPair(i, j, numpaths)
-                P = self.paths[i][start:stop:step]
-                Q = self.paths[j][start:stop:step]
-                pp.compute_nearest_neighbors(P, Q, self.natoms)
-                pp.find_hausdorff_pair()
-                self._psa_pairs.append(pp)
-                if neighbors:
-                    self._NN.append(pp.get_nearest_neighbors())
-                if hausdorff_pairs:
-                    self._HP.append(pp.get_hausdorff_pair())
+        self._psa_pairs = [None] * (numpaths * (numpaths - 1) // 2)
+
+        paths = [path[start:stop:step] for path in self.paths]
+        for k, pp in _map_pairs(_pair_neighbors, _pairs(numpaths), paths,
+                                numpaths, nproc):
+            self._psa_pairs[k] = pp
+        for pp in self._psa_pairs:
+            if neighbors:
+                self._NN.append(pp.get_nearest_neighbors())
+            if hausdorff_pairs:
+                self._HP.append(pp.get_hausdorff_pair())
 
 
     def save_result(self, filename=None):
@@ -32,7 +32,6 @@ Tools for calculating pair distribution functions
 """
 import numpy as np
 
-from ..lib.util import blocks_of
 from ..lib import distances
 from .base import AnalysisBase
 
@@ -80,8 +79,15 @@ class InterRDF(AnalysisBase):
     The `exclusion_block` keyword allows the masking of pairs from
     within the same molecule.  For example, if there are 7 of each
     atom in each molecule, the exclusion mask (7, 7) can be used.
+    A pair of atoms ``i`` (in `g1`) and ``j`` (in `g2`) is excluded
+    when ``i // 7 == j // 7``.
 
     .. versionadded:: 0.13.0
+
+    .. versionchanged:: 0.16.0
+       Distances are only computed for pairs within the upper *range*
+       limit, using a cell list, and histogrammed directly; the full
+       ``len(g1) x len(g2)`` distance matrix is no longer allocated.
     """
     def __init__(self, g1, g2,
                  nbins=75, range=(0.0, 15.0), exclusion_block=None,
@@ -107,26 +113,20 @@ class InterRDF(AnalysisBase):
         # Need to know average volume
         self.volume = 0.0
 
-        # Allocate a results array which we will reuse
-        self._result = np.zeros((len(self.g1), len(self.g2)), dtype=np.float64)
-        # If provided exclusions, create a mask of _result which
-        # lets us take these out
-        if self._exclusion_block is not None:
-            self._exclusion_mask = blocks_of(self._result,
-                                             *self._exclusion_block)
-            self._maxrange = self.rdf_settings['range'][1] + 1.0
-        else:
-            self._exclusion_mask = None
-
     def _single_frame(self):
-        distances.distance_array(self.g1.positions, self.g2.positions,
-                                 box=self.u.dimensions, result=self._result)
-        # Maybe exclude same molecule distances
-        if self._exclusion_mask is not None:
-            self._exclusion_mask[:] = self._maxrange
+        # Only pairs closer than the upper range limit can contribute, so
+        # they are found with a cell list and histogrammed chunk by chunk
+        # instead of filling a len(g1) x len(g2) distance matrix.
+        for pairs, dist in distances.iter_capped_distance(
+                self.g1.positions, self.g2.positions,
+                self.rdf_settings['range'][1], box=self.u.dimensions):
+            # Maybe exclude same molecule distances
+            if self._exclusion_block is not None:
+                xA, xB = self._exclusion_block
+                dist = dist[pairs[:, 0] // xA != pairs[:, 1] // xB]
 
-        count = np.histogram(self._result, **self.rdf_settings)[0]
-        self.count += count
+            count = np.histogram(dist, **self.rdf_settings)[0]
+            self.count += count
 
         self.volume += self._ts.volume
 
@@ -153,3 +153,139 @@ class InterRDF(AnalysisBase):
         rdf = self.count / (density * vol * self.n_frames)
 
         self.rdf = rdf
+
+
+class InterRDF_s(AnalysisBase):
+    """Many intermolecular pair distribution functions in one pass
+
+    InterRDF_s(u, ags, nbins=75, range=(0.0, 15.0), sites=False)
+
+    Arguments
+    ---------
+    u
+      Universe the AtomGroups belong to
+    ags
+      A list of (g1, g2) pairs of AtomGroups; one RDF is calculated
+      for each pair
+
+    Keywords
+    --------
+    nbins
+          Number of bins in the histograms [75]
+    range
+          The size of the RDFs [0.0, 15.0]
+    sites
+          If ``True``, calculate site-resolved RDFs, i.e. one RDF for
+          each combination of an atom in g1 with an atom in g2 [False]
+    start
+          The frame to start at [0]
+    stop
+          The frame to end at [-1]
+    step
+          The step size through the trajectory in frames [0]
+
+    Example
+    -------
+    All RDFs are obtained from a single loop over the trajectory
+
+      rdf = InterRDF_s(u, [(na, ow), (cl, ow), (ow, ow)])
+      rdf.run()
+
+    Results are available through the .bins and .rdf attributes, where
+    .rdf (and .count) is a list with one entry per pair of AtomGroups
+
+      plt.plot(rdf.bins, rdf.rdf[0])
+
+    Each entry has shape (nbins,), or (len(g1), len(g2), nbins) with
+    `sites` set, so that ``rdf.rdf[0][i, j]`` is the RDF between atom
+    ``g1[i]`` and atom ``g2[j]``.
+
+    Notes
+    -----
+    In each frame a single capped neighbor search is done over the union
+    of all atoms in `ags`, and the resulting pair distances are scattered
+    into the histograms of all pairs of AtomGroups. The cost thus scales
+    with the size of the union rather than with the number of RDFs.
+
+
+    .. versionadded:: 0.16.0
+    """
+    def __init__(self, u, ags,
+                 nbins=75, range=(0.0, 15.0), sites=False, **kwargs):
+        super(InterRDF_s, self).__init__(u.trajectory, **kwargs)
+        self.u = u
+        self._ags = [(g1, g2) for g1, g2 in ags]
+        self._sites = sites
+
+        self.rdf_settings = {'bins': nbins,
+                             'range': range}
+
+    def _prepare(self):
+        edges = np.histogram([-1], **self.rdf_settings)[1]
+        self.edges = edges
+        self.bins = 0.5 * (edges[:-1] + edges[1:])
+        nbins = len(self.bins)
+
+        # Positions are taken for the union of all atoms; for every pair
+        # of groups, map union indices to the positions in g1 and g2 (or -1)
+        self._ix = np.unique(np.concatenate(
+            [g.ix for pair in self._ags for g in pair]))
+        self._union = self.u.atoms[self._ix]
+        self._lookup = []
+        self.count = []
+        for g1, g2 in self._ags:
+            lookup = []
+            for g in (g1, g2):
+                l = np.full(len(self._ix), -1, dtype=np.int64)
+                l[np.searchsorted(self._ix, g.ix)] = np.arange(len(g))
+                lookup.append(l)
+            self._lookup.append(lookup)
+            if self._sites:
+                self.count.append(np.zeros((len(g1), len(g2), nbins)))
+            else:
+                self.count.append(np.zeros(nbins))
+
+        self.volume = 0.0
+
+    def _single_frame(self):
+        rmin, rmax = self.rdf_settings['range']
+        nbins = self.rdf_settings['bins']
+        width = (rmax - rmin) / float(nbins)
+        pos = self._union.positions
+
+        for pairs, dist in distances.iter_capped_distance(
+                pos, pos, rmax, box=self.u.dimensions):
+            inside = dist >= rmin
+            pairs, dist = pairs[inside], dist[inside]
+            # the upper edge belongs to the last bin, as in np.histogram
+            b = np.minimum(((dist - rmin) / width).astype(np.int64),
+                           nbins - 1)
+
+            for (l1, l2), count in zip(self._lookup, self.count):
+                i = l1[pairs[:, 0]]
+                j = l2[pairs[:, 1]]
+                keep = (i >= 0) & (j >= 0)
+                if not keep.any():
+                    continue
+                if self._sites:
+                    flat = (i[keep] * count.shape[1] + j[keep]) * nbins
+                    np.add.at(count.reshape(-1), flat + b[keep], 1)
+                else:
+                    count += np.bincount(b[keep], minlength=nbins)
+
+        self.volume += self._ts.volume
+
+    def _conclude(self):
+        # Volume in each radial shell
+        vol = np.power(self.edges[1:], 3) - np.power(self.edges[:-1], 3)
+        vol *= 4/3.0 * np.pi
+
+        # Average number density
+        box_vol = self.volume / self.n_frames
+
+        self.rdf = []
+        for (g1, g2), count in zip(self._ags, self.count):
+            # site-resolved RDFs are normalised per pair of atoms
+            N = 1 if self._sites else len(g1) * len(g2)
+            density = N / box_vol
+            self.rdf.append(count / (density * vol * self.n_frames))
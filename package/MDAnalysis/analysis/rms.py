@@ -32,10 +32,12 @@ Calculating root mean square quantities --- :mod:`MDAnalysis.analysis.rms`
    Added :class:`RMSF` analysis.
 .. versionchanged:: 0.16.0
    Refactored RMSD to fit AnalysisBase API
+   Added :class:`PairwiseRMSD` analysis.
 
 The module contains code to analyze root mean square quantities such
-as the coordinat root mean square distance (:class:`RMSD`) or the
-per-residue root mean square fluctuations (:class:`RMSF`).
+as the coordinat root mean square distance (:class:`RMSD`), the RMSD
+between all pairs of frames (:class:`PairwiseRMSD`) or the per-residue root
+mean square fluctuations (:class:`RMSF`).
 
 This module uses the fast QCP algorithm [Theobald2005]_ to calculate
 the root mean square distance (RMSD) between two coordinate sets (as
@@ -120,6 +122,16 @@ Analysis classes
       Results are stored in this N×3 :class:`numpy.ndarray` array,
       (frame, time (ps), RMSD (Å)).
 
+.. autoclass:: PairwiseRMSD
+   :members:
+
+   .. attribute:: rmsd
+
+      Results are stored in this :class:`numpy.ndarray` array (or
+      :class:`numpy.memmap` if a *filename* was given) of length
+      ``n_frames * (n_frames - 1) / 2``, the condensed upper triangle of the
+      matrix of RMSDs between all pairs of frames.
+
 .. autoclass:: RMSF
    :members:
 
@@ -130,16 +142,18 @@ Analysis classes
 
 """
 
-from six.moves import zip
+from six.moves import zip, range
 import numpy as np
 import logging
+import multiprocessing
 import warnings
 
 
+import MDAnalysis
 import MDAnalysis.lib.qcprot as qcp
-from MDAnalysis.analysis.base import AnalysisBase
+from MDAnalysis.analysis.base import AnalysisBase, _merge_moments
 from MDAnalysis.exceptions import SelectionError, NoDataError
-from MDAnalysis.lib.log import ProgressMeter, _set_verbose
+from MDAnalysis.lib.log import _set_verbose
 from MDAnalysis.lib.util import asiterable
 
 
@@ -533,7 +547,128 @@ class RMSD(AnalysisBase):
         return filename
 
 
-class RMSF(object):
+class PairwiseRMSD(AnalysisBase):
+    """Class to calculate the RMSD between all pairs of frames of a trajectory.
+
+    Run the analysis with :meth:`PairwiseRMSD.run`, which stores the results
+    in the condensed upper triangle :attr:`PairwiseRMSD.rmsd` of the
+    symmetric frame-by-frame RMSD matrix (in the order of
+    :func:`scipy.spatial.distance.pdist`, so that
+    :func:`scipy.spatial.distance.squareform` returns the full matrix).
+
+    The coordinates of the selection are read once for all analysed frames.
+    The matrix is then calculated in tiles of *block_size* x *block_size*
+    frames, which are small enough to stay in the CPU cache. With
+    superposition, the RMSDs of all pairs of frames in a tile are calculated
+    in parallel with the batched QCP algorithm [Theobald2005]_ of
+    :func:`MDAnalysis.lib.qcprot.BatchCalcRMSDRotationalMatrix`; the number
+    of threads can be set with the environment variable
+    :envvar:`OMP_NUM_THREADS`. When a *filename* is given, the condensed
+    matrix is written to a memory-mapped ``.npy`` file instead of being kept
+    in memory, which makes the analysis of tens of thousands of frames
+    possible.
+
+    .. versionadded:: 0.16.0
+    """
+
+    def __init__(self, atomgroup, select='all', superposition=True,
+                 mass_weighted=False, block_size=None, filename=None,
+                 **kwargs):
+        """Setting up the pairwise RMSD analysis.
+
+        Parameters
+        ----------
+        atomgroup : :class:`~MDAnalysis.core.groups.AtomGroup` or
+                    :class:`~MDAnalysis.core.universe.Universe`
+            MDAnalysis `AtomGroup` or `Universe` with an associated trajectory
+        select : str (optional)
+            selection string for the atoms that are compared
+        superposition : bool (optional)
+            calculate the minimum RMSD after an optimal translational and
+            rotational superposition of each pair of frames; otherwise the
+            RMSD of the coordinates as they are is calculated
+        mass_weighted : bool (optional)
+            weight atoms by their masses
+        block_size : int (optional)
+            number of frames in each tile of the RMSD matrix; by default
+            the coordinates in two tiles take about 1 MB
+        filename : str (optional)
+            write the condensed RMSD matrix to the ``.npy`` file *filename*
+            through a memory map; :attr:`rmsd` is then a
+            :class:`numpy.memmap` of this file
+        """
+        super(PairwiseRMSD, self).__init__(atomgroup.universe.trajectory,
+                                           **kwargs)
+        self.atoms = atomgroup.select_atoms(select)
+        if self.atoms.n_atoms == 0:
+            raise SelectionError("Selection {0!r} contains no atoms".format(
+                select))
+        self.superposition = superposition
+        self.mass_weighted = mass_weighted
+        if block_size is None:
+            block_size = max(16, 2**20 // (2 * 12 * self.atoms.n_atoms))
+        self.block_size = block_size
+        self.filename = filename
+        self.rmsd = None
+
+    def _prepare(self):
+        self._weights = ((self.atoms.masses / self.atoms.masses.mean()
+                          ).astype(np.float64)
+                         if self.mass_weighted else None)
+        self._positions = np.empty((self.n_frames, self.atoms.n_atoms, 3),
+                                   dtype=np.float32)
+
+    def _single_frame(self):
+        self._positions[self._frame_index] = self.atoms.positions
+
+    def _conclude(self):
+        n_frames = self.n_frames
+        size = n_frames * (n_frames - 1) // 2
+        if self.filename is not None:
+            self.rmsd = np.lib.format.open_memmap(
+                self.filename, mode='w+', dtype=np.float64, shape=(size,))
+        else:
+            self.rmsd = np.empty(size, dtype=np.float64)
+
+        block = self.block_size
+        for start in range(0, n_frames, block):
+            stop = min(start + block, n_frames)
+            # RMSDs of frames start:stop with all later frames, tile by tile
+            rows = np.empty((stop - start, n_frames - start))
+            for col in range(start, n_frames, block):
+                rows[:, col - start:col - start + block] = self._tile(
+                    start, stop, col, min(col + block, n_frames))
+            # the rest of each row is contiguous in the condensed matrix
+            for i in range(start, stop):
+                offset = i * n_frames - i * (i + 1) // 2
+                self.rmsd[offset:offset + n_frames - i - 1] = \
+                    rows[i - start, i - start + 1:]
+        if self.filename is not None:
+            self.rmsd.flush()
+        del self._positions
+
+    def _tile(self, start, stop, col_start, col_stop):
+        """RMSDs between frames start:stop and col_start:col_stop"""
+        rows = self._positions[start:stop]
+        cols = self._positions[col_start:col_stop]
+        if self.superposition:
+            return qcp.BatchCalcRMSDRotationalMatrix(rows, cols,
+                                                     weights=self._weights)
+        # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b for all pairs with one product
+        n_atoms = rows.shape[1]
+        rows = rows.reshape(len(rows), -1).astype(np.float64)
+        cols = cols.reshape(len(cols), -1).astype(np.float64)
+        if self._weights is not None:
+            scale = np.repeat(np.sqrt(self._weights), 3)
+            rows *= scale
+            cols *= scale
+        squared = (np.einsum('ij,ij->i', rows, rows)[:, np.newaxis] +
+                   np.einsum('ij,ij->i', cols, cols)[np.newaxis, :] -
+                   2 * np.dot(rows, cols.T))
+        return np.sqrt(np.clip(squared, 0, None) / n_atoms)
+
+
+class RMSF(AnalysisBase):
     """Class to perform RMSF analysis on a set of atoms across a trajectory.
 
     Run the analysis with :meth:`RMSF.run`, which stores the results
@@ -542,30 +677,36 @@ class RMSF(object):
     This class performs no coordinate transforms; RMSFs are obtained from atom
     coordinates as-is.
 
+    The mean and the sum of squared deviations of the positions are
+    accumulated in a single pass over the trajectory with Welford's algorithm
+    [Welford1962]_. Accumulators of different parts of the trajectory are
+    combined with the pairwise update of Chan et al. [Chan1979]_ (see
+    :meth:`RMSF.merge`), which is used to analyse blocks of frames in
+    *nproc* parallel processes. Trajectories in memory
+    (:class:`~MDAnalysis.coordinates.memory.MemoryReader`) are analysed in
+    vectorized chunks of frames instead of frame by frame.
+
     .. versionadded:: 0.11.0
+    .. versionchanged:: 0.16.0
+       Use the :class:`~MDAnalysis.analysis.base.AnalysisBase` API, with
+       the frames given to the constructor; added *grouping* and *nproc*
+       and :meth:`RMSF.merge`.
     """
 
-    def __init__(self, atomgroup):
+    def __init__(self, atomgroup, grouping='atoms', nproc=1, **kwargs):
         """Calculate RMSF of given atoms across a trajectory.
 
         Parameters
         ----------
         atomgroup : mda.AtomGroup
-                AtomGroup to obtain RMSF for
-
-        """
-        self.atomgroup = atomgroup
-        self._rmsf = None
-
-    def run(self, start=None, stop=None, step=None, progout=10,
-            verbose=None, quiet=None):
-        """Calculate RMSF of given atoms across a trajectory.
-
-        This method implements an algorithm for computing sums of squares while
-        avoiding overflows and underflows [Welford1962]_.
-
-        Parameters
-        ----------
+            AtomGroup to obtain RMSF for
+        grouping : str {'atoms', 'residues'} (optional)
+            calculate the RMSF of each atom or of each residue; the RMSF of a
+            residue is the root of the mean square fluctuation of its atoms
+            in *atomgroup*
+        nproc : int (optional)
+            number of processes that analyse blocks of frames in parallel;
+            with *nproc* > 1 the universe must have been loaded from files
         start : int (optional)
             starting frame, default None becomes 0.
         stop : int (optional)
@@ -574,46 +715,80 @@ class RMSF(object):
             which means that the trajectory would be read until the end.
         step : int (optional)
             step between frames, default None becomes 1.
-        progout : int (optional)
-            number of frames to iterate through between updates to progress
-            output; ``None`` for no updates [10]
         verbose : bool (optional)
-            if ``False``, suppress all output (implies *progout* = ``None``)
-            [``True``]
+            Show detailed progress of the calculation if set to ``True``
 
         References
         ----------
         .. [Welford1962] B. P. Welford (1962). "Note on a Method for
            Calculating Corrected Sums of Squares and Products." Technometrics
            4(3):419-420.
+        .. [Chan1979] T. F. Chan, G. H. Golub and R. J. LeVeque (1979).
+           "Updating Formulae and a Pairwise Algorithm for Computing Sample
+           Variances." Technical Report STAN-CS-79-773, Stanford University.
+        """
+        super(RMSF, self).__init__(atomgroup.universe.trajectory, **kwargs)
+        if grouping not in ('atoms', 'residues'):
+            raise ValueError("grouping must be 'atoms' or 'residues', not "
+                             "{0!r}".format(grouping))
+        self.atomgroup = atomgroup
+        self.grouping = grouping
+        self.nproc = nproc
+        self._rmsf = None
+
+    def run(self, start=None, stop=None, step=None, progout=None,
+            verbose=None, quiet=None):
+        """Calculate RMSF of given atoms across a trajectory.
 
         .. deprecated:: 0.16
-           The keyword argument *quiet* is deprecated in favor of *verbose*.
+           The keyword arguments are deprecated; pass *start*, *stop*,
+           *step* and *verbose* to :class:`RMSF` instead. *progout* is
+           ignored.
         """
-        traj = self.atomgroup.universe.trajectory
-        start, stop, step = traj.check_slice_indices(start, stop, step)
-        sumsquares = np.zeros((self.atomgroup.n_atoms, 3))
-        means = np.array(sumsquares)
-
-        verbose = _set_verbose(verbose, quiet, default=True)
-        if not verbose:
-            progout = None
-
-        # set up progress output
-        if progout:
-            percentage = ProgressMeter(self.atomgroup.universe.trajectory.n_frames,
-                                       interval=progout)
+        if any(arg is not None for arg in
+               (start, stop, step, progout, verbose, quiet)):
+            warnings.warn("Setting the frames or the verbosity in RMSF.run() "
+                          "is deprecated; use the keyword arguments of RMSF "
+                          "instead.", DeprecationWarning)
+            self._verbose = _set_verbose(verbose, quiet, default=False)
+            self._quiet = not self._verbose
+            self._setup_frames(self._trajectory, start, stop, step)
+
+        first, _, step = self._trajectory.check_slice_indices(
+            self.start, self.stop, self.step)
+        if self.nproc > 1 and self.n_frames > 1:
+            self._prepare()
+            self._pooled_moments(first, step)
+        elif getattr(self._trajectory, 'format', None) == 'MEMORY' and step > 0:
+            self._prepare()
+            self._memory_moments(first, step)
         else:
-            percentage = ProgressMeter(self.atomgroup.universe.trajectory.n_frames,
-                                       verbose=False)
-
-        for k, ts in enumerate(self.atomgroup.universe.trajectory[start:stop:step]):
-            sumsquares += (k/(k + 1.0)) * (self.atomgroup.positions - means)**2
-            means = (k * means + self.atomgroup.positions)/(k + 1)
+            return super(RMSF, self).run()
+        self._conclude()
+        return self
 
-            percentage.echo(ts.frame)
+    def _prepare(self):
+        self._count = 0
+        self._mean = np.zeros((self.atomgroup.n_atoms, 3))
+        self._sumsquares = np.zeros((self.atomgroup.n_atoms, 3))
 
-        rmsf = np.sqrt(sumsquares.sum(axis=1)/(k + 1))
+    def _single_frame(self):
+        # Welford update with the positions of the current frame
+        self._count += 1
+        delta = self.atomgroup.positions - self._mean
+        self._mean += delta / self._count
+        self._sumsquares += delta * (self.atomgroup.positions - self._mean)
+
+    def _conclude(self):
+        if self._count == 0:
+            raise NoDataError("No frames were analysed")
+        msf = self._sumsquares.sum(axis=1) / self._count
+        if self.grouping == 'residues':
+            _, residues = np.unique(self.atomgroup.resindices,
+                                    return_inverse=True)
+            msf = (np.bincount(residues, weights=msf) /
+                   np.bincount(residues))
+        rmsf = np.sqrt(msf)
 
         if not (rmsf >= 0).all():
             raise ValueError("Some RMSF values negative; overflow " +
@@ -621,9 +796,86 @@ class RMSF(object):
 
         self._rmsf = rmsf
 
+    def _add_moments(self, count, mean, sumsquares):
+        """Combine the accumulators with those of another set of frames."""
+        self._count, self._mean, self._sumsquares = _merge_moments(
+            self._count, self._mean, self._sumsquares,
+            count, mean, sumsquares)
+
+    def _memory_moments(self, first, step, chunksize=256):
+        """Accumulate chunks of frames of a trajectory in memory."""
+        for chunk in range(0, self.n_frames, chunksize):
+            n = min(chunksize, self.n_frames - chunk)
+            start = first + chunk * step
+            # stop is inclusive for the in-memory reader
+            xyz = self._trajectory.timeseries(
+                self.atomgroup, start=start, stop=start + (n - 1) * step,
+                step=step, format='fac').astype(np.float64)
+            mean = xyz.mean(axis=0)
+            self._add_moments(n, mean, np.square(xyz - mean).sum(axis=0))
+
+    def _pooled_moments(self, first, step):
+        """Accumulate blocks of frames in parallel processes."""
+        universe = self.atomgroup.universe
+        filename = getattr(self._trajectory, 'filenames',
+                           getattr(self._trajectory, 'filename', None))
+        if universe.filename is None or filename is None:
+            raise ValueError("nproc > 1 requires a universe read from files")
+        frames = np.arange(self.n_frames) * step + first
+        blocks = []
+        for block in np.array_split(frames, self.nproc):
+            if len(block):
+                # the frame after the block; None runs a negative step to
+                # the first frame
+                stop = int(block[-1]) + step
+                blocks.append((universe.filename, filename,
+                               self.atomgroup.indices, int(block[0]),
+                               stop if stop >= 0 else None, step))
+        pool = multiprocessing.Pool(len(blocks))
+        try:
+            for moments in pool.map(_rmsf_block, blocks):
+                self._add_moments(*moments)
+        finally:
+            pool.close()
+            pool.join()
+
+    def merge(self, other):
+        """Add the frames analysed by another :class:`RMSF` of the same atoms.
+
+        The accumulated means and squared deviations are combined as if
+        both sets of frames had been analysed together, and :attr:`rmsf` is
+        updated.
+
+        Parameters
+        ----------
+        other : RMSF
+            RMSF analysis of the same atoms that has been run
+
+        Returns
+        -------
+        self
+        """
+        if other.atomgroup.n_atoms != self.atomgroup.n_atoms:
+            raise ValueError("Cannot merge RMSF analyses of different atoms")
+        if other._rmsf is None:
+            raise NoDataError("Other RMSF analysis has not been run")
+        if self._rmsf is None:
+            self._prepare()
+        self._add_moments(other._count, other._mean, other._sumsquares)
+        self._conclude()
+        return self
+
     @property
     def rmsf(self):
         """RMSF data; only available after using :meth:`RMSF.run`
 
         """
         return self._rmsf
+
+
+def _rmsf_block(args):
+    """Accumulators of the RMSF of the atoms *indices* in a block of frames."""
+    topology, trajectory, indices, start, stop, step = args
+    universe = MDAnalysis.Universe(topology, trajectory)
+    R = RMSF(universe.atoms[indices], start=start, stop=stop, step=step).run()
+    return R._count, R._mean, R._sumsquares
@@ -372,14 +372,177 @@ Classes
 
 
 """
-from __future__ import print_function
+from __future__ import print_function, division
 from six.moves import range, zip_longest
 
-import numpy as np
+import ctypes
 import multiprocessing
 
+import numpy as np
+
+import MDAnalysis
 import MDAnalysis.analysis.hbonds
-from MDAnalysis.lib.log import _set_verbose
+from MDAnalysis.analysis.hbonds.hbond_autocorrel import hbond_existence
+
+
+def _frame_blocks(n_frames, n_blocks):
+    """Partition ``range(n_frames)`` into at most *n_blocks* contiguous blocks.
+
+    :Returns: list of ``(start, stop)`` tuples
+    """
+    bounds = np.linspace(0, n_frames, min(n_blocks, n_frames) + 1)
+    bounds = bounds.astype(int).tolist()
+    return [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])
+            if stop > start]
+
+
+def _shared_array(shape, dtype):
+    """Allocate a zero-initialised array in shared memory.
+
+    The returned ``(RawArray, shape, dtype)`` tuple can be handed to worker
+    processes; :func:`_as_array` gives a numpy view of it.
+    """
+    dtype = np.dtype(dtype)
+    size = int(np.prod(shape)) * dtype.itemsize
+    raw = multiprocessing.RawArray(ctypes.c_char, max(size, 1))
+    return raw, tuple(shape), dtype.str
+
+
+def _as_array(shared):
+    """Numpy view of an array allocated with :func:`_shared_array`."""
+    raw, shape, dtype = shared
+    return np.frombuffer(raw, dtype=dtype,
+                         count=int(np.prod(shape))).reshape(shape)
+
+
+#: state of a pool worker process, set up by :func:`_init_worker`
+_worker_state = {}
+
+
+def _init_worker(topology, trajectory, shared):
+    _worker_state['universe'] = MDAnalysis.Universe(topology, trajectory)
+    _worker_state['arrays'] = dict((name, _as_array(array))
+                                   for name, array in shared.items())
+
+
+def _run_block(args):
+    task, block, params = args
+    return task(_worker_state['universe'], _worker_state['arrays'], block,
+                **params)
+
+
+def _pooled_run(universe, task, n_frames, nproc=1, shared=None, **params):
+    """Run *task* over the first *n_frames* frames of *universe*.
+
+    The frames are partitioned into one contiguous block per process and
+    ``task(universe, arrays, (start, stop), **params)`` is called for each
+    block, where *arrays* are numpy views of the *shared* arrays (see
+    :func:`_shared_array`) into which the task writes its per-frame results.
+    With *nproc* > 1 the blocks are analysed in a :class:`multiprocessing.Pool`
+    whose workers load the universe from its files once and share the
+    result arrays with the calling process.
+
+    :Returns: list of the return values of *task* for all blocks, in order
+    """
+    shared = shared or {}
+    blocks = _frame_blocks(n_frames, nproc)
+    if nproc == 1 or len(blocks) < 2:
+        arrays = dict((name, _as_array(array))
+                      for name, array in shared.items())
+        return [task(universe, arrays, block, **params) for block in blocks]
+
+    trajectory = universe.trajectory
+    filename = getattr(trajectory, 'filenames', getattr(trajectory, 'filename', None))
+    if universe.filename is None or filename is None:
+        raise ValueError("nproc > 1 requires a universe read from files")
+    pool = multiprocessing.Pool(len(blocks), _init_worker,
+                                (universe.filename, filename, shared))
+    try:
+        return pool.map(_run_block, [(task, block, params) for block in blocks])
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _selection_task(universe, arrays, block, selection):
+    """Mark the atoms in *selection* for each frame of *block*."""
+    selected = arrays['selected']
+    for ts in universe.trajectory[block[0]:block[1]]:
+        selected[ts.frame, universe.select_atoms(selection).indices] = True
+
+
+def _position_task(universe, arrays, block, indices):
+    """Store the positions of the atoms *indices* for each frame of *block*."""
+    positions = arrays['positions']
+    atoms = universe.atoms[indices]
+    for ts in universe.trajectory[block[0]:block[1]]:
+        positions[ts.frame] = atoms.positions
+
+
+def _hbond_task(universe, arrays, block, selection1, selection2, run_kwargs):
+    """Hydrogen bonds between *selection1* and *selection2* in *block*."""
+    h = MDAnalysis.analysis.hbonds.HydrogenBondAnalysis(
+        universe, selection1, selection2, distance=3.5, angle=120.0,
+        start=block[0], stop=block[1])
+    h.run(**run_kwargs)
+    return h.hbonds
+
+
+def _selection_timeseries(universe, selection, n_frames, nproc=1,
+                          positions=True):
+    """Atoms in *selection* and their positions in the first *n_frames* frames.
+
+    The selection is evaluated at every frame, so that it may change over
+    time, and stored as boolean membership of all atoms that are selected at
+    any frame.
+
+    :Returns: tuple of the sorted indices of the ``n`` atoms selected at any
+              frame, a ``(n_frames, n)`` boolean array which is ``True`` where
+              an atom is selected at a frame and the ``(n_frames, n, 3)``
+              positions of the atoms (``None`` if *positions* is ``False``)
+    """
+    shared = {'selected': _shared_array((n_frames, universe.atoms.n_atoms),
+                                        np.bool_)}
+    _pooled_run(universe, _selection_task, n_frames, nproc, shared,
+                selection=selection)
+    selected = _as_array(shared['selected'])
+    indices = np.flatnonzero(selected.any(axis=0))
+    selected = selected[:, indices]
+    if not positions:
+        return indices, selected, None
+    shared = {'positions': _shared_array((n_frames, len(indices), 3),
+                                         np.float32)}
+    _pooled_run(universe, _position_task, n_frames, nproc, shared,
+                indices=indices)
+    return indices, selected, _as_array(shared['positions'])
+
+
+def _water_vectors(positions):
+    """Unit OH, HH and dipole vectors of all water molecules.
+
+    *positions* are the positions of consecutive O, H1, H2 triples; any
+    trailing incomplete molecule is ignored.
+
+    :Returns: tuple of the ``(n, 3)`` unit OH, HH and dipole vectors
+    """
+    n = len(positions) // 3
+    positions = np.asarray(positions[:3 * n])
+    O, H1, H2 = positions[0::3], positions[1::3], positions[2::3]
+    vectors = (H1 - O, H1 - H2, 0.5 * (H1 + H2) - O)
+    return tuple(v / np.linalg.norm(v, axis=1)[:, None] for v in vectors)
+
+
+def _run_lengths(exists):
+    """Number of consecutive frames, from each frame on, for which an entry exists.
+
+    *exists* is a ``(n, n_frames)`` boolean array; the result has the same
+    shape.
+    """
+    n_frames = exists.shape[1]
+    frame = np.arange(n_frames)
+    next_gap = np.where(exists, n_frames, frame)
+    next_gap = np.minimum.accumulate(next_gap[:, ::-1], axis=1)[:, ::-1]
+    return next_gap - frame
 
 
 class HydrogenBondLifetimes(object):
@@ -422,6 +585,9 @@ class HydrogenBondLifetimes(object):
      *nproc*
        Number of processors to use, by default is 1.
 
+    .. versionchanged:: 0.16.0
+       Parallel runs use a pool of worker processes, one per block of frames.
+
     """
     def __init__(self,universe ,selection1 ,selection2, t0 , tf , dtmax, nproc = 1):
         self.universe = universe
@@ -433,189 +599,71 @@ class HydrogenBondLifetimes(object):
         self.nproc = nproc
         self.timeseries = None
 
-    def _getC_i(self,HBP,t0,t):
-        """
-        This function give the intermitent Hydrogen Bond Lifetime
-        C_i = <h(t0)h(t)>/<h(t0)> between t0 and t
-        """
-        C_i = 0
-        for i in range(len(HBP[t0])):
-            for j in range(len(HBP[t])):
-                if (HBP[t0][i][0] == HBP[t][j][0] and HBP[t0][i][1] == HBP[t][j][1]):
-                    C_i += 1
-                    break
-        if len(HBP[t0]) == 0 :
-            return 0.0
-        else:
-            return float(C_i)/len(HBP[t0])
-
-    def _getC_c(self,HBP,t0,t):
-        """
-        This function give the continous Hydrogen Bond Lifetime
-        C_c = <h(t0)h'(t)>/<h(t0)> between t0 and t
-        """
-        C_c = 0
-        dt = 1
-        begt0 = t0
-        HBP_cp = HBP
-        HBP_t0 = HBP[t0]
-        newHBP = []
-        if t0==t:
-            return 1.0
-        while t0+dt <= t:
-            for i in range(len(HBP_t0)):
-                for j in range(len(HBP_cp[t0+dt])):
-                    if (HBP_t0[i][0] == HBP_cp[t0+dt][j][0] and HBP_t0[i][1] == HBP_cp[t0+dt][j][1]):
-                        newHBP.append(HBP_t0[i])
-                        break
-            C_c = len(newHBP)
-            t0 += dt
-            HBP_t0 = newHBP
-            newHBP = []
-        if len(HBP[begt0]) == 0 :
-            return 0
-        else:
-            return C_c/float(len(HBP[begt0]))
-
-    def _intervC_c(self,HBP,t0,tf,dt):
-        """
-        This function gets all the data for the h(t0)h(t0+dt)', where
-        t0 = 1,2,3,...,tf. This function give us one point of the final graphic
-        HBL vs t
+    def _existence(self, hbonds, n_frames):
         """
-        a = 0
-        count = 0
-        for i in range(len(HBP)):
-            if (t0+dt <= tf):
-                if t0 == t0+dt:
-                    b = self._getC_c(HBP,t0,t0)
-                    break
-                b = self._getC_c(HBP,t0,t0+dt)
-                t0 += dt
-                a += b
-                count += 1
-        if count == 0:
-            return 1.0
-        return a/count
-
-    def _intervC_i(self,HBP,t0,tf,dt):
+        Existence matrix (pairs x frames) of the hydrogen bonds in the
+        structured array hbonds (see
+        :attr:`MDAnalysis.analysis.hbonds.hbond_analysis.HydrogenBondAnalysis.hbonds`),
+        with pairs identified by donor hydrogen and acceptor.
         """
-        This function gets all the data for the h(t0)h(t0+dt), where
-        t0 = 1,2,3,...,tf. This function give us a point of the final graphic
-        HBL vs t
-        """
-        a = 0
-        count = 0
-        for i in range(len(HBP)):
-            if (t0+dt <= tf ):
-                b = self._getC_i(HBP,t0,t0+dt)
-                t0 += dt
-                a += b
-                count += 1
-        return a/count
-
-    def _finalGraphGetC_i(self,HBP,t0,tf,maxdt):
-        """
-        This function gets the final data of the C_i graph.
-        """
-        output = []
-        for dt in range(maxdt):
-            a = self._intervC_i(HBP,t0,tf,dt)
-            output.append(a)
-        return output
+        return hbond_existence(hbonds['frame'], hbonds['donor_index'],
+                               hbonds['acceptor_index'], n_frames=n_frames)[1]
 
-    def _finalGraphGetC_c(self,HBP,t0,tf,maxdt):
+    def _getGraphics(self,exists,t0,tf,maxdt):
         """
-        This function gets the final data of the C_c graph.
+        Function that gets the continuous and intermittent HBL for all
+        dt < maxdt from the existence matrix of the H-bonds. For each dt,
+        time origins t0, t0+dt, t0+2dt, ... (up to tf-dt) are used and the
+        fractions of the H-bonds at each origin that still exist at
+        origin+dt (intermittent) or exist during the whole interval
+        (continuous) are averaged.
+
+        .. versionchanged:: 0.16.0
+           Computed from an existence matrix of all H-bonds instead of
+           comparing the lists of H-bonds frame by frame.
         """
-        output = []
-        for dt in range(maxdt):
-            a = self._intervC_c(HBP,t0,tf,dt)
-            output.append(a)
-        return output
+        if t0 + maxdt - 1 > tf:
+            raise ValueError("dtmax must be smaller than the analysed time "
+                             "window")
+        n_frames = exists.shape[1]
+        lasting = _run_lengths(exists)
+        n_t = exists.sum(axis=0)
 
-    def _getGraphics(self,HBP,t0,tf,maxdt):
-        """
-        Function that join all the results into a graphics.
-        """
         a = []
-        cont = self._finalGraphGetC_c(HBP,t0,tf,maxdt)
-        inte = self._finalGraphGetC_i(HBP,t0,tf,maxdt)
-        for i in range(len(cont)):
-            fix = [cont[i],inte[i]]
-            a.append(fix)
+        for dt in range(maxdt):
+            if dt == 0:
+                origins = np.array([t0])
+            else:
+                origins = np.arange(t0, tf - dt + 1, dt)[:n_frames]
+            n0 = n_t[origins].astype(np.float64)
+            found = n0 > 0
+            inte = (exists[:, origins] & exists[:, origins + dt]).sum(axis=0)
+            inte = np.where(found, inte / np.where(found, n0, 1), 0.0).mean()
+            if dt == 0 or len(origins) == 0:
+                cont = 1.0
+            else:
+                cont = (lasting[:, origins] > dt).sum(axis=0)
+                cont = np.where(found, cont / np.where(found, n0, 1), 0.0).mean()
+            a.append([cont, inte])
         return a
 
-    def _HBA(self, ts, conn, universe, selAtom1, selAtom2,
-             verbose=None, quiet=None):
-        """
-        Main function for calculate C_i and C_c in parallel.
-        """
-        verbose = _set_verbose(verbose, quiet, default=False)
-        finalGetResidue1 = selAtom1
-        finalGetResidue2 = selAtom2
-        frame = ts.frame
-        h = MDAnalysis.analysis.hbonds.HydrogenBondAnalysis(universe, finalGetResidue1,
-                                                            finalGetResidue2, distance=3.5, angle=120.0,
-                                                            start=frame-1, stop=frame)
-        while True:
-            try:
-                h.run(verbose=verbose)
-                break
-            except:
-                print("error")
-                print("trying again")
-                sys.stdout.flush()
-        sys.stdout.flush()
-        conn.send(h.timeseries[0])
-        conn.close()
-
-
     def run(self, **kwargs):
         """
         Analyze trajectory and produce timeseries
+
+        The keyword arguments are passed on to
+        :meth:`MDAnalysis.analysis.hbonds.hbond_analysis.HydrogenBondAnalysis.run`.
+
+        .. versionchanged:: 0.16.0
+           With nproc > 1 the trajectory is split into one block of frames
+           per process, which are analysed in a pool of worker processes.
         """
-        h_list = []
-        i = 0
-        if (self.nproc > 1):
-                while i < len(self.universe.trajectory):
-                    jobs = []
-                    k=i
-                    for j in range(self.nproc):
-                        #start
-                        print("ts=",i+1)
-                        if i >= len(self.universe.trajectory):
-                            break
-                        conn_parent, conn_child  = multiprocessing.Pipe(False)
-                        while True:
-                            try:
-                                #new thread
-                                jobs.append(
-                                    (multiprocessing.Process(
-                                            target=self._HBA,
-                                            args=(self.universe.trajectory[i], conn_child, self.universe,
-                                                  self.selection1, self.selection2,)),
-                                     conn_parent))
-                                break
-                            except:
-                                print("error in jobs.append")
-                        jobs[j][0].start()
-                        i = i + 1
-
-                    for j in range(self.nproc):
-                        if k >= len(self.universe.trajectory):
-                            break
-                        rec01 = jobs[j][1]
-                        received = rec01.recv()
-                        h_list.append(received)
-                        jobs[j][0].join()
-                        k += 1
-                self.timeseries = self._getGraphics( h_list , 0 , self.tf-1 , self.dtmax )
-        else:
-            h_list = MDAnalysis.analysis.hbonds.HydrogenBondAnalysis(self.universe, self.selection1,
-                                                                     self.selection2,distance=3.5, angle=120.0)
-            h_list.run(**kwargs)
-            self.timeseries = self._getGraphics(h_list.timeseries, self.t0, self.tf, self.dtmax)
+        n_frames = self.universe.trajectory.n_frames
+        hbonds = _pooled_run(self.universe, _hbond_task, n_frames, self.nproc,
+                             selection1=self.selection1,
+                             selection2=self.selection2, run_kwargs=kwargs)
+        exists = self._existence(np.concatenate(hbonds), n_frames)
+        self.timeseries = self._getGraphics(exists, self.t0, self.tf, self.dtmax)
 
 class WaterOrientationalRelaxation(object):
     r"""
@@ -642,6 +690,15 @@ class WaterOrientationalRelaxation(object):
        Time where analysis end
       *dtmax*
        Maximum dt size window, dtmax < tf or it will crash.
+      *nproc*
+       Number of processors to use, by default is 1.
+
+    With *nproc* > 1 the trajectory is read in blocks of frames by a pool of
+    worker processes, which requires a universe that was loaded from files.
+
+    .. versionchanged:: 0.16.0
+       Added parallel execution with *nproc* and vectorized the calculation
+       over all molecules.
 
     """
 
@@ -654,124 +711,34 @@ class WaterOrientationalRelaxation(object):
         self.nproc = nproc
         self.timeseries = None
 
-    def _repeatedIndex(self,selection,dt,totalFrames):
-        """
-        Indicate the comparation between all the t+dt.
-        The results is a list of list with all the repeated index per frame (or time).
-        Ex: dt=1, so compare frames (1,2),(2,3),(3,4)...
-        Ex: dt=2, so compare frames (1,3),(3,5),(5,7)...
-        Ex: dt=3, so compare frames (1,4),(4,7),(7,10)...
-        """
-        rep=[]
-        for i in range(int(round( (totalFrames-1)/float(dt) ) ) ):
-            if (  dt*i+dt < totalFrames ):
-                rep.append(self._sameMolecTandDT(selection,dt*i,(dt*i)+dt))
-        return rep
-
-    def _getOneDeltaPoint(self,universe, repInd, i ,t0, dt):
+    def _getOneDeltaPoint(self, selected, positions, t0, dt):
         """
         Give one point to promediate and get one point of the graphic  C_vect vs t
         Ex: t0=1 and tau=1 so calculate the t0-tau=1-2 intervale.
         Ex: t0=5 and tau=3 so calcultate the t0-tau=5-8 intervale.
-        i = come from getMeanOnePoint (named j) (int)
+        Only the molecules selected at both t0 and t0+dt are considered; if
+        there are none, None is returned.
         """
-        valOH = 0
-        valHH = 0
-        valdip= 0
-        n = 0
-        for j in range(len(repInd[i])/3):
-            begj =  3*j
-            universe.trajectory[t0]
-            Ot0 = repInd[i][begj]
-            H1t0 = repInd[i][begj+1]
-            H2t0 = repInd[i][begj+2]
-            OHVector0 = H1t0.position - Ot0.position
-            HHVector0 = H1t0.position-H2t0.position
-            dipVector0 = ((H1t0.position + H2t0.position)*0.5)-Ot0.position
-
-            universe.trajectory[t0+dt]
-            Otp = repInd[i][begj]
-            H1tp = repInd[i][begj+1]
-            H2tp = repInd[i][begj+2]
-
-            OHVectorp = H1tp.position- Otp.position
-            HHVectorp = H1tp.position - H2tp.position
-            dipVectorp = ((H1tp.position + H2tp.position)*0.5)-Otp.position
-
-            normOHVector0 = np.linalg.norm(OHVector0)
-            normOHVectorp = np.linalg.norm(OHVectorp)
-            normHHVector0 = np.linalg.norm(HHVector0)
-            normHHVectorp = np.linalg.norm(HHVectorp)
-            normdipVector0 = np.linalg.norm(dipVector0)
-            normdipVectorp = np.linalg.norm(dipVectorp)
-
-            unitOHVector0 = [OHVector0[0]/normOHVector0,OHVector0[1]/normOHVector0,OHVector0[2]/normOHVector0]
-            unitOHVectorp = [OHVectorp[0]/normOHVectorp,OHVectorp[1]/normOHVectorp,OHVectorp[2]/normOHVectorp]
-            unitHHVector0 = [HHVector0[0]/normHHVector0,HHVector0[1]/normHHVector0,HHVector0[2]/normHHVector0]
-            unitHHVectorp = [HHVectorp[0]/normHHVectorp,HHVectorp[1]/normHHVectorp,HHVectorp[2]/normHHVectorp]
-            unitdipVector0 = [dipVector0[0]/normdipVector0,dipVector0[1]/normdipVector0,dipVector0[2]/normdipVector0]
-            unitdipVectorp = [dipVectorp[0]/normdipVectorp,dipVectorp[1]/normdipVectorp,dipVectorp[2]/normdipVectorp]
-
-            valOH += self.lg2(np.dot(unitOHVector0,unitOHVectorp))
-            valHH += self.lg2(np.dot(unitHHVector0,unitHHVectorp))
-            valdip +=  self.lg2(np.dot(unitdipVector0,unitdipVectorp))
-            n += 1
-        valOH = valOH/n
-        valHH = valHH/n
-        valdip = valdip/n
-        return (valOH,valHH,valdip)
-
-    def _getMeanOnePoint(self,universe,selection1,selection_str,dt,totalFrames):
+        common = np.flatnonzero(selected[t0] & selected[t0 + dt])
+        if len(common) < 3:
+            return None
+        vectors0 = _water_vectors(positions[t0, common])
+        vectorsp = _water_vectors(positions[t0 + dt, common])
+        return tuple(self.lg2(np.sum(u0 * up, axis=1)).mean()
+                     for u0, up in zip(vectors0, vectorsp))
+
+    def _getMeanOnePoint(self, selected, positions, dt, totalFrames):
         """
         This function get one point of the graphic C_OH vs t. It uses the
-        _getOneDeltaPoint() function to calculate the average.
-
-        """
-        repInd = self._repeatedIndex(selection1,dt,totalFrames)
-        sumsdt = 0
-        n = 0.0
-        sumDeltaOH = 0.0
-        sumDeltaHH = 0.0
-        sumDeltadip = 0.0
-        valOHList = []
-        valHHList = []
-        valdipList = []
-
-        for j in range(totalFrames/dt-1):
-            # If the selection of atoms is too small, there will be a division by zero in the next line.
-            # The except clause avoid the use of the result of _getOneDeltaPoint() on the mean.
-            try:
-                a = self._getOneDeltaPoint(universe,repInd,j,sumsdt,dt)
-            except ZeroDivisionError:
-                continue
-            sumDeltaOH += a[0]
-            sumDeltaHH += a[1]
-            sumDeltadip += a[2]
-            valOHList.append(a[0])
-            valHHList.append(a[1])
-            valdipList.append(a[2])
-            sumsdt +=  dt
-            n += 1
-        return (sumDeltaOH/n,sumDeltaHH/n,sumDeltadip/n)
-
-    def _sameMolecTandDT(self,selection,t0d,tf):
-        """
-        Compare the molecules in the t0d selection and the t0d+dt selection and
-        select only the particles that are repeated in both frame. This is to consider
-        only the molecules that remains in the selection after the dt time has elapsed.
-        The result is a list with the indexs of the atoms.
+        _getOneDeltaPoint() function to calculate the average over the time
+        origins 0, dt, 2dt, ...
         """
-        a = set(selection[t0d])
-        b = set(selection[tf])
-        sort = sorted(list(a.intersection(b)))
-        return sort
-
-    def _selection_serial(self,universe,selection_str):
-        selection = []
-        for ts in universe.trajectory:
-            selection.append(universe.select_atoms(selection_str))
-            print(ts.frame)
-        return selection
+        points = [self._getOneDeltaPoint(selected, positions, j * dt, dt)
+                  for j in range(totalFrames // dt - 1)]
+        points = [point for point in points if point is not None]
+        if not points:
+            return (np.nan, np.nan, np.nan)
+        return tuple(np.mean(points, axis=0))
 
     # Second Legendre polynomial
     lg2 = lambda self,x : (3*x*x - 1)/2
@@ -779,18 +746,18 @@ class WaterOrientationalRelaxation(object):
     def run(self,**kwargs):
         """
         Analyze trajectory and produce timeseries
-        """
 
-        #All the selection to an array, this way is faster than selecting later.
-        if self.nproc==1:
-            selection_out = self._selection_serial(self.universe,self.selection)
-        else:
-            #selection_out = self._selection_parallel(self.universe,self.selection,self.nproc)
-            #parallel selection to be implemented
-            selection_out = self._selection_serial(self.universe,self.selection)
+        .. versionchanged:: 0.16.0
+           The selections and positions are gathered in passes over the
+           trajectory that are split over nproc processes, and the vectors of
+           all molecules are handled at once.
+        """
+        n_frames = min(self.tf, self.universe.trajectory.n_frames)
+        indices, selected, positions = _selection_timeseries(
+            self.universe, self.selection, n_frames, self.nproc)
         self.timeseries = []
         for dt in list(range(1,self.dtmax+1)):
-            output = self._getMeanOnePoint(self.universe,selection_out,self.selection,dt,self.tf)
+            output = self._getMeanOnePoint(selected, positions, dt, self.tf)
             self.timeseries.append(output)
 
 
@@ -815,9 +782,18 @@ class AngularDistribution(object):
          *axis*
              Axis to create angle with the vector (HH, OH or dipole) and calculate cosine theta ['z']. Options: 'x',
              'y', 'z'
+         *nproc*
+             Number of processors to use, by default is 1.
 
     .. _numpy.histogram: http://docs.scipy.org/doc/np/reference/generated/np.histogram.html
 
+    With *nproc* > 1 the trajectory is read in blocks of frames by a pool of
+    worker processes, which requires a universe that was loaded from files.
+
+    .. versionchanged:: 0.16.0
+       Added parallel execution with *nproc* and vectorized the calculation
+       over all molecules.
+
 
     """
     def __init__(self,universe,selection_str,bins=40,nproc=1,axis="z"):
@@ -828,54 +804,32 @@ class AngularDistribution(object):
         self.axis = axis
         self.graph = None
 
-    def _getCosTheta(self,universe,selection,axis):
+    def _getCosTheta(self, selected, positions, axis):
+        """
+        Cosines of the angles between the OH, HH and dipole vectors of the
+        selected molecules in all frames and the axis.
+        """
+        try:
+            column = {"x": 0, "y": 1, "z": 2}[axis]
+        except KeyError:
+            raise ValueError("axis must be one of 'x', 'y' or 'z', not "
+                             "{0!r}".format(axis))
         valOH = []
         valHH = []
         valdip= []
-
-        i = 0
-        while i <= (len(selection)-1):
-            universe.trajectory[i]
-            line = selection[ i ].positions
-
-            Ot0 = line[::3]
-            H1t0 = line[1::3]
-            H2t0 = line[2::3]
-
-            OHVector0 = H1t0 - Ot0
-            HHVector0 = H1t0 - H2t0
-            dipVector0 = (H1t0 + H2t0)*0.5 - Ot0
-
-            unitOHVector0 = OHVector0/np.linalg.norm(OHVector0, axis = 1)[:,None]
-            unitHHVector0 = HHVector0/np.linalg.norm(HHVector0, axis = 1)[:,None]
-            unitdipVector0 = dipVector0/np.linalg.norm(dipVector0, axis = 1)[:,None]
-
-            j=0
-            while j < len(line)/3:
-                if axis == "z":
-                    valOH.append(unitOHVector0[j][2])
-                    valHH.append(unitHHVector0[j][2])
-                    valdip.append(unitdipVector0[j][2])
-
-                elif axis == "x":
-                    valOH.append(unitOHVector0[j][0])
-                    valHH.append(unitHHVector0[j][0])
-                    valdip.append(unitdipVector0[j][0])
-
-                elif axis == "y":
-                    valOH.append(unitOHVector0[j][1])
-                    valHH.append(unitHHVector0[j][1])
-                    valdip.append(unitdipVector0[j][1])
-
-                j += 1
-            i += 1
-        return (valOH,valHH,valdip)
-
-    def _getHistogram(self,universe,selection,bins,axis):
+        for frame_selected, frame_positions in zip(selected, positions):
+            unitOH, unitHH, unitdip = _water_vectors(frame_positions[frame_selected])
+            valOH.append(unitOH[:, column])
+            valHH.append(unitHH[:, column])
+            valdip.append(unitdip[:, column])
+        return (np.concatenate(valOH), np.concatenate(valHH),
+                np.concatenate(valdip))
+
+    def _getHistogram(self,selected,positions,bins,axis):
         """
         This function gets a normalized histogram of the cos(theta) values. It return a list of list.
         """
-        a = self._getCosTheta(universe,selection,axis)
+        a = self._getCosTheta(selected,positions,axis)
         cosThetaOH = a[0]
         cosThetaHH = a[1]
         cosThetadip = a[2]
@@ -902,17 +856,18 @@ class AngularDistribution(object):
     def run(self,**kwargs):
         """
         Function to evaluate the angular distribution of cos(theta)
-        """
 
-        if self.nproc ==1:
-            selection = self._selection_serial(self.universe,self.selection_str)
-        else:
-            #not implemented yet
-            #selection = self._selection_parallel(self.universe,self.selection_str,self.nproc)
-            selection = self._selection_serial(self.universe,self.selection_str)
+        .. versionchanged:: 0.16.0
+           The selections and positions are gathered in passes over the
+           trajectory that are split over nproc processes, and the vectors of
+           all molecules are handled at once.
+        """
+        n_frames = self.universe.trajectory.n_frames
+        indices, selected, positions = _selection_timeseries(
+            self.universe, self.selection_str, n_frames, self.nproc)
 
         self.graph = []
-        output=self._getHistogram(self.universe,selection,self.bins,self.axis)
+        output=self._getHistogram(selected,positions,self.bins,self.axis)
         #this is to format the exit of the file
         #maybe this output could be improved
         listOH = [list(output[0][1]),list(output[0][0])]
@@ -923,13 +878,6 @@ class AngularDistribution(object):
         self.graph.append(self._hist2column(listHH))
         self.graph.append(self._hist2column(listdip))
 
-    def _selection_serial(self,universe,selection_str):
-        selection = []
-        for ts in universe.trajectory:
-            selection.append(universe.select_atoms(selection_str))
-            print(ts.frame)
-        return selection
-
 
 class  MeanSquareDisplacement(object):
     r"""
@@ -958,6 +906,15 @@ class  MeanSquareDisplacement(object):
          Time where analysis end
       *dtmax*
          Maximum dt size window, dtmax < tf or it will crash.
+      *nproc*
+         Number of processors to use, by default is 1.
+
+    With *nproc* > 1 the trajectory is read in blocks of frames by a pool of
+    worker processes, which requires a universe that was loaded from files.
+
+    .. versionchanged:: 0.16.0
+       Added parallel execution with *nproc* and vectorized the calculation
+       over all molecules.
 
     """
 
@@ -970,101 +927,50 @@ class  MeanSquareDisplacement(object):
         self.nproc = nproc
         self.timeseries = None
 
-    def _repeatedIndex(self,selection,dt,totalFrames):
-        """
-        Indicate the comparation between all the t+dt.
-        The results is a list of list with all the repeated index per frame (or time).
-        Ex: dt=1, so compare frames (1,2),(2,3),(3,4)...
-        Ex: dt=2, so compare frames (1,3),(3,5),(5,7)...
-        Ex: dt=3, so compare frames (1,4),(4,7),(7,10)...
-        """
-        rep=[]
-        for i in range(int(round( (totalFrames-1)/float(dt) ) ) ):
-            if (  dt*i+dt < totalFrames ):
-                rep.append(self._sameMolecTandDT(selection,dt*i,(dt*i)+dt))
-        return rep
-
-    def _getOneDeltaPoint(self,universe, repInd, i ,t0, dt):
+    def _getOneDeltaPoint(self, selected, positions, t0, dt):
         """
         Give one point to promediate and get one point of the grapic  C_vect vs t
         Ex: t0=1 and dt=1 so calculate the t0-dt=1-2 intervale.
         Ex: t0=5 and dt=3 so calcultate the t0-dt=5-8 intervale
-        i = come from getMeanOnePoint (named j) (int)
+        Only the oxygens (first atom of each molecule) of the molecules
+        selected at both t0 and t0+dt are considered; if there are none, None
+        is returned.
         """
-        valO = 0
-        n = 0
-        for j in range(len(repInd[i])/3):
-            begj =  3*j
-            universe.trajectory[t0]
-            #Plus zero is to avoid 0to be equal to 0tp
-            Ot0 = repInd[i][begj].position + 0
-
-            universe.trajectory[t0+dt]
-            #Plus zero is to avoid 0to be equal to 0tp
-            Otp = repInd[i][begj].position + 0
-
-            #position oxygen
-            OVector = Ot0 - Otp
-            #here it is the difference with waterdynamics.WaterOrientationalRelaxation
-            valO += np.dot(OVector, OVector)
-            n += 1
-        valO = valO/n
-        return (valO)
-
-    def _getMeanOnePoint(self,universe,selection1,selection_str,dt,totalFrames):
+        common = np.flatnonzero(selected[t0] & selected[t0 + dt])
+        oxygens = common[:len(common) // 3 * 3:3]
+        if len(oxygens) == 0:
+            return None
+        OVector = positions[t0, oxygens] - positions[t0 + dt, oxygens]
+        return np.sum(OVector * OVector, axis=1).mean()
+
+    def _getMeanOnePoint(self, selected, positions, dt, totalFrames):
         """
         This function get one point of the graphic C_OH vs t. It's uses the
-        _getOneDeltaPoint() function to calculate the average.
-
-        """
-        repInd = self._repeatedIndex(selection1,dt,totalFrames)
-        sumsdt = 0
-        n = 0.0
-        sumDeltaO = 0.0
-        valOList = []
-
-        for j in range(totalFrames/dt-1):
-            a = self._getOneDeltaPoint(universe,repInd,j,sumsdt,dt)
-            sumDeltaO += a
-            valOList.append(a)
-            sumsdt +=  dt
-            n += 1
-        return (sumDeltaO/n)
-
-    def _sameMolecTandDT(self,selection,t0d,tf):
-        """
-        Compare the molecules in the t0d selection and the t0d+dt selection and
-        select only the particles that are repeated in both frame. This is to consider
-        only the molecules that remains in the selection after the dt time has elapsed.
-        The result is a list with the indexs of the atoms.
+        _getOneDeltaPoint() function to calculate the average over the time
+        origins 0, dt, 2dt, ...
         """
-        a = set(selection[t0d])
-        b = set(selection[tf])
-        sort = sorted(list(a.intersection(b)))
-        return sort
-
-    def _selection_serial(self,universe,selection_str):
-        selection = []
-        for ts in universe.trajectory:
-            selection.append(universe.select_atoms(selection_str))
-            print(ts.frame)
-        return selection
+        points = [self._getOneDeltaPoint(selected, positions, j * dt, dt)
+                  for j in range(totalFrames // dt - 1)]
+        points = [point for point in points if point is not None]
+        if not points:
+            return np.nan
+        return np.mean(points)
 
     def run(self,**kwargs):
         """
         Analyze trajectory and produce timeseries
-        """
 
-        #All the selection to an array, this way is faster than selecting later.
-        if self.nproc==1:
-            selection_out = self._selection_serial(self.universe,self.selection)
-        else:
-            #parallel not yet implemented
-            #selection = selection_parallel(universe,selection_str,nproc)
-            selection_out = self._selection_serial(self.universe,self.selection)
+        .. versionchanged:: 0.16.0
+           The selections and positions are gathered in passes over the
+           trajectory that are split over nproc processes, and the
+           displacements of all molecules are handled at once.
+        """
+        n_frames = min(self.tf, self.universe.trajectory.n_frames)
+        indices, selected, positions = _selection_timeseries(
+            self.universe, self.selection, n_frames, self.nproc)
         self.timeseries = []
         for dt in list(range(1,self.dtmax+1)):
-            output = self._getMeanOnePoint(self.universe,selection_out,self.selection,dt,self.tf)
+            output = self._getMeanOnePoint(selected, positions, dt, self.tf)
             self.timeseries.append(output)
 
 
@@ -1093,6 +999,15 @@ class SurvivalProbability(object):
       Time where analysis end
      *dtmax*
       Maximum dt size window, dtmax < tf or it will crash
+     *nproc*
+      Number of processors to use, by default is 1.
+
+    With *nproc* > 1 the trajectory is read in blocks of frames by a pool of
+    worker processes, which requires a universe that was loaded from files.
+
+    .. versionchanged:: 0.16.0
+       Added parallel execution with *nproc* and vectorized the calculation
+       over all molecules.
 
     """
 
@@ -1105,74 +1020,35 @@ class SurvivalProbability(object):
         self.nproc = nproc
         self.timeseries = None
 
-    def _getOneDeltaPoint(self,selection, totalFrames, t0, tau):
+    def _getMeanOnePoint(self, selected, lasting, wint, totalFrames):
         """
-        Give one point to promediate and get one point of the graphic  C_vect vs t
-        Ex: t0=1 and tau=1 so calculate the t0-tau=1-2 intervale.
-        Ex: t0=5 and tau=3 so calcultate the t0-tau=5-8 intervale.
-        """
-        Ntau = self._NumPart_tau(selection, totalFrames, t0, tau)
-        Nt = float(self._NumPart(selection,t0))
-
-        return Ntau/Nt
-
-    def _getMeanOnePoint(self,universe,selection1,selection_str,wint,totalFrames):
+        This function get one point of the graphic P(t) vs t: the fraction
+        N(t0, t0+wint)/N(t0) averaged over all time origins t0 at which
+        particles are selected, where N(t0, t0+wint) is the number of
+        particles that remain in the selection from t0 to t0+wint and lasting
+        holds the number of consecutive frames each particle remains.
         """
-        This function get one point of the graphic P(t) vs t. It uses the
-        _getOneDeltaPoint() function to calculate the average.
-
-        """
-        n = 0.0
-        sumDeltaP = 0.0
-        for frame in range(totalFrames-wint):
-            #This "try" is to avoid a division by zero when there is no particles in time t0,
-            #this happens in very small selection regions.
-            try:
-                a = self._getOneDeltaPoint(selection1,totalFrames ,frame, wint)
-            except ZeroDivisionError:
-                continue
-            sumDeltaP += a
-            n += 1
-
-        return sumDeltaP/n
-
-    def _NumPart_tau(self,selection, totalFrames, t0,tau):
-        """
-        Compare the molecules in t0 selection and t0+tau selection and
-        select only the particles that remaing from t0 to t0+tau. It returns
-        the number of remaining particles.
-        """
-        a = set(selection[t0])
-        i=0
-        while (t0+i) < t0+tau and (t0+i) < totalFrames:
-            b = set(selection[t0+i])
-            a = a.intersection(b)
-            i += 1
-        return len(a)
-
-    def _NumPart(self, selection, t):
-        return len(selection[t])
-
-    def _selection_serial(self,universe,selection_str):
-        selection = []
-        for ts in universe.trajectory:
-            selection.append(universe.select_atoms(selection_str))
-            print(ts.frame)
-        return selection
+        origins = np.arange(totalFrames - wint)
+        Nt = selected[origins].sum(axis=1)
+        Ntau = (lasting[:, origins] >= wint).sum(axis=0)
+        found = Nt > 0
+        return np.mean(Ntau[found] / Nt[found].astype(np.float64))
 
     def run(self,**kwargs):
         """
         Analyze trajectory and produce timeseries
-        """
 
-        #All the selection to an array, this way is faster than selecting later.
-        if self.nproc==1:
-            selection_out = self._selection_serial(self.universe, self.selection)
-        else:
-            #selection = selection_parallel(universe,selection_str,nproc)
-            #parallel selection to be implemented
-            selection_out = self._selection_serial(self.universe, self.selection)
+        .. versionchanged:: 0.16.0
+           The selections are gathered in a pass over the trajectory that is
+           split over nproc processes and the particles that remain in the
+           selection are counted for all time origins at once.
+        """
+        n_frames = min(self.tf, self.universe.trajectory.n_frames)
+        indices, selected, positions = _selection_timeseries(
+            self.universe, self.selection, n_frames, self.nproc,
+            positions=False)
+        lasting = _run_lengths(selected.T)
         self.timeseries = []
         for dt in list(range(1,self.dtmax+1)):
-            output = self._getMeanOnePoint(self.universe, selection_out, self.selection, dt, self.tf)
+            output = self._getMeanOnePoint(selected, lasting, dt, self.tf)
             self.timeseries.append(output)
@@ -89,7 +89,7 @@ class::
 
 
 """
-from six.moves import zip
+from six.moves import zip, range
 from six import string_types
 
 from collections import namedtuple
@@ -103,6 +103,7 @@ import MDAnalysis
 from .. import _ANCHOR_UNIVERSES
 from ..lib import util
 from ..lib import distances
+from ..lib import mdamath
 from ..lib import transformations
 from ..selections import get_writer as get_selection_writer_for
 from . import selection
@@ -131,6 +132,99 @@ def _unpickle_uag(basepickle, selections, selstrs):
     return UpdatingAtomGroup(basegroup, selections, selstrs)
 
 
+def _compound_centers(coords, compound_ix, n_compounds, weights=None):
+    """Weighted centers of all compounds, computed in one pass
+
+    Parameters
+    ----------
+    coords : numpy.ndarray
+        ``(n_atoms, 3)`` coordinates.
+    compound_ix : numpy.ndarray
+        Compound index in ``[0, n_compounds)`` for each atom.
+    n_compounds : int
+        Number of compounds.
+    weights : numpy.ndarray, optional
+        Weight of each atom; ``None`` gives the centers of geometry.
+
+    Returns
+    -------
+    centers : numpy.ndarray
+        ``(n_compounds, 3)`` array of centers.
+    """
+    if weights is None:
+        weights = np.ones(len(coords), dtype=np.float64)
+    norm = np.bincount(compound_ix, weights=weights, minlength=n_compounds)
+    centers = np.empty((n_compounds, 3), dtype=np.float64)
+    for dim in range(3):
+        centers[:, dim] = np.bincount(compound_ix,
+                                      weights=weights * coords[:, dim],
+                                      minlength=n_compounds)
+    centers /= norm[:, None]
+    return centers
+
+
+def _unwrap_compounds(coords, compound_ix, n_compounds, box):
+    """Move atoms to the periodic image closest to the first atom of their
+    compound
+
+    Parameters
+    ----------
+    coords : numpy.ndarray
+        ``(n_atoms, 3)`` coordinates.
+    compound_ix : numpy.ndarray
+        Compound index in ``[0, n_compounds)`` for each atom.
+    n_compounds : int
+        Number of compounds.
+    box : numpy.ndarray
+        Unit cell, as returned by
+        :attr:`MDAnalysis.coordinates.base.Timestep.dimensions`.
+
+    Returns
+    -------
+    coords : numpy.ndarray
+        Unwrapped ``(n_atoms, 3)`` coordinates.
+
+    Notes
+    -----
+    Each compound is assumed to extend over less than half a box length
+    from its first atom.
+    """
+    # the reversed assignment leaves the *first* atom of each compound
+    first = np.empty(n_compounds, dtype=np.int64)
+    first[compound_ix[::-1]] = np.arange(len(coords) - 1, -1, -1)
+    ref = coords[first][compound_ix]
+    return ref + distances.minimize_vectors(coords - ref, box)
+
+
+def _indices_to_slice(ix):
+    """Basic slice equivalent to an array of indices, if there is one
+
+    Parameters
+    ----------
+    ix : numpy.ndarray
+        Non-negative indices.
+
+    Returns
+    -------
+    slice or None
+        A slice selecting the same elements in the same order as `ix`, or
+        ``None`` if `ix` is empty or not an increasing arithmetic sequence.
+    """
+    n = len(ix)
+    if n == 0:
+        return None
+    start = int(ix[0])
+    if n == 1:
+        return slice(start, start + 1)
+    step = int(ix[1] - ix[0])
+    if step <= 0:
+        return None
+    stop = int(ix[-1])
+    if stop - start != (n - 1) * step or not (np.diff(ix) == step).all():
+        return None
+    return slice(start, stop + 1, step)
+
+
 def make_classes():
     """Make a fresh copy of all Classes
 
@@ -452,7 +546,59 @@ class GroupBase(_MutableBase):
     def dimensions(self):
         return self._u.trajectory.ts.dimensions
 
-    def center(self, weights, pbc=None):
+    @property
+    @util.cached('unwrap_traversal')
+    def _unwrap_traversal(self):
+        """Bond traversal of the (unique) atoms of this group
+
+        The traversal only follows bonds between atoms of this group, with
+        indices into ``self.atoms.unique``. See
+        :func:`MDAnalysis.lib.mdamath.bond_traversal`.
+        """
+        atomgroup = self.atoms.unique
+        try:
+            bonds = atomgroup.bonds.indices
+        except (AttributeError, NoDataError):
+            raise NoDataError("The atomgroup is required to have bonds")
+        ix = atomgroup.ix
+        bonds = np.asarray(bonds, dtype=np.int64).reshape(-1, 2)
+        local = np.searchsorted(ix, bonds)
+        inside = ix[np.clip(local, 0, len(ix) - 1)] == bonds
+        local = local[inside.all(axis=1)]
+        return mdamath.bond_traversal(local, len(ix))
+
+    def _get_compound_indices(self, compound):
+        """Per-atom indices of the compounds the atoms of this group belong to
+
+        Parameters
+        ----------
+        compound : {'group', 'segments', 'residues', 'fragments'}
+            Type of compound.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            One (global) compound index for each atom in ``self.atoms``.
+
+        Raises
+        ------
+        ValueError
+            if `compound` is not one of the recognised values
+        """
+        atoms = self.atoms
+        if compound == 'group':
+            return np.zeros(len(atoms), dtype=np.int64)
+        elif compound == 'residues':
+            return atoms.resindices
+        elif compound == 'segments':
+            return atoms.segindices
+        elif compound == 'fragments':
+            return atoms.fragindices
+        raise ValueError("Unrecognised compound definition: {0} "
+                         "Please use one of 'group' 'residues' 'segments' "
+                         "or 'fragments'".format(compound))
+
+    def center(self, weights, pbc=None, compound='group', unwrap=False):
         """Calculate center of group given some weights
 
         Parameters
@@ -462,11 +608,29 @@ class GroupBase(_MutableBase):
         pbc : boolean, optional
             ``True``: Move all atoms within the primary unit cell
             before calculation [``False``]
+        compound : {'group', 'segments', 'residues', 'fragments'}, optional
+            If 'group', the weighted center of all atoms in the group will be
+            returned as a single position vector. Else, the weighted centers
+            of each :class:`Segment`, :class:`Residue`, or fragment will be
+            returned as an array of position vectors, i.e. a 2d array. Only
+            the atoms of this group contribute to the centers. [``'group'``]
+        unwrap : bool, optional
+            If ``True``, the atoms of each compound are brought to the
+            periodic image closest to the first atom of that compound before
+            the center is calculated, so that compounds broken across the
+            periodic boundaries yield sensible centers. [``False``]
 
         Returns
         -------
         center : ndarray
-            weighted center of group
+            weighted center of group, or, if `compound` is not 'group', an
+            ``(n_compounds, 3)`` array of the weighted centers of the
+            compounds, sorted by their index
+
+        Raises
+        ------
+        ValueError
+            if `compound` is not one of the recognised values
 
         Examples
         --------
@@ -476,24 +640,75 @@ class GroupBase(_MutableBase):
             >>> sel = u.select_atoms('prop mass > 4.0')
             >>> sel.center(sel.charges)
 
+        To find the centers of geometry of all water molecules::
+
+            >>> water = u.select_atoms('resname SOL')
+            >>> water.center(None, compound='residues')
+
 
         Notes
         -----
         If the :class:`MDAnalysis.core.flags` flag *use_pbc* is set to
         ``True`` then the `pbc` keyword is used by default.
 
+        If `compound` is not 'group', `pbc` does not move individual atoms
+        (which would break the compounds apart) but instead moves the
+        computed centers into the primary unit cell.
+
+        Per-compound centers are computed in a single pass over all atoms
+        with :func:`numpy.bincount` on the per-atom compound indices; there is
+        no Python-level loop over the compounds.
+
+
+        .. versionchanged:: 0.16.0
+           Added `compound` and `unwrap` parameters
         """
         atoms = self.atoms
         if pbc is None:
             pbc = flags['use_pbc']
+        comp = compound.lower()
+
+        if comp == 'group' and not unwrap:
+            if pbc:
+                xyz = atoms.pack_into_box(inplace=False)
+            else:
+                xyz = atoms.positions
+            return np.average(xyz, weights=weights, axis=0)
+
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+            if weights.shape != (len(atoms),):
+                # mimic the errors of np.average for the 'group' case
+                if weights.ndim != 1:
+                    raise TypeError("1D weights expected when shapes of a "
+                                    "and weights differ.")
+                raise ValueError("Length of weights not compatible with "
+                                 "specified axis.")
+
+        compound_indices = atoms._get_compound_indices(comp)
+        unique_ix, compound_ix = np.unique(compound_indices,
+                                           return_inverse=True)
+        n_compounds = len(unique_ix)
+
+        xyz = atoms.positions.astype(np.float64)
+        if unwrap:
+            xyz = _unwrap_compounds(xyz, compound_ix, n_compounds,
+                                    atoms.dimensions)
+
+        centers = _compound_centers(xyz, compound_ix, n_compounds, weights)
+
+        if comp == 'group':
+            center = centers[0]
+            if pbc:
+                center = distances.apply_PBC(
+                    center[None, :].astype(np.float32), atoms.dimensions)[0]
+            return center
         if pbc:
-            xyz = atoms.pack_into_box(inplace=False)
-        else:
-            xyz = atoms.positions
+            centers = distances.apply_PBC(centers.astype(np.float32),
+                                          atoms.dimensions)
+        return centers
 
-        return np.average(xyz, weights=weights, axis=0)
-
-    def center_of_geometry(self, pbc=None):
+    def center_of_geometry(self, pbc=None, compound='group', unwrap=False):
         """Center of geometry (also known as centroid) of the selection.
 
         Parameters
@@ -501,11 +716,18 @@ class GroupBase(_MutableBase):
         pbc : boolean, optional
             ``True``: Move all atoms within the primary unit cell
             before calculation [``False``]
+        compound : {'group', 'segments', 'residues', 'fragments'}, optional
+            If not 'group', return the centers of geometry of each
+            :class:`Segment`, :class:`Residue`, or fragment as an
+            ``(n_compounds, 3)`` array. [``'group'``]
+        unwrap : bool, optional
+            If ``True``, unwrap each compound across the periodic boundaries
+            before calculating its center. [``False``]
 
         Returns
         -------
         center : ndarray
-            geometric center of group
+            geometric center of group, or of each compound
 
         Notes
         -----
@@ -514,8 +736,10 @@ class GroupBase(_MutableBase):
 
 
         .. versionchanged:: 0.8 Added `pbc` keyword
+        .. versionchanged:: 0.16.0
+           Added `compound` and `unwrap` parameters
         """
-        return self.center(None, pbc=pbc)
+        return self.center(None, pbc=pbc, compound=compound, unwrap=unwrap)
 
     centroid = center_of_geometry
 
@@ -750,7 +974,7 @@ class GroupBase(_MutableBase):
         M = transformations.rotation_matrix(alpha, axis, point=point)
         return self.transform(M)
 
-    def pack_into_box(self, box=None, inplace=True):
+    def pack_into_box(self, box=None, inplace=True, unwrap=False):
         r"""Shift all atoms in this group to be within the primary unit cell.
 
         Parameters
@@ -763,12 +987,21 @@ class GroupBase(_MutableBase):
             timestep dimensions.
         inplace : bool
             ``True`` to change coordinates in place.
+        unwrap : bool
+            ``True`` to keep molecules whole: after packing, all fragments
+            are made whole again by following their bonds from their first
+            atom, which stays in the primary unit cell. Requires bonds.
 
         Returns
         -------
         coords : array
             Shifted atom coordinates.
 
+        Raises
+        ------
+        NoDataError
+            if `unwrap` is ``True`` and there are no bonds
+
         Notes
         -----
         All atoms will be moved so that they lie between 0 and boxlength
@@ -787,9 +1020,16 @@ class GroupBase(_MutableBase):
 
         Works with either orthogonal or triclinic box types.
 
+        With ``unwrap=True`` all fragments are made whole in one vectorized
+        pass over the bonds (see :func:`MDAnalysis.lib.mdamath.unwrap_bonded`).
+        The traversal order of the bonds is computed once per group and
+        cached, so repeated calls on the same group (e.g. for every frame of a
+        trajectory) only pay for the per-frame shifts.
 
-        .. versionadded:: 0.8
 
+        .. versionadded:: 0.8
+        .. versionchanged:: 0.16.0
+           Added `unwrap` keyword
         """
         atomgroup = self.atoms.unique
         if box is None:  # Try and auto detect box dimensions
@@ -806,14 +1046,17 @@ class GroupBase(_MutableBase):
                                  "  You can specify a boxsize with 'box='")
 
         coords = atomgroup.universe.coord.positions[atomgroup.indices]
+        packed = distances.apply_PBC(coords, box)
+        if unwrap:
+            packed = mdamath.unwrap_bonded(packed, self._unwrap_traversal, box)
         if not inplace:
-            return distances.apply_PBC(coords, box)
+            return packed
 
-        atomgroup.universe.coord.positions[atomgroup.indices] = distances.apply_PBC(coords, box)
+        atomgroup.universe.coord.positions[atomgroup.indices] = packed
 
         return atomgroup.universe.coord.positions[atomgroup.indices]
 
-    def wrap(self, compound="atoms", center="com", box=None):
+    def wrap(self, compound="atoms", center="com", box=None, unwrap=False):
         """Shift the contents of this Group back into the unit cell.
 
         This is a more powerful version of :meth:`pack_into_box`, allowing
@@ -831,6 +1074,9 @@ class GroupBase(_MutableBase):
             by :attr:`MDAnalysis.coordinates.base.Timestep.dimensions`,
             ``[lx, ly, lz, alpha, beta, gamma]``. If ``None``, uses these
             timestep dimensions.
+        unwrap : bool
+            ``True`` to make all fragments whole (by following their bonds)
+            before the compounds are wrapped. Requires bonds.
 
         Notes
         -----
@@ -848,50 +1094,72 @@ class GroupBase(_MutableBase):
         specified, an the dimensions information from the current Timestep will
         be used.
 
+        The centers of all compounds are computed in one pass from per-atom
+        compound indices and the shift of each compound is broadcast back to
+        its atoms with fancy indexing, so that no Python-level loop over the
+        compounds is involved.
+
         .. note::
            wrap with all default keywords is identical to :meth:`pack_into_box`
 
 
         .. versionadded:: 0.9.2
+        .. versionchanged:: 0.16.0
+           Added `unwrap` keyword; the compounds are wrapped without a
+           Python-level loop and centers are computed without applying
+           periodic boundary conditions to the atoms.
         """
         atomgroup = self.atoms.unique
         if compound.lower() == "atoms":
-            return atomgroup.pack_into_box(box=box)
-
-        if compound.lower() == 'group':
-            objects = [atomgroup.atoms]
-        elif compound.lower() == 'residues':
-            objects = atomgroup.residues
-        elif compound.lower() == 'segments':
-            objects = atomgroup.segments
-        elif compound.lower() == 'fragments':
-            objects = atomgroup.fragments
+            return atomgroup.pack_into_box(box=box, unwrap=unwrap)
+
+        if unwrap:
+            if box is None:
+                box = atomgroup.dimensions
+            atomgroup.positions = mdamath.unwrap_bonded(
+                atomgroup.positions, self._unwrap_traversal, box)
+
+        comp = compound.lower()
+        if comp == 'group':
+            atoms = atomgroup
+        elif comp in ('residues', 'segments', 'fragments'):
+            # compounds are shifted as a whole, including their atoms that
+            # are not part of this group
+            compound_indices = np.unique(atomgroup._get_compound_indices(comp))
+            all_atoms = self._u.atoms
+            atoms = all_atoms[np.in1d(all_atoms._get_compound_indices(comp),
+                                      compound_indices)]
         else:
             raise ValueError("Unrecognised compound definition: {0}"
                              "Please use one of 'group' 'residues' 'segments'"
                              "or 'fragments'".format(compound))
 
-# TODO: ADD TRY-EXCEPT FOR MASSES PRESENCE
         if center.lower() in ('com', 'centerofmass'):
-            centers = np.vstack([o.atoms.center_of_mass() for o in objects])
+            try:
+                weights = atoms.masses
+            except AttributeError:
+                raise NoDataError("Wrapping by center of mass requires masses;"
+                                  " use center='cog' instead")
         elif center.lower() in ('cog', 'centroid', 'centerofgeometry'):
-            centers = np.vstack([o.atoms.center_of_geometry() for o in objects])
+            weights = None
         else:
             raise ValueError("Unrecognised center definition: {0}"
                              "Please use one of 'com' or 'cog'".format(center))
-        centers = centers.astype(np.float32)
 
         if box is None:
             box = atomgroup.dimensions
 
-        # calculate shift per object center
+        _, compound_ix = np.unique(atoms._get_compound_indices(comp),
+                                   return_inverse=True)
+        n_compounds = compound_ix.max() + 1 if len(compound_ix) else 0
+        positions = atoms.positions
+        centers = _compound_centers(positions.astype(np.float64), compound_ix,
+                                    n_compounds, weights).astype(np.float32)
+
+        # calculate shift per compound center and broadcast it to the atoms
         dests = distances.apply_PBC(centers, box=box)
         shifts = dests - centers
-
-        for o, s in zip(objects, shifts):
-            # Save some needless shifts
-            if not all(s == 0.0):
-                o.atoms.translate(s)
+        atoms.positions = positions + shifts[compound_ix]
 
     def groupby(self, topattr):
         """Group together items in this group according to values of *topattr*
@@ -991,7 +1259,7 @@ class AtomGroup(GroupBase):
 
     def __getattr__(self, attr):
         # is this a known attribute failure?
-        if attr in ('fragments',):  # TODO: Generalise this to cover many attributes
+        if attr in ('fragments', 'fragindices'):  # TODO: Generalise this to cover many attributes
             # eg:
             # if attr in _ATTR_ERRORS:
             # raise NDE(_ATTR_ERRORS[attr])
@@ -1103,13 +1371,85 @@ class AtomGroup(GroupBase):
                   :class:`~MDAnalysis.core.universe.Universe.transfer_to_memory`
                   method was used.
 
+        The returned array is always a copy. For evenly spaced atoms the copy
+        is made from a basic slice rather than by fancy indexing; use
+        :meth:`positions_view` to avoid the copy altogether.
+
         """
-        return self._u.trajectory.ts.positions[self._ix]
+        ts = self._u.trajectory.ts
+        sl = self._ix_slice
+        if sl is None:
+            return ts.positions[self._ix]
+        return ts.positions[sl].copy()
 
     @positions.setter
     def positions(self, values):
         ts = self._u.trajectory.ts
-        ts.positions[self._ix, :] = values
+        sl = self._ix_slice
+        ts.positions[self._ix if sl is None else sl, :] = values
+
+    def positions_view(self):
+        """View of the coordinates of the atoms in the AtomGroup.
+
+        Unlike :attr:`positions`, no copy is made: the returned array is a
+        view into the coordinates of the current
+        :class:`~MDAnalysis.coordinates.base.Timestep`. This is only possible
+        if the atom indices of the group form an increasing, evenly spaced
+        sequence, e.g. for ``u.atoms``, a segment, a protein chain, or
+        slices such as ``u.atoms[10:1000:2]``.
+
+        Returns
+        -------
+        positions : numpy.ndarray
+            ``(n_atoms, 3)`` view of the coordinates.
+
+        Raises
+        ------
+        ValueError
+            if the atoms of the group can not be expressed as a slice of the
+            Universe's atoms
+
+        Notes
+        -----
+        Writing to the view changes the coordinates in the Timestep, exactly
+        like assigning to :attr:`positions`, and the same caveats about
+        changes not being reflected in any files apply.
+
+        The view refers to the coordinate buffer of the Timestep and should
+        only be used for the frame that is current when it was obtained:
+        after moving to another frame it may either contain the coordinates
+        of the new frame (if the reader reuses its buffer) or stale data.
+        Call :meth:`positions_view` again after every change of frame.
+
+        Examples
+        --------
+        Center a protein chain in place without temporary copies::
+
+            >>> chain = u.select_atoms('segid A')
+            >>> for ts in u.trajectory:
+            ...     x = chain.positions_view()
+            ...     x -= x.mean(axis=0)
+
+
+        .. versionadded:: 0.16.0
+        """
+        sl = self._ix_slice
+        if sl is None:
+            raise ValueError("The atoms of this AtomGroup are not evenly "
+                             "spaced in the Universe; their positions can "
+                             "not be accessed as a view. Use "
+                             "AtomGroup.positions to obtain a copy.")
+        return self._u.trajectory.ts.positions[sl]
+
+    @property
+    @util.cached('ix_slice')
+    def _ix_slice(self):
+        """Basic slice selecting the atoms of this group, or ``None``
+
+        ``None`` is returned if the atom indices are not an increasing, evenly
+        spaced sequence (with at least one atom).
+        """
+        return _indices_to_slice(self._ix)
 
     @property
     def velocities(self):
@@ -1126,16 +1466,18 @@ class AtomGroup(GroupBase):
 
         """
         ts = self._u.trajectory.ts
+        sl = self._ix_slice
         try:
-            return np.array(ts.velocities[self._ix])
+            return np.array(ts.velocities[self._ix if sl is None else sl])
         except (AttributeError, NoDataError):
             raise NoDataError("Timestep does not contain velocities")
 
     @velocities.setter
     def velocities(self, values):
         ts = self._u.trajectory.ts
+        sl = self._ix_slice
         try:
-            ts.velocities[self._ix, :] = values
+            ts.velocities[self._ix if sl is None else sl, :] = values
         except (AttributeError, NoDataError):
             raise NoDataError("Timestep does not contain velocities")
 
@@ -1150,16 +1492,20 @@ class AtomGroup(GroupBase):
 
         """
         ts = self._u.trajectory.ts
+        sl = self._ix_slice
         try:
-            return ts.forces[self._ix]
+            if sl is None:
+                return ts.forces[self._ix]
+            return ts.forces[sl].copy()
         except (AttributeError, NoDataError):
             raise NoDataError("Timestep does not contain forces")
 
     @forces.setter
     def forces(self, values):
         ts = self._u.trajectory.ts
+        sl = self._ix_slice
         try:
-            ts.forces[self._ix, :] = values
+            ts.forces[self._ix if sl is None else sl, :] = values
         except (AttributeError, NoDataError):
             raise NoDataError("Timestep does not contain forces")
 
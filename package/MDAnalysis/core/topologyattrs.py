@@ -630,7 +630,7 @@ class Masses(AtomAttr):
 
         return masses
 
-    def center_of_mass(group, pbc=None):
+    def center_of_mass(group, pbc=None, compound='group', unwrap=False):
         """Center of mass of the Group.
 
         Parameters
@@ -638,11 +638,18 @@ class Masses(AtomAttr):
         pbc : bool, optional
             If ``True``, move all atoms within the primary unit cell before
             calculation. [``False``]
+        compound : {'group', 'segments', 'residues', 'fragments'}, optional
+            If not 'group', return the centers of mass of each
+            :class:`Segment`, :class:`Residue`, or fragment as an
+            ``(n_compounds, 3)`` array. [``'group'``]
+        unwrap : bool, optional
+            If ``True``, unwrap each compound across the periodic boundaries
+            before calculating its center. [``False``]
 
         Returns
         -------
         center : ndarray
-            center of group given masses as weights
+            center of group given masses as weights, or of each compound
 
         Notes
         -----
@@ -650,9 +657,11 @@ class Masses(AtomAttr):
             ``True`` allows the *pbc* flag to be used by default.
 
         .. versionchanged:: 0.8 Added `pbc` parameter
+        .. versionchanged:: 0.16.0
+           Added `compound` and `unwrap` parameters
         """
         return group.atoms.center(weights=group.atoms.masses,
-                                  pbc=pbc)
+                                  pbc=pbc, compound=compound, unwrap=unwrap)
 
     transplants[GroupBase].append(
         ('center_of_mass', center_of_mass))
@@ -1275,6 +1284,14 @@ class Segids(SegmentAttr):
         ('_get_named_segment', _get_named_segment))
 
 
+def _object_array(values):
+    """1D object array of `values`, keeping tuples as single elements"""
+    arr = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        arr[i] = v
+    return arr
+
+
 class _Connection(AtomAttr):
     """Base class for connectivity between atoms"""
     def __init__(self, values, types=None, guessed=False, order=None):
@@ -1313,27 +1330,43 @@ class _Connection(AtomAttr):
                 bd[a].append((b, t, g, o))
         return bd
 
+    @property
+    @cached('arrays')
+    def _arrays(self):
+        """Lazily built array representation of all connections
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            ``(n, k)`` array of atom indices, each row oriented so that the
+            first index is lower than the last (as in :attr:`_bondDict`).
+        types, guessed, order : numpy.ndarray
+            One entry per connection.
+        """
+        n = len(self.values)
+        if n:
+            indices = np.array(self.values, dtype=np.int64).reshape(n, -1)
+        else:
+            indices = np.empty((0, 2), dtype=np.int64)
+        flip = indices[:, 0] > indices[:, -1]
+        indices[flip] = indices[flip, ::-1]
+        return (indices,
+                _object_array(self.types),
+                np.asarray(self._guessed, dtype=bool),
+                _object_array(self.order))
+
     def set_atoms(self, ag):
         return NotImplementedError("Cannot set bond information")
 
     def get_atoms(self, ag):
-        try:
-            unique_bonds = set(itertools.chain(
-                *[self._bondDict[a] for a in ag._ix]))
-        except TypeError:
-            # maybe we got passed an Atom
-            unique_bonds = self._bondDict[ag._ix]
-        bond_idx, types, guessed, order = np.hsplit(
-            np.array(sorted(unique_bonds)), 4)
-        bond_idx = np.array(bond_idx.ravel().tolist(), dtype=np.int32)
-        types = types.ravel()
-        guessed = guessed.ravel()
-        order = order.ravel()
-        return TopologyGroup(bond_idx, ag._u,
+        indices, types, guessed, order = self._arrays
+        # every connection that involves any atom of the group
+        mask = np.in1d(indices, ag._ix).reshape(indices.shape).any(axis=1)
+        return TopologyGroup(indices[mask], ag._u,
                              self.singular[:-1],
-                             types,
-                             guessed,
-                             order)
+                             types[mask],
+                             guessed[mask],
+                             order[mask])
 
     def add_bonds(self, values, types=None, guessed=True, order=None):
         if types is None:
@@ -1350,11 +1383,12 @@ class _Connection(AtomAttr):
                 self.types.append(t)
                 self._guessed.append(g)
                 self.order.append(o)
-        # kill the old cache of bond Dict
-        try:
-            del self._cache['bd']
-        except KeyError:
-            pass
+        # kill the old caches of bond Dict and arrays
+        for key in ('bd', 'arrays'):
+            try:
+                del self._cache[key]
+            except KeyError:
+                pass
 
 
 class Bonds(_Connection):
@@ -1411,6 +1445,31 @@ class Bonds(_Connection):
         ('fragments', property(fragments, None, None,
                                fragments.__doc__)))
 
+    def fragindex(self):
+        """The index of the fragment that this Atom is part of
+
+        .. versionadded:: 0.16.0
+        """
+        return self.universe._fragindices[self.ix]
+
+    def fragindices(self):
+        """Index of the fragment each Atom in this AtomGroup is part of
+
+        Fragments are numbered in the order of :attr:`fragments`, i.e. by
+        their first atom index.
+
+        .. versionadded:: 0.16.0
+        """
+        return self.universe._fragindices[self.ix]
+
+    transplants[Atom].append(
+        ('fragindex', property(fragindex, None, None,
+                               fragindex.__doc__)))
+
+    transplants[AtomGroup].append(
+        ('fragindices', property(fragindices, None, None,
+                                 fragindices.__doc__)))
+
 
 class Angles(_Connection):
     """Angles between three atoms
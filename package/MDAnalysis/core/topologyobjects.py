@@ -393,13 +393,15 @@ class TopologyDict(object):
         self.dict = dict()
         self._u = topologygroup.universe
         self.toptype = topologygroup.btype
+        self._tg = topologygroup
 
-        for b in topologygroup:
-            btype = b.type
+        # The dict maps each type to the positions of its members in the
+        # TopologyGroup; no TopologyObject is created.
+        for i, btype in enumerate(topologygroup._types()):
             try:
-                self.dict[btype] += [b]
+                self.dict[btype].append(i)
             except KeyError:
-                self.dict[btype] = [b]
+                self.dict[btype] = [i]
 
         self._removeDupes()
 
@@ -449,9 +451,7 @@ class TopologyDict(object):
             else:
                 selection = self.dict[key[::-1]]
 
-            bix = np.vstack([s.indices for s in selection])
-
-            return TopologyGroup(bix, self._u, btype=self.toptype)
+            return self._tg[np.array(selection)]
         else:
             raise KeyError(key)
 
@@ -557,17 +557,12 @@ class TopologyGroup(object):
             self._bondtypes = type[uniq_idx]
             self._guessed = guessed[uniq_idx]
             self._order = order[uniq_idx]
-
-            # Create vertical AtomGroups
-            self._ags = [universe.atoms[self._bix[:, i]]
-                         for i in range(self._bix.shape[1])]
         else:
             # Empty TopologyGroup
             self._bix = np.array([])
             self._bondtypes = np.array([])
             self._guessed = np.array([])
             self._order = np.array([])
-            self._ags = []
         self._u = universe
 
         self._cache = dict()  # used for topdict saving
@@ -576,6 +571,42 @@ class TopologyGroup(object):
     def universe(self):
         return self._u
 
+    @property
+    @cached('ags')
+    def _ags(self):
+        """Vertical AtomGroups, created on first use"""
+        if not len(self):
+            return []
+        return [self._u.atoms[self._bix[:, i]]
+                for i in range(self._bix.shape[1])]
+
+    def _types(self):
+        """Type of each member of this group, as given by its ``type``
+
+        Members without an explicit type get the tuple of the types of their
+        atoms, which are looked up for all members at once.
+        """
+        types = list(self._bondtypes.ravel())
+        missing = [i for i, t in enumerate(types) if t is None]
+        if missing:
+            atomtypes = self._u.atoms.types[self._bix[missing]]
+            for i, t in zip(missing, atomtypes.tolist()):
+                types[i] = tuple(t)
+        return types
+
+    def _coordinates(self, pbc):
+        """Coordinates of each vertex of the members, and the box for pbc
+
+        All columns are taken from the current Timestep in one fancy
+        indexing operation each, without going through AtomGroups.
+        """
+        ts = self._u.trajectory.ts
+        positions = ts.positions
+        coords = [positions[self._bix[:, i]]
+                  for i in range(self._bix.shape[1])]
+        box = ts.dimensions if pbc else None
+        return coords, box
+
     def select_bonds(self, selection):
         """Retrieves a selection from this topology group based on types.
 
@@ -735,7 +766,7 @@ class TopologyGroup(object):
            Allows indexing via boolean numpy array
         """
         # Grab a single Item, similar to Atom/AtomGroup relationship
-        if isinstance(item, int):
+        if isinstance(item, (int, np.integer)):
             outclass = {'bond': Bond,
                         'angle': Angle,
                         'dihedral': Dihedral,
@@ -860,20 +891,16 @@ class TopologyGroup(object):
               note that this will be overwritten
 
         Uses cython implementation
+
+        .. versionchanged:: 0.16.0
+           Coordinates are gathered directly from the Timestep
         """
         if not self.btype == 'bond':
             raise TypeError("TopologyGroup is not of type 'bond'")
-        if not result:
+        if result is None:
             result = np.zeros(len(self), np.float64)
-        if pbc:
-            return distances.calc_bonds(self._ags[0].positions,
-                                        self._ags[1].positions,
-                                        box=self._ags[0].dimensions,
-                                        result=result)
-        else:
-            return distances.calc_bonds(self._ags[0].positions,
-                                        self._ags[1].positions,
-                                        result=result)
+        (x1, x2), box = self._coordinates(pbc)
+        return distances.calc_bonds(x1, x2, box=box, result=result)
 
     def _anglesSlow(self):  # pragma: no cover
         """Slow version of angle (numpy implementation)"""
@@ -906,23 +933,16 @@ class TopologyGroup(object):
 
         .. versionchanged :: 0.9.0
            Added *pbc* option (default ``False``)
+        .. versionchanged:: 0.16.0
+           Coordinates are gathered directly from the Timestep
 
         """
         if not self.btype == 'angle':
             raise TypeError("TopologyGroup is not of type 'angle'")
-        if not result:
+        if result is None:
             result = np.zeros(len(self), np.float64)
-        if pbc:
-            return distances.calc_angles(self._ags[0].positions,
-                                         self._ags[1].positions,
-                                         self._ags[2].positions,
-                                         box=self._ags[0].dimensions,
-                                         result=result)
-        else:
-            return distances.calc_angles(self._ags[0].positions,
-                                         self._ags[1].positions,
-                                         self._ags[2].positions,
-                                         result=result)
+        (x1, x2, x3), box = self._coordinates(pbc)
+        return distances.calc_angles(x1, x2, x3, box=box, result=result)
 
     def _dihedralsSlow(self):  # pragma: no cover
         """Slow version of dihedral (numpy implementation)"""
@@ -960,22 +980,14 @@ class TopologyGroup(object):
 
         .. versionchanged:: 0.9.0
            Added *pbc* option (default ``False``)
+        .. versionchanged:: 0.16.0
+           Coordinates are gathered directly from the Timestep
         """
         if self.btype not in ['dihedral', 'improper']:
             raise TypeError("TopologyGroup is not of type 'dihedral' or "
                             "'improper'")
-        if not result:
+        if result is None:
             result = np.zeros(len(self), np.float64)
-        if pbc:
-            return distances.calc_dihedrals(self._ags[0].positions,
-                                            self._ags[1].positions,
-                                            self._ags[2].positions,
-                                            self._ags[3].positions,
-                                            box=self._ags[0].dimensions,
-                                            result=result)
-        else:
-            return distances.calc_dihedrals(self._ags[0].positions,
-                                            self._ags[1].positions,
-                                            self._ags[2].positions,
-                                            self._ags[3].positions,
-                                            result=result)
+        (x1, x2, x3, x4), box = self._coordinates(pbc)
+        return distances.calc_dihedrals(x1, x2, x3, x4, box=box,
+                                        result=result)
@@ -829,6 +829,21 @@ class Universe(object):
 
         return fragdict
 
+    @property
+    @cached('fragindices')
+    def _fragindices(self):
+        """Array of the fragment index of each atom
+
+        Fragments are numbered by their first atom index.
+
+        .. versionadded:: 0.16.0
+        """
+        frags = sorted(set(self._fragdict.values()), key=lambda f: f.ix[0])
+        fragindices = np.empty(len(self.atoms), dtype=np.int64)
+        for i, f in enumerate(frags):
+            fragindices[f.ix] = i
+        return fragindices
+
 
 # TODO: what is the point of this function???
 def as_Universe(*args, **kwargs):
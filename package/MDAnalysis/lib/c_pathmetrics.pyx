@@ -0,0 +1,183 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- http://www.mdanalysis.org
+# Copyright (c) 2006-2016 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+#
+
+"""
+Path similarity metrics --- :mod:`MDAnalysis.lib.c_pathmetrics`
+===============================================================
+
+Compiled engines for the Hausdorff and discrete Fréchet distances between two
+paths, which are used by :mod:`MDAnalysis.analysis.psa`. A path is given as a
+C-contiguous array of shape ``(n_frames, n_coordinates)``; ``float32`` paths
+are processed without conversion. The functions return the largest or
+coupling *squared* distance between frames; dividing by the number of atoms
+and taking the root gives the RMSD-like path distance.
+
+Neither function stores the matrix of distances between all pairs of frames.
+
+.. autofunction:: hausdorff_sq
+.. autofunction:: discrete_frechet_sq
+
+.. versionadded:: 0.16.0
+"""
+
+cimport cython
+from cython cimport floating
+import numpy as np
+
+cdef extern from "float.h" nogil:
+    double DBL_MAX
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline double _sqdist(floating[:, ::1] P, Py_ssize_t i,
+                           floating[:, ::1] Q, Py_ssize_t j,
+                           double bound) nogil:
+    """Squared distance of frames P[i] and Q[j]; the summation is abandoned
+    (returning a value > *bound*) as soon as the partial sum exceeds *bound*."""
+    cdef Py_ssize_t k, n = P.shape[1]
+    cdef double d, s = 0.0
+    for k in range(n):
+        d = P[i, k] - Q[j, k]
+        s += d * d
+        # check the bound once per atom
+        if k % 3 == 2 and s > bound:
+            return s
+    return s
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double _directed_hausdorff(floating[:, ::1] P, floating[:, ::1] Q,
+                                Py_ssize_t[::1] p_order, Py_ssize_t[::1] q_order,
+                                double cmax) nogil:
+    """Largest squared distance of a frame in P to its nearest frame in Q
+    (if larger than *cmax*, otherwise *cmax*), after Taha & Hanbury."""
+    cdef Py_ssize_t i, j
+    cdef double cmin, d
+    for i in range(p_order.shape[0]):
+        cmin = DBL_MAX
+        for j in range(q_order.shape[0]):
+            d = _sqdist(P, p_order[i], Q, q_order[j], cmin)
+            if d < cmax:
+                # P[i] cannot increase the maximum: skip the rest of the row
+                cmin = d
+                break
+            if d < cmin:
+                cmin = d
+        if cmin > cmax:
+            cmax = cmin
+    return cmax
+
+
+def hausdorff_sq(floating[:, ::1] P, floating[:, ::1] Q):
+    """Squared Hausdorff distance between the frames of paths *P* and *Q*.
+
+    The directed distances are calculated with the early break algorithm of
+    [Taha2015]_: the frames are visited in random order and the search for the
+    nearest neighbor of a frame stops as soon as a frame closer than the
+    current maximum is found; the summation of a squared distance stops once
+    it exceeds the current nearest neighbor distance. The result is exact.
+
+    Parameters
+    ----------
+    P, Q : numpy.ndarray
+        paths of shape ``(n_frames, n_coordinates)``, both ``float32`` or
+        both ``float64``
+
+    Returns
+    -------
+    float
+        largest squared distance of a frame of either path to the nearest
+        frame of the other path
+
+    References
+    ----------
+    .. [Taha2015] A. A. Taha and A. Hanbury. An efficient algorithm for
+       calculating the exact Hausdorff distance. *IEEE Transactions On
+       Pattern Analysis And Machine Intelligence*, 37:2153-63, 2015.
+    """
+    if P.shape[1] != Q.shape[1]:
+        raise ValueError("P and Q must have the same number of coordinates")
+    if P.shape[0] == 0 or Q.shape[0] == 0:
+        raise ValueError("P and Q must contain at least one frame")
+    # a fixed seed keeps the run time reproducible; the result does not
+    # depend on the order
+    random = np.random.RandomState(1)
+    cdef Py_ssize_t[::1] p_order = random.permutation(P.shape[0]).astype(np.intp)
+    cdef Py_ssize_t[::1] q_order = random.permutation(Q.shape[0]).astype(np.intp)
+    cdef double cmax
+    with nogil:
+        cmax = _directed_hausdorff(P, Q, p_order, q_order, 0.0)
+        cmax = _directed_hausdorff(Q, P, q_order, p_order, cmax)
+    return cmax
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def discrete_frechet_sq(floating[:, ::1] P, floating[:, ::1] Q):
+    """Squared discrete Fréchet distance between paths *P* and *Q*.
+
+    The coupling distances are calculated iteratively by dynamic programming
+    over the frames of *P*, keeping only the coupling distances of the
+    previous and the current frame of *P* to all frames of *Q* (two rows of
+    ``len(Q)`` values).
+
+    Parameters
+    ----------
+    P, Q : numpy.ndarray
+        paths of shape ``(n_frames, n_coordinates)``, both ``float32`` or
+        both ``float64``
+
+    Returns
+    -------
+    float
+        squared coupling distance of the full paths
+    """
+    if P.shape[1] != Q.shape[1]:
+        raise ValueError("P and Q must have the same number of coordinates")
+    if P.shape[0] == 0 or Q.shape[0] == 0:
+        raise ValueError("P and Q must contain at least one frame")
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n_p = P.shape[0], n_q = Q.shape[0]
+    cdef double[:, ::1] rows = np.empty((2, n_q))
+    cdef double *prev = &rows[0, 0]
+    cdef double *cur = &rows[1, 0]
+    cdef double *swap
+    cdef double d, c
+
+    with nogil:
+        for i in range(n_p):
+            for j in range(n_q):
+                d = _sqdist(P, i, Q, j, DBL_MAX)
+                if i == 0:
+                    c = cur[j - 1] if j > 0 else d
+                elif j == 0:
+                    c = prev[0]
+                else:
+                    c = min(prev[j], cur[j - 1], prev[j - 1])
+                cur[j] = d if d > c else c
+            swap = prev
+            prev = cur
+            cur = swap
+    return prev[n_q - 1]
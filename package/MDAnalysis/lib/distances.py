@@ -59,6 +59,9 @@ Functions
 .. autofunction:: calc_angles(atom1, atom2, atom3 [,box [, result [, backend]]])
 .. autofunction:: calc_dihedrals(atom1, atom2, atom3, atom4 [,box [, result [, backend]]])
 .. autofunction:: apply_PBC(coordinates, box [, backend])
+.. autofunction:: minimize_vectors(vectors, box)
+.. autofunction:: capped_distance(reference, configuration, max_cutoff [, box [, return_distances]])
+.. autofunction:: iter_capped_distance(reference, configuration, max_cutoff [, box [, max_pairs]])
 .. autofunction:: transform_RtoS(coordinates, box [, backend])
 .. autofunction:: transform_StoR(coordinates, box [,backend])
 
@@ -839,6 +842,273 @@ def apply_PBC(incoords, box, backend="serial"):
     return coords
 
 
+def minimize_vectors(vectors, box):
+    """Apply the minimum image convention to an array of vectors
+
+    Each vector (e.g. a separation between two atoms) is replaced by its
+    shortest periodic image. The calculation is fully vectorized and, unlike
+    the distance functions, handles separations spanning several box lengths.
+
+    Parameters
+    ----------
+    vectors : array
+        A n x 3 array of vectors.
+    box : array
+        The unitcell dimesions for this system; can be either orthogonal or
+        triclinic information. The dimensions must be provided in the same
+        format as returned by
+        :attr:`MDAnalysis.coordinates.base.Timestep.dimensions`: ``[lx, ly, lz,
+        alpha, beta, gamma]``.
+
+    Returns
+    -------
+    minimized_vectors : array
+        Vectors of the same shape and dtype as `vectors`, each replaced by
+        its minimum image.
+
+    Notes
+    -----
+    For triclinic boxes the box vectors are first subtracted in the order
+    *c*, *b*, *a*, as in the C implementation of the distance functions,
+    and the shortest of the 27 neighbouring images of the result is then
+    selected.
+
+
+    .. versionadded:: 0.16.0
+    """
+    vectors = np.asarray(vectors)
+    dtype = vectors.dtype if vectors.dtype.kind == 'f' else np.float64
+    dx = np.array(vectors, dtype=np.float64, ndmin=2)
+
+    boxtype = _box_check(box)
+    if boxtype == 'ortho':
+        L = box[:3].astype(np.float64)
+        dx -= L * np.round(dx / L)
+    else:
+        if boxtype == 'tri_box':
+            box = triclinic_vectors(box)
+        elif boxtype == 'tri_vecs_bad':
+            box = triclinic_vectors(triclinic_box(box[0], box[1], box[2]))
+        box = box.astype(np.float64)
+        for i in (2, 1, 0):
+            dx -= np.round(dx[:, i] / box[i, i])[:, None] * box[i]
+        # in skewed cells a neighbouring image may still be closer
+        shifts = np.array([[i, j, k] for i in (-1, 0, 1)
+                           for j in (-1, 0, 1) for k in (-1, 0, 1)],
+                          dtype=np.float64).dot(box)
+        images = dx[:, None, :] + shifts[None, :, :]
+        closest = np.argmin((images * images).sum(axis=2), axis=1)
+        dx = images[np.arange(len(dx)), closest]
+
+    return dx.reshape(vectors.shape).astype(dtype)
+
+
+def capped_distance(reference, configuration, max_cutoff, box=None,
+                    return_distances=True):
+    """Find all pairs between two coordinate sets closer than a cutoff
+
+    Unlike :func:`distance_array`, the full distance matrix is never built:
+    the positions are sorted into a grid of cells at least *max_cutoff*
+    wide, and only positions in neighbouring cells are compared. Memory use
+    thus scales with the number of pairs found rather than with
+    ``len(reference) * len(configuration)``.
+
+    Parameters
+    ----------
+    reference : array
+        Reference coordinate array of shape ``(n, 3)``.
+    configuration : array
+        Configuration coordinate array of shape ``(m, 3)``.
+    max_cutoff : float
+        Pairs separated by at most *max_cutoff* are returned.
+    box : numpy.array or None
+        Dimensions of the cell; if provided, the minimum image convention is
+        applied. The dimensions must be provided in the same format as
+        returned by :attr:`MDAnalysis.coordinates.base.Timestep.dimensions`:
+        ``[lx, ly, lz, alpha, beta, gamma]``.
+    return_distances : bool, optional
+        Also return the distance of each pair. [``True``]
+
+    Returns
+    -------
+    pairs : numpy.array
+        ``(k, 2)`` array of indices; ``pairs[i, 0]`` indexes *reference* and
+        ``pairs[i, 1]`` indexes *configuration*.
+    distances : numpy.array
+        ``(k,)`` array with the distance of each pair (only if
+        *return_distances* is ``True``).
+
+    See Also
+    --------
+    iter_capped_distance : yields the same pairs in bounded-size chunks
+
+
+    .. versionadded:: 0.16.0
+    """
+    pairs = [np.empty((0, 2), dtype=np.int64)]
+    distances = [np.empty(0, dtype=np.float64)]
+    for p, d in iter_capped_distance(reference, configuration, max_cutoff,
+                                     box=box):
+        pairs.append(p)
+        distances.append(d)
+    pairs = np.concatenate(pairs)
+    if return_distances:
+        return pairs, np.concatenate(distances)
+    return pairs
+
+
+def iter_capped_distance(reference, configuration, max_cutoff, box=None,
+                         max_pairs=2**20):
+    """Iterate over chunks of the pairs closer than a cutoff
+
+    Generator version of :func:`capped_distance`: pairs are yielded in
+    chunks of roughly at most *max_pairs* candidates so that callers which
+    only reduce the pairs (e.g. histogram them) run in bounded memory.
+
+    Parameters
+    ----------
+    reference : array
+        Reference coordinate array of shape ``(n, 3)``.
+    configuration : array
+        Configuration coordinate array of shape ``(m, 3)``.
+    max_cutoff : float
+        Pairs separated by at most *max_cutoff* are returned.
+    box : numpy.array or None
+        Dimensions of the cell; if provided, the minimum image convention is
+        applied.
+    max_pairs : int, optional
+        Approximate number of candidate pairs examined per chunk.
+
+    Yields
+    ------
+    pairs : numpy.array
+        ``(k, 2)`` array of (reference, configuration) indices.
+    distances : numpy.array
+        ``(k,)`` array of distances.
+
+    Notes
+    -----
+    If the box is too small for a grid of at least three cells per
+    dimension, all pairs are compared (in chunks) with the minimum image
+    convention instead.
+
+
+    .. versionadded:: 0.16.0
+    """
+    ref = np.asarray(reference, dtype=np.float64).reshape(-1, 3)
+    conf = np.asarray(configuration, dtype=np.float64).reshape(-1, 3)
+    if len(ref) == 0 or len(conf) == 0:
+        return
+    if box is not None:
+        box = np.asarray(box, dtype=np.float32)
+        if box.shape == (6,) and not box[:3].any():
+            box = None
+
+    if box is None:
+        lo = np.minimum(ref.min(axis=0), conf.min(axis=0))
+        extent = np.maximum(ref.max(axis=0), conf.max(axis=0)) - lo
+        ncells = np.maximum((extent // max(max_cutoff, 1e-6)).astype(np.int64),
+                            1)
+        ncells = _limit_cells(ncells, len(conf))
+        width = np.where(extent > 0, extent / ncells, 1.0)
+        ref_cells = np.minimum((ref - lo) // width, ncells - 1)
+        conf_cells = np.minimum((conf - lo) // width, ncells - 1)
+    else:
+        boxtype = _box_check(box)
+        if boxtype == 'ortho':
+            vecs = np.diag(box[:3])
+        elif boxtype == 'tri_box':
+            vecs = triclinic_vectors(box)
+        elif boxtype == 'tri_vecs_bad':
+            vecs = triclinic_vectors(triclinic_box(box[0], box[1], box[2]))
+        else:
+            vecs = box
+        vecs = vecs.astype(np.float64)
+        # perpendicular width of the box along each cell axis
+        volume = abs(np.linalg.det(vecs))
+        faces = np.array([np.cross(vecs[1], vecs[2]),
+                          np.cross(vecs[2], vecs[0]),
+                          np.cross(vecs[0], vecs[1])])
+        widths = volume / np.sqrt((faces * faces).sum(axis=1))
+        ncells = (widths // max(max_cutoff, 1e-6)).astype(np.int64)
+        ncells = _limit_cells(ncells, len(conf))
+        if (ncells < 3).any():
+            # neighbouring cells would be visited more than once
+            chunk = max(1, max_pairs // len(conf))
+            for start in range(0, len(ref), chunk):
+                d = distance_array(ref[start:start + chunk].astype(np.float32),
+                                   conf.astype(np.float32), box=box)
+                i, j = np.nonzero(d <= max_cutoff)
+                yield np.column_stack((i + start, j)), d[i, j]
+            return
+        inverse = np.linalg.inv(vecs)
+        ref_cells = _fractional_cells(ref, inverse, ncells)
+        conf_cells = _fractional_cells(conf, inverse, ncells)
+
+    ref_cells = ref_cells.astype(np.int64)
+    conf_cells = conf_cells.astype(np.int64)
+    strides = np.array([ncells[1] * ncells[2], ncells[2], 1])
+    conf_flat = conf_cells.dot(strides)
+    order = np.argsort(conf_flat, kind='mergesort')
+    cell_start = np.zeros(ncells.prod() + 1, dtype=np.int64)
+    cell_start[1:] = np.cumsum(np.bincount(conf_flat,
+                                           minlength=ncells.prod()))
+
+    offsets = np.array([[i, j, k] for i in (-1, 0, 1)
+                        for j in (-1, 0, 1) for k in (-1, 0, 1)])
+    per_ref = 27 * len(conf) / float(ncells.prod())
+    chunk = max(1, int(max_pairs / max(per_ref, 1.0)))
+    for start in range(0, len(ref), chunk):
+        cells = ref_cells[start:start + chunk]
+        index = np.arange(start, start + len(cells))
+        i, j = [], []
+        for offset in offsets:
+            neighbour = cells + offset
+            if box is None:
+                valid = ((neighbour >= 0) & (neighbour < ncells)).all(axis=1)
+            else:
+                neighbour %= ncells
+                valid = np.ones(len(cells), dtype=bool)
+            flat = neighbour[valid].dot(strides)
+            first = cell_start[flat]
+            counts = cell_start[flat + 1] - first
+            total = counts.sum()
+            if total == 0:
+                continue
+            # positions of all members of each neighbour cell in `order`
+            ends = np.cumsum(counts)
+            pos = np.arange(total) - np.repeat(ends - counts - first, counts)
+            i.append(np.repeat(index[valid], counts))
+            j.append(order[pos])
+        if not i:
+            continue
+        i = np.concatenate(i)
+        j = np.concatenate(j)
+        dx = conf[j] - ref[i]
+        if box is not None:
+            dx = minimize_vectors(dx, box)
+        d = np.sqrt((dx * dx).sum(axis=1))
+        close = d <= max_cutoff
+        yield np.column_stack((i[close], j[close])), d[close]
+
+
+def _limit_cells(ncells, n):
+    """Coarsen a cell grid to at most about ``8 * n`` cells"""
+    ncells = np.maximum(ncells, 1)
+    limit = max(8 * n, 27)
+    if ncells.prod() > limit:
+        scale = (ncells.prod() / float(limit)) ** (1.0 / 3)
+        ncells = np.maximum((ncells / scale).astype(np.int64), 1)
+    return ncells
+
+
+def _fractional_cells(coords, inverse, ncells):
+    """Grid cell of each position in box-fractional coordinates"""
+    s = coords.dot(inverse)
+    s -= np.floor(s)
+    return np.minimum((s * ncells).astype(np.int64), ncells - 1)
+
+
 applyPBC = deprecate(apply_PBC,
                      old_name='applyPBC',
                      new_name='apply_PBC',
@@ -35,6 +35,8 @@ Helper functions for common mathematical operations
 .. autofunction:: triclinic_vectors
 .. autofunction:: box_volume
 .. autofunction:: make_whole
+.. autofunction:: bond_traversal
+.. autofunction:: unwrap_bonded
 
 .. versionadded:: 0.11.0
 """
@@ -414,6 +416,153 @@ def make_whole(atomgroup, reference_atom=None):
             processed.add(atom)
 
 
+def bond_traversal(bonds, n_atoms, roots=None):
+    """Breadth-first traversal of a bond graph, level by level
+
+    The traversal only depends on the topology, so it can be computed once and
+    then be reused by :func:`unwrap_bonded` for every frame of a trajectory.
+
+    Parameters
+    ----------
+    bonds : array_like
+        ``(n_bonds, 2)`` array of the indices of bonded atoms, each in the
+        range ``[0, n_atoms)``.
+    n_atoms : int
+        Number of atoms in the graph.
+    roots : array_like, optional
+        Atoms to start the traversal from. By default the atom with the lowest
+        index in each connected fragment is used.
+
+    Returns
+    -------
+    roots : numpy.ndarray
+        Indices of the atoms the traversal starts from.
+    levels : list
+        One ``(parents, children)`` tuple of index arrays per level of the
+        spanning tree, in traversal order. Each child is bonded to its parent
+        and appears exactly once. Atoms that cannot be reached from any root
+        do not appear.
+
+    Notes
+    -----
+    Both the decomposition into fragments and the traversal itself are
+    vectorized; the number of Python-level iterations is set by the depth of
+    the deepest spanning tree, not by the number of atoms or fragments.
+
+
+    .. versionadded:: 0.16.0
+    """
+    bonds = np.asarray(bonds, dtype=np.int64).reshape(-1, 2)
+    bonds = bonds[bonds[:, 0] != bonds[:, 1]]
+
+    # adjacency list in CSR layout with each bond stored in both directions
+    src = np.concatenate([bonds[:, 0], bonds[:, 1]])
+    dst = np.concatenate([bonds[:, 1], bonds[:, 0]])
+    dst = dst[np.argsort(src, kind='mergesort')]
+    indptr = np.zeros(n_atoms + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(src, minlength=n_atoms))
+
+    if roots is None:
+        # Connected fragments by minimum label propagation with pointer
+        # jumping; at convergence each atom is labelled with the lowest atom
+        # index of its fragment.
+        labels = np.arange(n_atoms)
+        while True:
+            previous = labels
+            labels = labels.copy()
+            np.minimum.at(labels, bonds[:, 0], labels[bonds[:, 1]])
+            np.minimum.at(labels, bonds[:, 1], labels[bonds[:, 0]])
+            labels = labels[labels]
+            if np.array_equal(labels, previous):
+                break
+        roots = np.flatnonzero(labels == np.arange(n_atoms))
+    else:
+        roots = np.unique(np.asarray(roots, dtype=np.int64))
+
+    visited = np.zeros(n_atoms, dtype=bool)
+    visited[roots] = True
+    frontier = roots
+    levels = []
+    while len(frontier):
+        counts = indptr[frontier + 1] - indptr[frontier]
+        parents = np.repeat(frontier, counts)
+        # position of each neighbour in the CSR arrays
+        offsets = (np.arange(counts.sum()) -
+                   np.repeat(np.cumsum(counts) - counts, counts))
+        children = dst[np.repeat(indptr[frontier], counts) + offsets]
+
+        new = ~visited[children]
+        children, first = np.unique(children[new], return_index=True)
+        parents = parents[new][first]
+        if len(children):
+            visited[children] = True
+            levels.append((parents, children))
+        frontier = children
+
+    return roots, levels
+
+
+def unwrap_bonded(coords, traversal, box):
+    """Make all fragments whole by unwrapping bonds across periodic boundaries
+
+    Starting from the roots of the traversal, which are not moved, each atom
+    is placed at the periodic image closest to the atom it is bonded to in
+    the spanning tree. The minimum image bond vectors of all tree bonds are
+    computed in a single call and the positions are then accumulated one tree
+    level at a time for all fragments at once.
+
+    Parameters
+    ----------
+    coords : numpy.ndarray
+        ``(n_atoms, 3)`` coordinates.
+    traversal : tuple
+        ``(roots, levels)`` as returned by :func:`bond_traversal`.
+    box : numpy.ndarray
+        The unitcell dimensions, either orthogonal or triclinic, in the format
+        returned by :attr:`MDAnalysis.coordinates.base.Timestep.dimensions`:
+        ``[lx, ly, lz, alpha, beta, gamma]``.
+
+    Returns
+    -------
+    coords : numpy.ndarray
+        Unwrapped copy of `coords`.
+
+    Raises
+    ------
+    ValueError
+        if the box has zero size
+
+    See Also
+    --------
+    make_whole : the single fragment version, using reference atoms
+
+
+    .. versionadded:: 0.16.0
+    """
+    from .distances import minimize_vectors
+
+    box = np.asarray(box, dtype=np.float32)
+    if box.shape == (6,) and (box[:3] == 0.0).any():
+        raise ValueError("Supplied box had zero size")
+
+    roots, levels = traversal
+    unwrapped = np.array(coords, dtype=np.float64)
+    if not levels:
+        return unwrapped.astype(np.asarray(coords).dtype)
+
+    parents = np.concatenate([p for p, _ in levels])
+    children = np.concatenate([c for _, c in levels])
+    vectors = minimize_vectors(unwrapped[children] - unwrapped[parents], box)
+
+    start = 0
+    for p, c in levels:
+        stop = start + len(c)
+        unwrapped[c] = unwrapped[p] + vectors[start:stop]
+        start = stop
+
+    return unwrapped.astype(np.asarray(coords).dtype)
+
+
 def one_to_many_pointers(Ni, Nj, i2j):
     """Based on a many to one mapping of i to j, create the reverse mapping
 
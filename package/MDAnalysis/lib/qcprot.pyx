@@ -121,10 +121,16 @@ reference:
 Functions
 ---------
 
-Users will typically use the :func:`CalcRMSDRotationalMatrix` function.
+Users will typically use the :func:`CalcRMSDRotationalMatrix` function. Many
+structures, e.g. all frames of a trajectory against one or several
+references, are handled in a single call by
+:func:`BatchCalcRMSDRotationalMatrix`, which runs without the GIL and in
+parallel (with OpenMP).
 
 .. autofunction:: CalcRMSDRotationalMatrix
 
+.. autofunction:: BatchCalcRMSDRotationalMatrix
+
 .. autofunction:: InnerProduct
 
 .. autofunction:: FastCalcRMSDAndRotation
@@ -135,8 +141,10 @@ import numpy as np
 cimport numpy as np
 
 import cython
+from cython cimport floating
+from cython.parallel cimport prange
 
-cdef extern from "math.h":
+cdef extern from "math.h" nogil:
     double sqrt(double x)
     double fabs(double x)
 
@@ -299,13 +307,36 @@ def FastCalcRMSDAndRotation(np.ndarray[np.float64_t, ndim=1] rot,
 
     Returns
     -------
-    rmsd : float
-        RMSD value for two structures
+    rmsd : float or None
+        RMSD value for two structures; ``None`` if *rot* is given but no
+        unique rotation exists (*rot* is then the identity)
 
 
     .. versionchanged:: 0.16.0
        Array sized changed from 3xN to Nx3.
     """
+    cdef double[::1] A_view = A
+    cdef double[::1] rot_view
+    cdef double rmsd
+    cdef bint degenerate = False
+    if rot is None:
+        return _fast_calc_rmsd_and_rotation(NULL, &A_view[0], E0, N, NULL)
+    rot_view = rot
+    rmsd = _fast_calc_rmsd_and_rotation(&rot_view[0], &A_view[0], E0, N,
+                                        &degenerate)
+    if degenerate:
+        # no unique rotation, rot is the identity
+        return None
+    return rmsd
+
+
+@cython.cdivision(True)
+cdef double _fast_calc_rmsd_and_rotation(double *rot, double *A, double E0,
+                                         int N, bint *degenerate) nogil:
+    """Nogil implementation of :func:`FastCalcRMSDAndRotation`; the rotation
+    matrix is only calculated if *rot* is not ``NULL``. If no unique
+    rotation exists, *rot* is set to the identity and *degenerate* (unless
+    ``NULL``) to true; the RMSD is returned in any case."""
     cdef double rmsd
     cdef double Sxx, Sxy, Sxz, Syx, Syy, Syz, Szx, Szy, Szz
     cdef double Szz2, Syy2, Sxx2, Sxy2, Syz2, Sxz2, Syx2, Szy2, Szx2,
@@ -313,7 +344,7 @@ def FastCalcRMSDAndRotation(np.ndarray[np.float64_t, ndim=1] rot,
     cdef double SxzpSzx, SyzpSzy, SxypSyx, SyzmSzy,
     cdef double SxzmSzx, SxymSyx, SxxpSyy, SxxmSyy
 
-    cdef np.ndarray[np.float64_t, ndim=1] C = np.zeros(4,)
+    cdef double C[4]
     cdef unsigned int i
     cdef double mxEigenV
     cdef double oldg = 0.0
@@ -391,7 +422,7 @@ def FastCalcRMSDAndRotation(np.ndarray[np.float64_t, ndim=1] rot,
     # but *negative* numbers due to floating point error
     rms = sqrt(fabs(2.0 * (E0 - mxEigenV)/N))
 
-    if (rot is None):
+    if rot == NULL:
         return rms # Don't bother with rotation.
 
     a11 = SxxpSyy + Szz-mxEigenV
@@ -460,8 +491,10 @@ def FastCalcRMSDAndRotation(np.ndarray[np.float64_t, ndim=1] rot,
                     # if qsqr is still too small, return the identity matrix. #
                     rot[0] = rot[4] = rot[8] = 1.0
                     rot[1] = rot[2] = rot[3] = rot[5] = rot[6] = rot[7] = 0.0
+                    if degenerate != NULL:
+                        degenerate[0] = True
 
-                    return
+                    return rms
 
 
     normq = sqrt(qsqr)
@@ -494,3 +527,185 @@ def FastCalcRMSDAndRotation(np.ndarray[np.float64_t, ndim=1] rot,
 
     return rms
 
+
+
+def BatchCalcRMSDRotationalMatrix(references, configurations, weights=None,
+                                  center=True, rotations=False):
+    """
+    Calculate the RMSDs (and rotation matrices) of many structures at once.
+
+    The minimum RMSD of every configuration to every reference is
+    calculated in a single parallel loop that runs without the GIL, so
+    that whole trajectories or all-vs-all RMSD matrices can be processed in
+    one call.
+
+    Parameters
+    ----------
+    references : array_like
+        reference structure(s) of shape (n_atoms, 3) or
+        (n_references, n_atoms, 3)
+    configurations : array_like
+        candidate structure(s) of shape (n_atoms, 3) or
+        (n_frames, n_atoms, 3); ``np.float32`` coordinates are used without
+        a copy, everything else is converted to ``np.float64``
+    weights : array_like (optional)
+        weights for each atom, as in :func:`CalcRMSDRotationalMatrix`
+    center : bool (optional)
+        subtract the (weighted) center of each structure; if ``False`` the
+        structures must already be centered
+    rotations : bool (optional)
+        also return the rotation matrices
+
+    Returns
+    -------
+    rmsd : ndarray
+        RMSDs of shape (n_references, n_frames); dimensions of single
+        structures are dropped, e.g. the result is of shape (n_frames,) for
+        one reference
+    rot : ndarray
+        only if *rotations* is ``True``: rotation matrices of shape
+        (n_references, n_frames, 3, 3) (with the same dimensions dropped),
+        which are the same as those of :func:`CalcRMSDRotationalMatrix`
+        for each pair of reference and configuration
+
+    .. versionadded:: 0.16.0
+    """
+    configurations = np.asarray(configurations)
+    dtype = np.float32 if configurations.dtype == np.float32 else np.float64
+    confs = np.ascontiguousarray(configurations, dtype=dtype)
+    refs = np.ascontiguousarray(references, dtype=dtype)
+    single_conf = confs.ndim == 2
+    single_ref = refs.ndim == 2
+    if single_conf:
+        confs = confs[np.newaxis]
+    if single_ref:
+        refs = refs[np.newaxis]
+    if (confs.ndim != 3 or refs.ndim != 3 or confs.shape[2] != 3 or
+            confs.shape[1:] != refs.shape[1:]):
+        raise ValueError("references and configurations must have shapes "
+                         "([n,] n_atoms, 3) with the same number of atoms")
+    if weights is not None:
+        weights = np.ascontiguousarray(weights, dtype=np.float64)
+        if weights.shape != (confs.shape[1],):
+            raise ValueError("weights must have one value for each atom")
+
+    rmsd = np.empty((refs.shape[0], confs.shape[0]), dtype=np.float64)
+    rot = (np.empty((refs.shape[0], confs.shape[0], 9), dtype=np.float64)
+           if rotations else None)
+    _batch_rmsd(refs, confs, weights, center, rmsd, rot)
+
+    index = (0 if single_ref else slice(None),
+             0 if single_conf else slice(None))
+    if rotations:
+        return rmsd[index], rot.reshape(rot.shape[:2] + (3, 3))[index]
+    return rmsd[index]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _batch_rmsd(floating[:, :, ::1] refs, floating[:, :, ::1] confs,
+                double[::1] weights, bint center, double[:, ::1] rmsd,
+                double[:, :, ::1] rot):
+    """RMSDs (and rotations) of all pairs of refs and confs, in parallel."""
+    cdef Py_ssize_t n_refs = refs.shape[0]
+    cdef Py_ssize_t n_confs = confs.shape[0]
+    cdef Py_ssize_t i, r, f
+    cdef double[:, ::1] ref_centers = np.zeros((n_refs, 3))
+    cdef double[:, ::1] conf_centers = np.zeros((n_confs, 3))
+    cdef double[::1] ref_G = np.empty(n_refs)
+    cdef double[::1] conf_G = np.empty(n_confs)
+    cdef double *w = NULL
+    cdef bint with_rot = rot is not None
+    cdef double *rot_ptr
+
+    if weights is not None:
+        w = &weights[0]
+    with nogil:
+        for i in prange(n_refs, schedule='static'):
+            ref_G[i] = _center_and_norm(refs, i, w, center, &ref_centers[i, 0])
+        for i in prange(n_confs, schedule='static'):
+            conf_G[i] = _center_and_norm(confs, i, w, center,
+                                         &conf_centers[i, 0])
+        for i in prange(n_refs * n_confs, schedule='static'):
+            r = i // n_confs
+            f = i % n_confs
+            rot_ptr = &rot[r, f, 0] if with_rot else NULL
+            rmsd[r, f] = _pair_rmsd(refs, r, &ref_centers[r, 0], ref_G[r],
+                                    confs, f, &conf_centers[f, 0], conf_G[f],
+                                    w, rot_ptr)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef double _center_and_norm(floating[:, :, ::1] xyz, Py_ssize_t s, double *w,
+                             bint center, double *c) nogil:
+    """Store the (weighted) center of structure *s* in *c* (if *center*) and
+    return its weighted sum of squares about *c*."""
+    cdef Py_ssize_t i, k
+    cdef Py_ssize_t n = xyz.shape[1]
+    cdef double wi = 1.0
+    cdef double wsum = 0.0
+    cdef double G = 0.0
+    cdef double d
+
+    c[0] = c[1] = c[2] = 0.0
+    if center:
+        for i in range(n):
+            if w != NULL:
+                wi = w[i]
+            wsum += wi
+            for k in range(3):
+                c[k] += wi * xyz[s, i, k]
+        for k in range(3):
+            c[k] /= wsum
+    for i in range(n):
+        if w != NULL:
+            wi = w[i]
+        for k in range(3):
+            d = xyz[s, i, k] - c[k]
+            G += wi * d * d
+    return G
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef double _pair_rmsd(floating[:, :, ::1] refs, Py_ssize_t r, double *ref_c,
+                       double ref_G, floating[:, :, ::1] confs, Py_ssize_t f,
+                       double *conf_c, double conf_G, double *w,
+                       double *rot) nogil:
+    """RMSD (and rotation) of conformation *f* to reference *r*, with the
+    inner product of :func:`InnerProduct` taken about the given centers."""
+    cdef double A[9]
+    cdef double x1, y1, z1, x2, y2, z2
+    cdef double wi = 1.0
+    cdef Py_ssize_t i, k
+    cdef Py_ssize_t n = confs.shape[1]
+
+    for k in range(9):
+        A[k] = 0.0
+    for i in range(n):
+        if w != NULL:
+            wi = w[i]
+        x1 = wi * (confs[f, i, 0] - conf_c[0])
+        y1 = wi * (confs[f, i, 1] - conf_c[1])
+        z1 = wi * (confs[f, i, 2] - conf_c[2])
+
+        x2 = refs[r, i, 0] - ref_c[0]
+        y2 = refs[r, i, 1] - ref_c[1]
+        z2 = refs[r, i, 2] - ref_c[2]
+
+        A[0] += x1 * x2
+        A[1] += x1 * y2
+        A[2] += x1 * z2
+
+        A[3] += y1 * x2
+        A[4] += y1 * y2
+        A[5] += y1 * z2
+
+        A[6] += z1 * x2
+        A[7] += z1 * y2
+        A[8] += z1 * z2
+
+    return _fast_calc_rmsd_and_rotation(rot, A, 0.5 * (conf_G + ref_G), n,
+                                        NULL)
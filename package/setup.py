@@ -324,7 +324,13 @@ def extensions(config):
     qcprot = MDAExtension('lib.qcprot',
                           ['MDAnalysis/lib/qcprot' + source_suffix],
                           include_dirs=include_dirs,
-                          extra_compile_args=["-O3", "-ffast-math"])
+                          libraries=parallel_libraries,
+                          extra_compile_args=["-O3", "-ffast-math"] + parallel_args,
+                          extra_link_args=parallel_args)
+    pathmetrics = MDAExtension('lib.c_pathmetrics',
+                               ['MDAnalysis/lib/c_pathmetrics' + source_suffix],
+                               include_dirs=include_dirs,
+                               extra_compile_args=["-O3", "-ffast-math"])
     transformation = MDAExtension('lib._transformations',
                                   ['MDAnalysis/lib/src/transformations/transformations.c'],
                                   libraries=['m'],
@@ -358,9 +364,11 @@ def extensions(config):
     spe_dimred = MDAExtension('analysis.encore.dimensionality_reduction.stochasticproxembed',
                             sources = ['MDAnalysis/analysis/encore/dimensionality_reduction/stochasticproxembed' + source_suffix, 'MDAnalysis/analysis/encore/dimensionality_reduction/src/spe.c'],
                             include_dirs = include_dirs+['MDAnalysis/analysis/encore/dimensionality_reduction/include'],
-                            libraries=["m"],
-                            extra_compile_args=["-O3", "-ffast-math","-std=c99"])
-    pre_exts = [dcd, dcd_time, distances, distances_omp, qcprot,
+                            libraries=["m"] + parallel_libraries,
+                            define_macros=define_macros + parallel_macros,
+                            extra_compile_args=["-O3", "-ffast-math","-std=c99"] + parallel_args,
+                            extra_link_args=parallel_args)
+    pre_exts = [dcd, dcd_time, distances, distances_omp, qcprot, pathmetrics,
                   transformation, libmdaxdr, util, encore_utils,
                   ap_clustering, spe_dimred]
 
@@ -213,6 +213,63 @@ class TestAlign(TestCase):
         self._assert_rmsd(self.universe, 0, 6.929083044751061)
         self._assert_rmsd(self.universe, -1, 0.0)
 
+    def test_AlignTraj_blocks(self):
+        self.reference.trajectory[-1]
+        x = align.AlignTraj(self.universe, self.reference,
+                            filename=self.outfile, block_size=7).run()
+        fitted = MDAnalysis.Universe(PSF, self.outfile)
+        assert_equal(fitted.trajectory.n_frames,
+                     self.universe.trajectory.n_frames)
+        assert_almost_equal(x.rmsd[0], 6.929083044751061, decimal=3)
+        assert_almost_equal(x.rmsd[-1], 5.279731379771749336e-07, decimal=3)
+
+        self._assert_rmsd(fitted, 0, 6.929083044751061)
+        self._assert_rmsd(fitted, -1, 0.0)
+
+    def test_AlignTraj_blocks_same_as_frames(self):
+        outfile = os.path.join(self.tempdir.name, 'align_frames.dcd')
+        x = align.AlignTraj(self.universe, self.reference, select='name CA',
+                            filename=outfile, mass_weighted=True,
+                            step=3).run()
+        y = align.AlignTraj(self.universe, self.reference, select='name CA',
+                            filename=self.outfile, mass_weighted=True,
+                            step=3, block_size=5).run()
+        assert_array_almost_equal(x.rmsd, y.rmsd)
+        # read each file completely before comparing them
+        frames = [ts.positions.copy() for ts in
+                  MDAnalysis.Universe(PSF, outfile).trajectory]
+        blocks = [ts.positions.copy() for ts in
+                  MDAnalysis.Universe(PSF, self.outfile).trajectory]
+        assert_equal(len(frames), len(blocks))
+        assert_array_almost_equal(frames, blocks, 4)
+
+    def test_AlignTraj_in_memory_blocks(self):
+        self.reference.trajectory[-1]
+        self.universe.transfer_to_memory()
+        x = align.AlignTraj(self.universe, self.reference,
+                            block_size=10, start=2).run()
+        assert_equal(len(x.rmsd), self.universe.trajectory.n_frames - 2)
+        assert_almost_equal(x.rmsd[-1], 5.279731379771749336e-07, decimal=3)
+        self._assert_rmsd(self.universe, -1, 0.0)
+
+    def test_AlignTraj_nproc(self):
+        self.reference.trajectory[-1]
+        # TRR stores full precision positions, unlike XTC
+        outfile = os.path.join(self.tempdir.name, 'align_test.trr')
+        x = align.AlignTraj(self.universe, self.reference, filename=outfile,
+                            nproc=2, block_size=10).run()
+        fitted = MDAnalysis.Universe(PSF, outfile)
+        assert_equal(fitted.trajectory.n_frames,
+                     self.universe.trajectory.n_frames)
+        assert_almost_equal(x.rmsd[0], 6.929083044751061, decimal=3)
+        assert_almost_equal(x.rmsd[-1], 5.279731379771749336e-07, decimal=3)
+        self._assert_rmsd(fitted, 0, 6.929083044751061)
+        self._assert_rmsd(fitted, -1, 0.0)
+
+    def test_AlignTraj_nproc_format(self):
+        assert_raises(ValueError, align.AlignTraj, self.universe,
+                      self.reference, filename=self.outfile, nproc=2)
+
     def _assert_rmsd(self, fitted, frame, desired, weights=None):
         fitted.trajectory[frame]
         rmsd = rms.rmsd(self.reference.atoms.positions,
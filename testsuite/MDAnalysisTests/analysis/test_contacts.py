@@ -287,6 +287,36 @@ class TestContacts(object):
     def test_non_callable_method(self):
         self._run_Contacts(method=2, stop=2)
 
+    def test_sparse(self):
+        dense = self._run_Contacts(stop=10)
+        sparse = self._run_Contacts(stop=10, sparse=True)
+        assert_array_almost_equal(sparse.timeseries, dense.timeseries)
+        assert_equal(sparse.initial_contacts[0].shape[1], 2)
+        assert_equal(len(sparse.initial_contacts[0]),
+                     dense.initial_contacts[0].sum())
+
+    def test_sparse_own_method(self):
+        dense = self._run_Contacts(method=self._is_any_closer, stop=10)
+        sparse = self._run_Contacts(method=self._is_any_closer, stop=10,
+                                    sparse=True)
+        assert_array_equal(sparse.timeseries, dense.timeseries)
+
+    def test_nonnative(self):
+        ca = self._run_Contacts(stop=10, sparse=True, nonnative=True)
+        acidic = self.universe.select_atoms(self.sel_acidic)
+        basic = self.universe.select_atoms(self.sel_basic)
+        native = ca.initial_contacts[0]
+        expected = []
+        for ts in self.universe.trajectory[:10]:
+            formed = distance_array(acidic.positions, basic.positions) <= 6.0
+            formed[native[:, 0], native[:, 1]] = False
+            expected.append(formed.sum())
+        assert_equal(ca.nonnative[:, 0], expected)
+
+    @raises(ValueError)
+    def test_nonnative_dense(self):
+        self._run_Contacts(nonnative=True, stop=2)
+
     def test_save(self):
         with tempdir.in_tempdir():
             ca = self._run_Contacts()
@@ -345,3 +375,12 @@ def test_q1q2():
                    0.97601476, 0.9797048, 0.98154982, 0.98062731, 0.98431734,
                    0.98616236, 0.9898524, 1.]
     assert_array_almost_equal(q1q2.timeseries[:, 2], q2_expected)
+
+
+@dec.skipif(parser_not_found('DCD'),
+            'DCD parser not available. Are you using python 3?')
+def test_q1q2_sparse():
+    u = mda.Universe(PSF, DCD)
+    dense = contacts.q1q2(u, 'name CA', radius=8, stop=10).run()
+    sparse = contacts.q1q2(u, 'name CA', radius=8, stop=10, sparse=True).run()
+    assert_array_almost_equal(sparse.timeseries, dense.timeseries)
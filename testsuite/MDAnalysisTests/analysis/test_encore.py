@@ -31,7 +31,7 @@ import sys
 import warnings
 
 from numpy.testing import (TestCase, dec, assert_equal, assert_almost_equal,
-                           assert_warns)
+                           assert_warns, assert_, assert_raises)
 
 from MDAnalysisTests.datafiles import DCD, DCD2, PSF
 from MDAnalysisTests import parser_not_found, module_not_found, block_import
@@ -40,6 +40,17 @@ import MDAnalysis.analysis.rms as rms
 import MDAnalysis.analysis.align as align
 
 
+def graph_stress(coordinates, distances, indices, indptr):
+    """Stress of an embedding on the edges of a neighbor graph (as in the
+    native neighbor embedding)"""
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    edges = (indices < rows) & (distances > 0)
+    rows, columns, distances = rows[edges], indices[edges], distances[edges]
+    embedded = np.sqrt(((coordinates[:, rows] -
+                         coordinates[:, columns])**2).sum(axis=0))
+    return ((embedded - distances)**2 / distances).sum() / distances.sum()
+
+
 class TestEncore(TestCase):
 
     @dec.skipif(parser_not_found('DCD'),
@@ -136,6 +147,67 @@ inconsistent results")
 inconsistent results")
 
 
+    @staticmethod
+    def test_triangular_matrix_memmap():
+        size = 5
+        reference = np.arange(size * size, dtype=np.float32).reshape(
+            size, size)
+        reference = reference + reference.T
+        tempdir = tempfile.mkdtemp()
+        filename = tempdir + "/matrix.npy"
+
+        triangular_matrix = encore.utils.TriangularMatrix(
+            size=size, dtype=np.float32, filename=filename)
+        for i in range(size):
+            for j in range(i + 1):
+                triangular_matrix[i, j] = reference[i, j]
+        assert_equal(triangular_matrix._elements.dtype, np.float32)
+        assert_equal(triangular_matrix.as_array(), reference,
+                     err_msg="Data error in memory-mapped TriangularMatrix")
+        triangular_matrix.save(filename)
+
+        loaded = encore.utils.TriangularMatrix(size=size, loadfile=filename)
+        assert_(isinstance(loaded._elements, np.memmap),
+                "TriangularMatrix was not memory-mapped")
+        assert_equal(loaded.as_array(), reference,
+                     err_msg="Data error in loaded TriangularMatrix")
+        assert_raises(TypeError, encore.utils.TriangularMatrix,
+                      size=size + 1, loadfile=filename)
+
+        # changes of a loaded matrix do not reach the file
+        changed = encore.utils.TriangularMatrix(size=size, loadfile=filename)
+        changed += 1
+        changed *= 2
+        assert_equal(changed[1, 0], (reference[1, 0] + 1) * 2)
+        assert_equal(np.load(filename)[1], reference[1, 0],
+                     err_msg="Loaded TriangularMatrix changed its file")
+
+        blocks = list(loaded.iter_rows(block_size=2))
+        assert_equal([start for start, rows in blocks], [0, 2, 4])
+        assert_equal(np.vstack([rows for start, rows in blocks]), reference,
+                     err_msg="Data error in blocks of rows of TriangularMatrix")
+
+    @staticmethod
+    def test_triangular_matrix_neighbor_graph():
+        coordinates = np.array([0., 1., 3., 7., 15.])
+        size = len(coordinates)
+        triangular_matrix = encore.utils.TriangularMatrix(size=size)
+        for i in range(size):
+            for j in range(i + 1):
+                triangular_matrix[i, j] = abs(coordinates[i] - coordinates[j])
+
+        values, indices, indptr = triangular_matrix.neighbor_graph(
+            n_neighbors=1, block_size=2)
+        assert_equal(indptr, [0, 2, 5, 8, 11, 13])
+        assert_equal(indices, [0, 1, 0, 1, 2, 1, 2, 3, 2, 3, 4, 3, 4])
+        assert_equal(values, [0, 1, 1, 0, 2, 2, 0, 4, 4, 0, 8, 8, 0])
+
+        values, indices, indptr = triangular_matrix.neighbor_graph(cutoff=3)
+        assert_equal(indptr, [0, 3, 6, 9, 10, 11])
+        assert_equal(indices, [0, 1, 2, 0, 1, 2, 0, 1, 2, 3, 4])
+
+        assert_raises(ValueError, triangular_matrix.neighbor_graph)
+
     @staticmethod
     def test_parallel_calculation():
 
@@ -189,6 +261,54 @@ inconsistent results")
         assert_almost_equal(confdist_matrix.as_array()[0,:], reference_rmsd, decimal=3,
                             err_msg="calculated RMSD values differ from reference")
 
+    def test_rmsd_matrix_parallel(self):
+        serial = encore.confdistmatrix.conformational_distance_matrix(
+            self.ens1,
+            encore.confdistmatrix.set_rmsd_matrix_elements,
+            selection="name CA",
+            pairwise_align=True,
+            mass_weighted=True,
+            n_jobs=1)
+        parallel = encore.confdistmatrix.conformational_distance_matrix(
+            self.ens1,
+            encore.confdistmatrix.set_rmsd_matrix_elements,
+            selection="name CA",
+            pairwise_align=True,
+            mass_weighted=True,
+            n_jobs=3)
+        assert_almost_equal(parallel.as_array(), serial.as_array(),
+                            decimal=6,
+                            err_msg="parallel RMSD matrix differs from the "
+                                    "serial one")
+
+    def test_rmsd_matrix_memmap(self):
+        filename = tempfile.mkdtemp() + "/rmsd.npy"
+        reference = encore.confdistmatrix.conformational_distance_matrix(
+            self.ens1,
+            encore.confdistmatrix.set_rmsd_matrix_elements,
+            selection="name CA",
+            n_jobs=1)
+        conf_dist_matrix = encore.confdistmatrix.conformational_distance_matrix(
+            self.ens1,
+            encore.confdistmatrix.set_rmsd_matrix_elements,
+            selection="name CA",
+            n_jobs=2,
+            dtype=np.float32,
+            filename=filename)
+        loaded = encore.utils.TriangularMatrix(size=reference.size,
+                                               loadfile=filename)
+        assert_equal(loaded._elements.dtype, np.float32)
+        assert_almost_equal(loaded.as_array(), reference.as_array(),
+                            decimal=4,
+                            err_msg="memory-mapped RMSD matrix differs from "
+                                    "the one in memory")
+
+    @staticmethod
+    def test_row_blocks():
+        blocks = encore.confdistmatrix._row_blocks(10, 7)
+        assert_equal(blocks, [(0, 4), (4, 6), (6, 7), (7, 8), (8, 9),
+                              (9, 10)])
+
     @staticmethod
     def test_ensemble_superimposition():
         aligned_ensemble1 = mda.Universe(PSF, DCD)
@@ -475,6 +595,30 @@ class TestEncoreClustering(TestCase):
                      err_msg="Unexpected result: {0}".format(
                      cluster_assignment))
 
+    @dec.slow
+    def test_clustering_SparseAffinityPropagationNative_direct(self):
+        distance_matrix = encore.get_distance_matrix(self.ens1)
+        dense_assignment, details = encore.AffinityPropagationNative()(
+            distance_matrix)
+        # with all neighbors the messages are the same as for the dense
+        # algorithm
+        method = encore.SparseAffinityPropagationNative(
+            n_neighbors=distance_matrix.size - 1)
+        cluster_assignment, details = method(distance_matrix)
+        assert_equal(len(set(cluster_assignment)), len(set(dense_assignment)),
+                     err_msg="Unexpected result: {0}".format(
+                     cluster_assignment))
+        centroids = np.unique(cluster_assignment)
+        assert_equal(cluster_assignment[centroids], centroids,
+                     err_msg="Centroids are not assigned to themselves")
+
+    @dec.slow
+    def test_clustering_SparseAffinityPropagationNative_neighbors(self):
+        method = encore.SparseAffinityPropagationNative(n_neighbors=10)
+        cluster_collection = encore.cluster(self.ens1, method=method)
+        assert_(len(cluster_collection) > 1,
+                "Unexpected results: {0}".format(cluster_collection))
+
     @dec.slow
     @dec.skipif(module_not_found('sklearn'),
                 "Test skipped because sklearn is not available.")
@@ -752,6 +896,57 @@ class TestEncoreDimensionalityReduction(TestCase):
                      err_msg="Unexpected result in dimensionality reduction: {0}".format(
                      coordinates))
 
+    @dec.slow
+    def test_dimensionality_reduction_SPENative_threads(self):
+        dimension = 2
+        distance_matrix = encore.get_distance_matrix(self.ens1)
+        method = encore.StochasticProximityEmbeddingNative(dimension=dimension,
+                                                           n_threads=2)
+        coordinates, details = method(distance_matrix)
+        assert_equal(coordinates.shape, (dimension, distance_matrix.size),
+                     err_msg="Unexpected result in dimensionality reduction: {0}".format(
+                     coordinates))
+        serial = encore.StochasticProximityEmbeddingNative(dimension=dimension)
+        coordinates, serial_details = serial(distance_matrix)
+        assert_almost_equal(details['final_stress'],
+                            serial_details['final_stress'], decimal=1,
+                            err_msg="Unexpected stress of the multithreaded "
+                                    "embedding")
+
+    @dec.slow
+    def test_dimensionality_reduction_SPENative_neighbors(self):
+        dimension = 2
+        distance_matrix = encore.get_distance_matrix(self.ens1)
+        method = encore.StochasticProximityEmbeddingNative(dimension=dimension,
+                                                           n_neighbors=20,
+                                                           n_threads=2)
+        coordinates, details = method(distance_matrix)
+        assert_equal(coordinates.shape, (dimension, distance_matrix.size),
+                     err_msg="Unexpected result in dimensionality reduction: {0}".format(
+                     coordinates))
+        assert_(np.all(np.isfinite(coordinates)),
+                "Non-finite coordinates in dimensionality reduction")
+        serial = encore.StochasticProximityEmbeddingNative(dimension=dimension)
+        serial_coordinates, serial_details = serial(distance_matrix)
+        graph = distance_matrix.neighbor_graph(
+            n_neighbors=20, cutoff=serial.distance_cutoff)
+        assert_almost_equal(details['final_stress'],
+                            graph_stress(coordinates, *graph), decimal=5,
+                            err_msg="Unexpected stress of the neighbor "
+                                    "embedding")
+        assert_almost_equal(details['final_stress'],
+                            graph_stress(serial_coordinates, *graph),
+                            decimal=1,
+                            err_msg="Stress of the neighbor embedding not "
+                                    "comparable to the serial embedding")
+
+    def test_dimensionality_reduction_SPENative_bad_threads(self):
+        distance_matrix = encore.get_distance_matrix(self.ens1)
+        for n_neighbors in (None, 20):
+            method = encore.StochasticProximityEmbeddingNative(
+                n_neighbors=n_neighbors, n_threads=0)
+            assert_raises(ValueError, method, distance_matrix)
+
     @dec.slow
     @dec.skipif(module_not_found('sklearn'),
                 "Test skipped because sklearn is not available.")
@@ -34,6 +34,7 @@ import itertools
 import warnings
 
 from MDAnalysisTests.datafiles import PDB_helix, GRO, XTC
+from MDAnalysisTests import tempdir
 # For type guessing:
 from MDAnalysis.topology.core import guess_atom_type
 from MDAnalysis.core.topologyattrs import Atomtypes
@@ -110,6 +111,47 @@ class TestHydrogenBondAnalysis(object):
         t = h.timesteps_by_type()
         assert_equal(t.time, self.values['num_bb_hbonds'] * [0.0])
 
+    def test_hbonds_array(self):
+        h = self._run()
+        assert_equal(len(h.hbonds), self.values['num_bb_hbonds'])
+        assert_array_equal(h.hbonds['frame'], 0)
+        assert_array_equal(h.hbonds['donor_index'],
+                           [row[2] for row in h.timeseries[0]])
+        assert_array_equal(h.hbonds['acceptor_index'],
+                           [row[3] for row in h.timeseries[0]])
+        assert_(np.all(h.hbonds['angle'] >= self.kwargs['angle']))
+
+    def test_pbc(self):
+        # the helix has no unit cell; pbc must then be ignored
+        h = self._run(pbc=True)
+        assert_equal(len(h.hbonds), self.values['num_bb_hbonds'])
+
+    def test_count_by_type_heavy_atom(self):
+        h = self._run()
+        c = h.count_by_type()
+        assert_array_equal(c.donor_heavy_atom, 'N')
+        assert_array_equal(c.donor_resid, self.values['donor_resid'])
+
+    def test_save_load_hbonds(self):
+        h = self._run()
+        with tempdir.in_tempdir():
+            h.save_hbonds('hbonds.npz')
+            loaded = MDAnalysis.analysis.hbonds.HydrogenBondAnalysis(
+                self.universe, **self.kwargs)
+            loaded.load_hbonds('hbonds.npz')
+        assert_array_equal(loaded.hbonds, h.hbonds)
+        assert_equal(loaded.timesteps, h.timesteps)
+        assert_equal(loaded.count_by_time().tolist(),
+                     h.count_by_time().tolist())
+        assert_equal(loaded.timeseries, h.timeseries)
+
+    def test_autocorrelation(self):
+        h = self._run()
+        if self.values['num_bb_hbonds']:
+            assert_array_equal(h.autocorrelation(), [1.0])
+            assert_array_equal(h.autocorrelation('continuous'), [1.0])
+        assert_raises(ValueError, h.autocorrelation, 'other')
+
     def tearDown(self):
         del self.universe
 
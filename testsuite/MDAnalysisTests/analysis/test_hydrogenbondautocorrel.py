@@ -29,6 +29,8 @@ import mock
 
 import MDAnalysis as mda
 from MDAnalysis.analysis.hbonds import HydrogenBondAutoCorrel as HBAC
+from MDAnalysis.analysis.hbonds.hbond_autocorrel import (
+    hbond_existence, intermittent_autocorrelation, continuous_autocorrelation)
 
 
 class TestHydrogenBondAutocorrel(object):
@@ -290,3 +292,54 @@ class TestHydrogenBondAutocorrel(object):
                      sample_time=0.06,
         )
         assert_(isinstance(repr(hbond), six.string_types))
+
+
+class TestExistenceAutocorrelation(object):
+    def setUp(self):
+        # pair (0, 10) exists in frames 0, 1, 3; pair (1, 11) in 1, 2, 3
+        self.frames = np.array([0, 1, 1, 2, 3, 3])
+        self.donors = np.array([0, 0, 1, 1, 0, 1])
+        self.acceptors = np.array([10, 10, 11, 11, 10, 11])
+
+    @staticmethod
+    def _brute(existence, continuous):
+        n_frames = existence.shape[1]
+        result = []
+        for tau in range(n_frames):
+            num = den = 0
+            for row in existence:
+                for t in range(n_frames - tau):
+                    if row[t]:
+                        den += 1
+                        if continuous:
+                            num += row[t:t + tau + 1].all()
+                        else:
+                            num += row[t + tau]
+            result.append(num / float(den))
+        return np.array(result)
+
+    def test_existence(self):
+        pairs, existence = hbond_existence(self.frames, self.donors,
+                                           self.acceptors)
+        assert_(pairs.tolist() == [[0, 10], [1, 11]])
+        assert_(existence.tolist() == [[True, True, False, True],
+                                       [False, True, True, True]])
+
+    def test_intermittent(self):
+        existence = np.random.RandomState(42).rand(30, 50) < 0.5
+        assert_array_almost_equal(
+            intermittent_autocorrelation(existence, chunksize=7),
+            self._brute(existence, False))
+
+    def test_continuous(self):
+        existence = np.random.RandomState(42).rand(30, 50) < 0.5
+        assert_array_almost_equal(
+            continuous_autocorrelation(existence, chunksize=7),
+            self._brute(existence, True))
+
+    def test_max_tau(self):
+        existence = hbond_existence(self.frames, self.donors,
+                                    self.acceptors)[1]
+        assert_array_almost_equal(
+            continuous_autocorrelation(existence, max_tau=2),
+            [1.0, 3 / 4.0, 1 / 3.0])
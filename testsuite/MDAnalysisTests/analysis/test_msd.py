@@ -0,0 +1,116 @@
+# -*- Mode: python; tab-width: 4; indent-tabs-mode:nil; coding:utf-8 -*-
+# vim: tabstop=4 expandtab shiftwidth=4 softtabstop=4
+#
+# MDAnalysis --- http://www.mdanalysis.org
+# Copyright (c) 2006-2016 The MDAnalysis Development Team and contributors
+# (see the file AUTHORS for the full list of names)
+#
+# Released under the GNU Public Licence, v2 or any higher version
+#
+# Please cite your use of MDAnalysis in published work:
+#
+# R. J. Gowers, M. Linke, J. Barnoud, T. J. E. Reddy, M. N. Melo, S. L. Seyler,
+# D. L. Dotson, J. Domanski, S. Buchoux, I. M. Kenney, and O. Beckstein.
+# MDAnalysis: A Python package for the rapid analysis of molecular dynamics
+# simulations. In S. Benthall and S. Rostrup editors, Proceedings of the 15th
+# Python in Science Conference, pages 102-109, Austin, TX, 2016. SciPy.
+#
+# N. Michaud-Agrawal, E. J. Denning, T. B. Woolf, and O. Beckstein.
+# MDAnalysis: A Toolkit for the Analysis of Molecular Dynamics Simulations.
+# J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
+#
+from __future__ import division
+
+import numpy as np
+from numpy.testing import assert_equal, assert_almost_equal, assert_raises
+
+import MDAnalysis as mda
+from MDAnalysis.analysis.msd import MSD, msd_fft
+from MDAnalysis.coordinates.memory import MemoryReader
+
+from MDAnalysisTests.datafiles import two_water_gro
+from MDAnalysisTests import tempdir
+
+
+def brute_force_msd(positions):
+    n_frames = len(positions)
+    return np.array([np.mean(np.sum((positions[m:] - positions[:n_frames - m])**2,
+                                    axis=-1), axis=0)
+                     for m in range(n_frames)])
+
+
+def test_msd_fft():
+    rng = np.random.RandomState(0)
+    positions = np.cumsum(rng.normal(size=(40, 7, 3)), axis=0) + 1000.0
+    assert_almost_equal(msd_fft(positions), brute_force_msd(positions))
+    assert_almost_equal(msd_fft(positions, chunksize=3),
+                        brute_force_msd(positions))
+    assert_almost_equal(msd_fft(positions[:, 0]),
+                        brute_force_msd(positions[:, 0]))
+    assert_almost_equal(msd_fft(positions, chunksize=3, average=True),
+                        brute_force_msd(positions).mean(axis=1))
+
+
+class TestMSD(object):
+    def setUp(self):
+        self.u = mda.Universe(two_water_gro)
+        rng = np.random.RandomState(42)
+        # random walks that cross the periodic boundaries many times
+        self.unwrapped = np.cumsum(rng.normal(0, 1.0, (50, 6, 3)),
+                                   axis=0) + 5.0
+        self.wrapped = (self.unwrapped - 10.0 *
+                        np.floor(self.unwrapped / 10.0)).astype(np.float32)
+        self.u.load_new(self.wrapped, format=MemoryReader,
+                        dimensions=[10.0, 10.0, 10.0, 90.0, 90.0, 90.0],
+                        dt=2.0)
+
+    def tearDown(self):
+        del self.u
+
+    def test_atoms(self):
+        msd = MSD(self.u.atoms).run()
+        assert_equal(msd.n_particles, 6)
+        assert_almost_equal(msd.msd_by_particle,
+                            brute_force_msd(self.unwrapped), decimal=3)
+        assert_almost_equal(msd.msd, msd.msd_by_particle.mean(axis=1))
+        assert_almost_equal(msd.lagtimes, 2.0 * np.arange(50))
+
+    def test_residues(self):
+        msd = MSD(self.u.atoms, grouping='residues').run()
+        masses = self.u.atoms.masses.reshape(2, 3)
+        com = (self.unwrapped.reshape(50, 2, 3, 3) *
+               masses[None, :, :, None]).sum(axis=2) / masses.sum(axis=1)[:, None]
+        assert_equal(msd.n_particles, 2)
+        assert_almost_equal(msd.msd_by_particle, brute_force_msd(com),
+                            decimal=3)
+
+    def test_msd_type(self):
+        msd = MSD(self.u.atoms, msd_type='z').run()
+        assert_almost_equal(msd.msd_by_particle,
+                            brute_force_msd(self.unwrapped[:, :, 2:]),
+                            decimal=3)
+
+    def test_no_unwrap(self):
+        msd = MSD(self.u.atoms, unwrap=False).run()
+        assert_almost_equal(msd.msd_by_particle,
+                            brute_force_msd(self.wrapped.astype(np.float64)),
+                            decimal=3)
+
+    def test_bad_arguments(self):
+        assert_raises(ValueError, MSD, self.u.atoms, grouping='molecules')
+        assert_raises(ValueError, MSD, self.u.atoms, msd_type='xxz')
+
+    def test_per_particle(self):
+        msd = MSD(self.u.atoms, per_particle=False).run()
+        assert not hasattr(msd, 'msd_by_particle')
+        assert_almost_equal(msd.msd,
+                            brute_force_msd(self.unwrapped).mean(axis=1),
+                            decimal=3)
+
+    def test_filename(self):
+        with tempdir.in_tempdir():
+            msd = MSD(self.u.atoms, filename='positions.npy').run()
+            assert_almost_equal(msd.msd_by_particle,
+                                brute_force_msd(self.unwrapped), decimal=3)
+            assert_almost_equal(np.load('positions.npy'), self.unwrapped,
+                                decimal=4)
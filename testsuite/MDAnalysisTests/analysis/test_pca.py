@@ -29,7 +29,7 @@ from numpy.testing import (assert_almost_equal, assert_equal, dec,
 
 from MDAnalysisTests.datafiles import (PDB, XTC, RANDOM_WALK, RANDOM_WALK_TOPO,
                                        waterPSF, waterDCD)
-from MDAnalysisTests import module_not_found
+from MDAnalysisTests import module_not_found, tempdir
 
 
 class TestPCA(object):
@@ -50,6 +50,32 @@ class TestPCA(object):
         cov = np.cov(xyz, rowvar=0)
         assert_array_almost_equal(self.pca.cov, cov, 4)
 
+    def test_chunksize(self):
+        pca_chunks = pca.PCA(self.u, select='backbone and name CA',
+                             chunksize=3).run()
+        assert_array_almost_equal(pca_chunks.cov, self.pca.cov, 4)
+        assert_array_almost_equal(pca_chunks.mean, self.pca.mean, 4)
+
+    def test_merge(self):
+        select = 'backbone and name CA'
+        first = pca.PCA(self.u, select=select, stop=4).run()
+        second = pca.PCA(self.u, select=select, start=4).run()
+        first.merge(second)
+        assert_array_almost_equal(first.cov, self.pca.cov, 4)
+        assert_array_almost_equal(first.variance, self.pca.variance, 4)
+
+    def test_n_components(self):
+        pca_top = pca.PCA(self.u, select='backbone and name CA',
+                          n_components=3).run()
+        assert_equal(pca_top.p_components.shape, (self.n_atoms*3, 3))
+        assert_array_almost_equal(pca_top.variance, self.pca.variance[:3], 4)
+        assert_array_almost_equal(pca_top.cumulated_variance,
+                                  self.pca.cumulated_variance[:3], 5)
+        # eigenvectors are only defined up to their sign
+        assert_array_almost_equal(
+            np.abs((pca_top.p_components *
+                    self.pca.p_components[:, :3]).sum(axis=0)), np.ones(3), 4)
+
     def test_cum_var(self):
         assert_almost_equal(self.pca.cumulated_variance[-1], 1)
         l = self.pca.cumulated_variance
@@ -71,6 +97,25 @@ class TestPCA(object):
         assert_equal(self.pca_space.shape,
                      (self.u.trajectory.n_frames, 1))
 
+    def test_transform_chunks(self):
+        atoms = self.u.select_atoms('backbone and name CA')
+        reference = np.array([np.dot(atoms.positions.ravel() - self.pca.mean,
+                                     self.pca.p_components[:, :4])
+                              for ts in self.u.trajectory[1:9:2]])
+        dot = self.pca.transform(atoms, n_components=4, start=1, stop=9,
+                                 step=2, chunksize=3)
+        assert_array_almost_equal(dot, reference, 4)
+
+    def test_transform_memmap(self):
+        atoms = self.u.select_atoms('backbone and name CA')
+        dot = self.pca.transform(atoms, n_components=2)
+        with tempdir.in_tempdir():
+            mapped = self.pca.transform(atoms, n_components=2,
+                                        filename='pca_space.npy')
+            assert_array_almost_equal(mapped, dot)
+            assert_array_almost_equal(np.load('pca_space.npy'), dot)
+            del mapped
+
     # Accepts universe as input, but shapes are not aligned due to n_atoms
     @raises(ValueError)
     def test_transform_mismatch(self):
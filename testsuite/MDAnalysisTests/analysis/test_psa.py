@@ -28,6 +28,7 @@ from numpy.testing import (TestCase, dec, assert_array_less,
                            assert_array_almost_equal, assert_,
                            assert_almost_equal, assert_equal)
 import numpy as np
+import os
 
 from MDAnalysisTests.datafiles import PSF, DCD, DCD2
 from MDAnalysisTests import parser_not_found, tempdir, module_not_found
@@ -93,6 +94,36 @@ class TestPSAnalysis(TestCase):
         err_msg = "Dendrogram dictionary object was not produced"
         assert_(type(self.plot_data[1]) is dict, err_msg)
 
+    def test_nproc(self):
+        self.psa.run(metric='hausdorff', nproc=2, filename='hausdorff_nproc')
+        assert_array_almost_equal(self.psa.get_pairwise_distances(),
+                                  self.hausd_matrix)
+
+    def test_partial_file_removed(self):
+        partial = os.path.join(self.tmpdir.name, 'distance_matrices',
+                               'hausdorff_partial.npy')
+        assert_(not os.path.exists(partial),
+                "partial distances were not removed after the run")
+
+    def test_resume(self):
+        # pretend that the run was interrupted after the first pair
+        partial = self.psa._partial_distances('resumed', 3)
+        partial[0] = 42.
+        partial.flush()
+        del partial
+        self.psa.run(metric='hausdorff', filename='resumed', resume=True)
+        D = self.psa.get_pairwise_distances()
+        assert_almost_equal(D[0, 1], 42.)
+        assert_array_almost_equal(D[self.iu1][1:], self.hausd_dists[1:])
+
+    def test_pairs_analysis_nproc(self):
+        self.psa.run_pairs_analysis(hausdorff_pairs=True)
+        serial = [pair['distance'] for pair in self.psa.hausdorff_pairs]
+        self.psa.run_pairs_analysis(hausdorff_pairs=True, nproc=2)
+        parallel = [pair['distance'] for pair in self.psa.hausdorff_pairs]
+        assert_array_almost_equal(parallel, serial)
+        assert_array_almost_equal(parallel, self.hausd_dists, decimal=5)
+
     def test_dist_mat_to_vec_i_less_j(self):
         """Test the index of corresponding distance vector is correct if i < j"""
         err_msg = "dist_mat_to_vec function returning wrong values"
@@ -323,3 +354,62 @@ class DiscreteFrechetDistance(TestCase):
         assert_almost_equal(actual, expected)
 
 
+
+
+class TestCompiledPathMetrics(TestCase):
+    # compare the compiled engines with calculations on the full MSD matrix
+
+    def setUp(self):
+        rng = np.random.RandomState(17)
+        self.P = np.cumsum(rng.randn(40, 5, 3), axis=0)
+        self.Q = np.cumsum(rng.randn(55, 5, 3), axis=0) + 1.0
+        self.msd = PSA.get_msd_matrix(self.P, self.Q, axis=(1, 2)) / 5.
+
+    def tearDown(self):
+        del self.P, self.Q, self.msd
+
+    def _frechet(self):
+        msd = self.msd
+        coupling = np.empty_like(msd)
+        for i in range(msd.shape[0]):
+            for j in range(msd.shape[1]):
+                if i == 0 and j == 0:
+                    previous = 0
+                elif i == 0:
+                    previous = coupling[0, j - 1]
+                elif j == 0:
+                    previous = coupling[i - 1, 0]
+                else:
+                    previous = min(coupling[i - 1, j], coupling[i, j - 1],
+                                   coupling[i - 1, j - 1])
+                coupling[i, j] = max(previous, msd[i, j])
+        return coupling[-1, -1]**0.5
+
+    def test_hausdorff(self):
+        expected = max(self.msd.min(axis=0).max(),
+                       self.msd.min(axis=1).max())**0.5
+        assert_almost_equal(PSA.hausdorff(self.P, self.Q), expected)
+        assert_almost_equal(PSA.hausdorff(self.Q, self.P), expected)
+
+    def test_hausdorff_float32(self):
+        expected = PSA.hausdorff(self.P, self.Q)
+        assert_almost_equal(PSA.hausdorff(self.P.astype(np.float32),
+                                          self.Q.astype(np.float32)),
+                            expected, decimal=4)
+
+    def test_discrete_frechet(self):
+        assert_almost_equal(PSA.discrete_frechet(self.P, self.Q),
+                            self._frechet())
+
+    def test_discrete_frechet_float32(self):
+        assert_almost_equal(
+            PSA.discrete_frechet(self.P.astype(np.float32),
+                                 self.Q.astype(np.float32)),
+            self._frechet(), decimal=4)
+
+    def test_discrete_frechet_long_paths(self):
+        # exceeded the recursion limit of the memoized implementation
+        path = np.cumsum(np.ones((5000, 3)), axis=0)
+        assert_almost_equal(PSA.discrete_frechet(path, path), 0)
+        assert_almost_equal(PSA.discrete_frechet(path, path + 1),
+                            np.sqrt(3))
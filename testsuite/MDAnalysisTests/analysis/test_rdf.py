@@ -20,10 +20,12 @@
 # J. Comput. Chem. 32 (2011), 2319--2327, doi:10.1002/jcc.21787
 #
 
-from numpy.testing import assert_
+import numpy as np
+from numpy.testing import assert_, assert_equal, assert_almost_equal
 
 import MDAnalysis as mda
-from MDAnalysis.analysis.rdf import InterRDF
+from MDAnalysis.analysis.rdf import InterRDF, InterRDF_s
+from MDAnalysis.lib.distances import distance_array
 
 from MDAnalysisTests.datafiles import two_water_gro
 
@@ -101,3 +103,65 @@ class TestInterRDF(object):
         s1, s2 = self._get_sels()
         rdf = InterRDF(s1, s2, exclusion_block=(1, 2)).run()
         assert_(rdf.count.sum() == 4)
+
+    def test_count_matches_distance_array(self):
+        # only pairs within range are computed, but the histogram must be
+        # the same as for the full distance matrix
+        s1, s2 = self.u.atoms, self.u.atoms
+        rdf = InterRDF(s1, s2, nbins=20, range=(0.0, 3.0)).run()
+        d = distance_array(s1.positions, s2.positions,
+                           box=self.u.dimensions)
+        ref = np.histogram(d, bins=20, range=(0.0, 3.0))[0]
+        assert_equal(rdf.count, ref)
+
+    def test_exclusion_rule(self):
+        # pairs (i, j) with i // 3 == j // 3 are within the same water
+        s1, s2 = self.u.atoms, self.u.atoms
+        rdf = InterRDF(s1, s2, exclusion_block=(3, 3)).run()
+        d = distance_array(s1.positions, s2.positions,
+                           box=self.u.dimensions)
+        assert_(rdf.count.sum() == (d[:3, 3:] <= 15.0).sum() * 2)
+
+
+class TestInterRDF_s(object):
+    def setUp(self):
+        self.u = mda.Universe(two_water_gro)
+        ow = self.u.select_atoms('name OW')
+        hw = self.u.select_atoms('name HW1 HW2')
+        self.ags = [(ow, hw), (ow, ow), (hw, self.u.atoms)]
+
+    def tearDown(self):
+        del self.u
+
+    def test_nbins(self):
+        rdf = InterRDF_s(self.u, self.ags, nbins=412).run()
+
+        assert_(len(rdf.bins) == 412)
+        for count in rdf.count:
+            assert_(count.shape == (412,))
+
+    def test_same_as_InterRDF(self):
+        rdf = InterRDF_s(self.u, self.ags, nbins=20, range=(0.0, 3.0)).run()
+        for (g1, g2), count, result in zip(self.ags, rdf.count, rdf.rdf):
+            ref = InterRDF(g1, g2, nbins=20, range=(0.0, 3.0)).run()
+            assert_equal(count, ref.count)
+            assert_almost_equal(result, ref.rdf)
+
+    def test_sites(self):
+        rdf = InterRDF_s(self.u, self.ags, nbins=20, range=(0.0, 3.0),
+                         sites=True).run()
+        total = InterRDF_s(self.u, self.ags, nbins=20,
+                           range=(0.0, 3.0)).run()
+        for (g1, g2), count, result, ref in zip(self.ags, rdf.count,
+                                                rdf.rdf, total.rdf):
+            assert_(count.shape == (len(g1), len(g2), 20))
+            assert_almost_equal(result.mean(axis=(0, 1)), ref)
+
+    def test_site_pair(self):
+        rdf = InterRDF_s(self.u, self.ags, nbins=20, range=(0.0, 3.0),
+                         sites=True).run()
+        g1, g2 = self.ags[0]
+        d = distance_array(g1.positions, g2.positions,
+                           box=self.u.dimensions)
+        ref = np.histogram(d[1, 2], bins=20, range=(0.0, 3.0))[0]
+        assert_equal(rdf.count[0][1, 2], ref)
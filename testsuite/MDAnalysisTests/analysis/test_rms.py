@@ -35,6 +35,7 @@ import numpy as np
 
 import os
 import sys
+import warnings
 
 from MDAnalysis.exceptions import SelectionError, NoDataError
 from MDAnalysisTests.datafiles import GRO, XTC, rmsfArray, PSF, DCD
@@ -229,6 +230,56 @@ class TestRMSD(object):
         RMSD = MDAnalysis.analysis.rms.RMSD(self.universe)
         RMSD.save('blah')
 
+class TestPairwiseRMSD(object):
+    @dec.skipif(parser_not_found('DCD'),
+                'DCD parser not available. Are you using python 3?')
+    def setUp(self):
+        self.universe = MDAnalysis.Universe(PSF, DCD)
+        self.tempdir = tempdir.TempDir()
+        self.outfile = os.path.join(self.tempdir.name, 'rmsd2d.npy')
+        self.ca = self.universe.select_atoms('name CA')
+
+    def tearDown(self):
+        del self.universe
+        del self.tempdir
+
+    def _reference(self, step, **kwargs):
+        frames = [self.ca.positions.copy()
+                  for ts in self.universe.trajectory[::step]]
+        return [rms.rmsd(a, b, **kwargs)
+                for i, a in enumerate(frames) for b in frames[i + 1:]]
+
+    def test_superposition(self):
+        R = rms.PairwiseRMSD(self.universe, select='name CA', step=10,
+                             block_size=3).run()
+        assert_equal(len(R.rmsd), 45)
+        assert_array_almost_equal(R.rmsd,
+                                  self._reference(10, superposition=True), 4)
+
+    def test_no_superposition(self):
+        R = rms.PairwiseRMSD(self.universe, select='name CA', step=10,
+                             superposition=False).run()
+        assert_array_almost_equal(R.rmsd, self._reference(10), 4)
+
+    def test_mass_weighted(self):
+        R = rms.PairwiseRMSD(self.universe, select='name CA', step=20,
+                             mass_weighted=True, block_size=2).run()
+        assert_array_almost_equal(
+            R.rmsd, self._reference(20, weights=self.ca.masses,
+                                    superposition=True), 4)
+
+    def test_filename(self):
+        R = rms.PairwiseRMSD(self.universe, select='name CA', step=20,
+                             block_size=2, filename=self.outfile).run()
+        assert_array_almost_equal(np.load(self.outfile), R.rmsd)
+        assert_array_almost_equal(R.rmsd,
+                                  self._reference(20, superposition=True), 4)
+
+    @raises(SelectionError)
+    def test_empty_selection(self):
+        rms.PairwiseRMSD(self.universe, select='resname NOTMET')
+
+
 class TestRMSF(TestCase):
     def setUp(self):
         self.universe = MDAnalysis.Universe(GRO, XTC)
@@ -241,7 +292,7 @@ class TestRMSF(TestCase):
 
     def test_rmsf(self):
         rmsfs = MDAnalysis.analysis.rms.RMSF(self.universe.select_atoms('name CA'))
-        rmsfs.run(verbose=False)
+        rmsfs.run()
         test_rmsfs = np.load(rmsfArray)
 
         assert_almost_equal(rmsfs.rmsf, test_rmsfs, 5,
@@ -249,9 +300,19 @@ class TestRMSF(TestCase):
                             "values")
 
     def test_rmsf_single_frame(self):
-        rmsfs = MDAnalysis.analysis.rms.RMSF(self.universe.select_atoms('name CA'))
-        rmsfs.run(start=5, stop=6, verbose=False)
+        rmsfs = MDAnalysis.analysis.rms.RMSF(self.universe.select_atoms('name CA'),
+                                             start=5, stop=6).run()
+
+        assert_almost_equal(rmsfs.rmsf, 0, 5,
+                            err_msg="error: rmsfs should all be zero")
 
+    def test_rmsf_deprecated_run_arguments(self):
+        rmsfs = MDAnalysis.analysis.rms.RMSF(self.universe.select_atoms('name CA'))
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter('always')
+            rmsfs.run(start=5, stop=6, verbose=False)
+        assert_(any(issubclass(w.category, DeprecationWarning)
+                    for w in warns))
         assert_almost_equal(rmsfs.rmsf, 0, 5,
                             err_msg="error: rmsfs should all be zero")
 
@@ -263,7 +324,45 @@ class TestRMSF(TestCase):
 
         self.universe = MDAnalysis.Universe(GRO, self.outfile)
         rmsfs = MDAnalysis.analysis.rms.RMSF(self.universe.select_atoms('name CA'))
-        rmsfs.run(verbose=False)
+        rmsfs.run()
 
         assert_almost_equal(rmsfs.rmsf, 0, 5,
                             err_msg="error: rmsfs should all be 0")
+
+    def test_rmsf_residues(self):
+        protein = self.universe.select_atoms('protein')
+        atoms = MDAnalysis.analysis.rms.RMSF(protein).run()
+        residues = MDAnalysis.analysis.rms.RMSF(protein,
+                                                grouping='residues').run()
+        assert_equal(len(residues.rmsf), protein.n_residues)
+        msf = [np.mean(atoms.rmsf[protein.resindices == ix]**2)
+               for ix in np.unique(protein.resindices)]
+        assert_almost_equal(residues.rmsf, np.sqrt(msf), 5)
+
+    def test_rmsf_merge(self):
+        ca = self.universe.select_atoms('name CA')
+        rmsfs = MDAnalysis.analysis.rms.RMSF(ca, stop=4).run()
+        rmsfs.merge(MDAnalysis.analysis.rms.RMSF(ca, start=4).run())
+        assert_almost_equal(rmsfs.rmsf, np.load(rmsfArray), 5)
+
+    def test_rmsf_in_memory(self):
+        self.universe.transfer_to_memory()
+        rmsfs = MDAnalysis.analysis.rms.RMSF(
+            self.universe.select_atoms('name CA')).run()
+        assert_almost_equal(rmsfs.rmsf, np.load(rmsfArray), 5)
+
+    def test_rmsf_nproc(self):
+        rmsfs = MDAnalysis.analysis.rms.RMSF(
+            self.universe.select_atoms('name CA'), nproc=2).run()
+        assert_almost_equal(rmsfs.rmsf, np.load(rmsfArray), 5)
+
+    def test_rmsf_nproc_negative_step(self):
+        # all frames in reverse order have the same fluctuations
+        rmsfs = MDAnalysis.analysis.rms.RMSF(
+            self.universe.select_atoms('name CA'), step=-1, nproc=2).run()
+        assert_equal(rmsfs._count, self.universe.trajectory.n_frames)
+        assert_almost_equal(rmsfs.rmsf, np.load(rmsfArray), 5)
+
+    @raises(ValueError)
+    def test_rmsf_grouping(self):
+        MDAnalysis.analysis.rms.RMSF(self.universe.atoms, grouping='segments')
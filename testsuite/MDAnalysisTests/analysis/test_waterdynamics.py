@@ -23,7 +23,7 @@ from __future__ import print_function
 import MDAnalysis
 import MDAnalysis.analysis.waterdynamics
 
-from numpy.testing import TestCase, assert_equal, dec
+from numpy.testing import TestCase, assert_equal, assert_almost_equal, dec
 import numpy as np
 
 from MDAnalysisTests.datafiles import waterPSF, waterDCD
@@ -62,3 +62,28 @@ class TestWaterdynamics(TestCase):
         sp = MDAnalysis.analysis.waterdynamics.SurvivalProbability(self.universe, self.selection1, 0, 6, 3)
         sp.run(verbose=False)
         assert_equal(round(sp.timeseries[1],5), 1.0)
+
+    def test_WaterOrientationalRelaxation_nproc(self):
+        wor = MDAnalysis.analysis.waterdynamics.WaterOrientationalRelaxation(self.universe, self.selection1, 0, 5, 2)
+        wor.run()
+        wor_parallel = MDAnalysis.analysis.waterdynamics.WaterOrientationalRelaxation(self.universe, self.selection1, 0, 5, 2, nproc=2)
+        wor_parallel.run()
+        assert_almost_equal(wor_parallel.timeseries, wor.timeseries)
+
+    def test_HydrogenBondLifetimes_nproc(self):
+        hbl = MDAnalysis.analysis.waterdynamics.HydrogenBondLifetimes(self.universe, self.selection1, self.selection2, 0, 5, 3, nproc=2)
+        hbl.run(verbose=False)
+        assert_equal(round(hbl.timeseries[2][1],5), 0.75)
+
+    def test_SurvivalProbability_nproc(self):
+        sp = MDAnalysis.analysis.waterdynamics.SurvivalProbability(self.universe, "byres name OH2 and prop z < 5", 0, 10, 3)
+        sp.run()
+        sp_parallel = MDAnalysis.analysis.waterdynamics.SurvivalProbability(self.universe, "byres name OH2 and prop z < 5", 0, 10, 3, nproc=3)
+        sp_parallel.run()
+        assert_almost_equal(sp_parallel.timeseries, sp.timeseries)
+
+
+def test_frame_blocks():
+    blocks = MDAnalysis.analysis.waterdynamics._frame_blocks(10, 3)
+    assert_equal(blocks, [(0, 3), (3, 6), (6, 10)])
+    assert_equal(MDAnalysis.analysis.waterdynamics._frame_blocks(2, 4), [(0, 1), (1, 2)])
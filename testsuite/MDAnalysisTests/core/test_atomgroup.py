@@ -456,6 +456,70 @@ class TestCenter(object):
 
         assert_raises(TypeError, self.ag.center, weights)
 
+
+class TestCenterCompound(object):
+    def setUp(self):
+        self.u = make_Universe(('masses',), trajectory=True)
+        self.ag = self.u.atoms[10:60]
+
+    def tearDown(self):
+        del self.u
+        del self.ag
+
+    def test_center_residues(self):
+        weights = np.arange(self.ag.n_atoms, dtype=np.float64) + 1
+        ref = np.vstack([np.average(self.ag.positions[self.ag.resindices == r],
+                                    weights=weights[self.ag.resindices == r],
+                                    axis=0)
+                         for r in np.unique(self.ag.resindices)])
+        assert_array_almost_equal(self.ag.center(weights, compound='residues'),
+                                  ref)
+
+    def test_center_of_geometry_residues(self):
+        ref = np.vstack([r.atoms.center_of_geometry()
+                         for r in self.ag.residues])
+        cog = self.ag.center_of_geometry(compound='residues')
+        assert_equal(cog.shape, (self.ag.n_residues, 3))
+        assert_array_almost_equal(cog, ref)
+
+    def test_center_of_mass_segments(self):
+        # only the atoms of the group contribute to the segment centers
+        ref = np.vstack([self.ag[self.ag.segindices == s].center_of_mass()
+                         for s in np.unique(self.ag.segindices)])
+        assert_array_almost_equal(self.ag.center_of_mass(compound='segments'),
+                                  ref)
+
+    def test_center_of_mass_group(self):
+        assert_array_almost_equal(self.ag.center_of_mass(compound='group'),
+                                  self.ag.center_of_mass())
+
+    def test_center_only_group_atoms(self):
+        # only atoms 10 and 11 of the third residue are in the group
+        ag = self.u.atoms[7:12]
+        cog = ag.center_of_geometry(compound='residues')
+        assert_array_almost_equal(cog[1], self.u.atoms[10:12].positions.mean(axis=0))
+
+    def test_center_unwrap(self):
+        self.u.trajectory.ts.dimensions = np.array([300, 300, 300, 90, 90, 90],
+                                                   dtype=np.float32)
+        ref = self.ag.center_of_geometry(compound='residues')
+        self.ag[1:3].translate([300, 0, -300])
+        moved = self.ag.center_of_geometry(compound='residues')
+        assert_(not np.allclose(moved, ref))
+        assert_array_almost_equal(
+            self.ag.center_of_geometry(compound='residues', unwrap=True), ref,
+            decimal=4)
+
+    def test_center_wrong_compound(self):
+        assert_raises(ValueError, self.ag.center_of_mass,
+                      compound='strawberries')
+
+    def test_center_wrong_length(self):
+        weights = np.ones(self.ag.n_atoms + 4)
+
+        assert_raises(ValueError, self.ag.center, weights,
+                      compound='residues')
+
 def test_representations():
     u = make_Universe()
     for level in (mda.core.groups.ATOMLEVEL, mda.core.groups.RESIDUELEVEL,
@@ -577,6 +641,26 @@ class TestWrap(object):
 
         assert_equal(self._in_box(cen), True)
 
+    def test_wrap_residues_intact(self):
+        ag = self.u.atoms[300:400]
+        rel = [r.atoms.positions - r.atoms.positions[0] for r in ag.residues]
+        ag.wrap(compound='residues', center='cog')
+
+        for r, ref in zip(ag.residues, rel):
+            assert_array_almost_equal(r.atoms.positions - r.atoms.positions[0],
+                                      ref, decimal=4)
+
+    def test_wrap_residues_triclinic(self):
+        box = np.array([30., 31., 32., 70., 80., 85.], dtype=np.float32)
+        ag = self.u.atoms[300:400]
+        ref = np.vstack([r.atoms.center_of_geometry() for r in ag.residues])
+        ag.wrap(compound='residues', center='cog', box=box)
+
+        cen = np.vstack([r.atoms.center_of_geometry() for r in ag.residues])
+        assert_array_almost_equal(
+            cen, mda.lib.distances.apply_PBC(ref.astype(np.float32), box),
+            decimal=3)
+
 
 class TestAtomGroupProperties(object):
     """Test working with the properties of Atoms via AtomGroups
@@ -965,6 +1049,12 @@ class TestAtomGroup(object):
         assert_array_almost_equal(self.ag.center_of_mass(),
                                   np.array([-0.01094035, 0.05727601, -0.12885778]))
 
+    def test_center_of_mass_fragments(self):
+        ag = self.universe.atoms[::10]
+        ref = np.vstack([ag[ag.fragindices == i].center_of_mass()
+                         for i in np.unique(ag.fragindices)])
+        assert_array_almost_equal(ag.center_of_mass(compound='fragments'), ref)
+
     def test_coordinates(self):
         assert_array_almost_equal(
             self.ag.positions[1000:2000:200],
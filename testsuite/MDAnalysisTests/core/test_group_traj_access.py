@@ -327,6 +327,52 @@ class TestAtom_ForceVelocity(object):
         assert_array_equal(val, ref)
 
 
+class TestPositionsView(object):
+    def setUp(self):
+        self.u = make_Universe(trajectory=True)
+
+    def tearDown(self):
+        del self.u
+
+    def test_view_contiguous(self):
+        ag = self.u.atoms[10:20]
+        view = ag.positions_view()
+
+        assert_(not view.flags['OWNDATA'])
+        assert_array_equal(view, ag.positions)
+
+    def test_view_strided(self):
+        ag = self.u.atoms[10:50:4]
+
+        assert_array_equal(ag.positions_view(), ag.positions)
+
+    def test_view_write(self):
+        ag = self.u.atoms[10:20]
+        ag.positions_view()[:] = 1.0
+
+        assert_array_equal(self.u.atoms[10:20].positions,
+                           np.ones((10, 3), dtype=np.float32))
+        assert_array_equal(self.u.atoms[20].position,
+                           np.array([60, 61, 62], dtype=np.float32))
+
+    def test_view_fail(self):
+        ag = self.u.atoms[[1, 5, 2]]
+
+        assert_raises(ValueError, ag.positions_view)
+
+    def test_positions_not_view(self):
+        assert_not_view(self.u.atoms[10:20].positions)
+
+    def test_positions_set_strided(self):
+        ag = self.u.atoms[10:50:4]
+        ag.positions = np.zeros((10, 3))
+
+        assert_array_equal(self.u.atoms.positions[10:50:4],
+                           np.zeros((10, 3), dtype=np.float32))
+        assert_array_equal(self.u.atoms[11].position,
+                           np.array([33, 34, 35], dtype=np.float32))
+
+
 class TestGROVelocities(object):
     def setUp(self):
         #reference velocities for the full 6-atom test case:
@@ -672,6 +672,31 @@ class TestTopologyGroup_Cython(object):
                                    box=self.u.dimensions))
 
 
+    def test_result_array(self):
+        result = np.zeros(len(self.bgroup), dtype=np.float64)
+        ret = self.bgroup.bonds(result=result)
+
+        assert_(ret is result)
+        assert_equal(result, calc_bonds(self.bgroup.atom1.positions,
+                                        self.bgroup.atom2.positions))
+
+    def test_atom_bonds_arrays(self):
+        # bonds of a group are the union of the bonds of its atoms
+        ref = set()
+        for at in self.u.atoms[:5]:
+            ref.update(tuple(b.indices) for b in at.bonds)
+
+        assert_equal(set(tuple(row) for row in self.bgroup.indices), ref)
+
+    def test_select_bonds_values(self):
+        tg = self.u.atoms.bonds
+        key = tg.types()[0]
+        sel = tg.select_bonds(key)
+
+        assert_equal(sel.values(),
+                     calc_bonds(sel.atom1.positions, sel.atom2.positions))
+
+
 def test_bond_length_pbc():
     u = mda.Universe(TRZ_psf, TRZ)
 
@@ -374,6 +374,60 @@ class TestMakeWhole(object):
         mdamath.make_whole(self.ag)
         assert_raises(ValueError, mdamath.make_whole, self.u.atoms)
 
+    def test_bond_traversal(self):
+        self._load_bonds()
+        roots, levels = mdamath.bond_traversal(self.u.atoms.bonds.indices,
+                                               len(self.u.atoms))
+        assert_array_equal(roots, [0, 8])
+        assert_array_equal(levels[0][0], [0])
+        assert_array_equal(levels[0][1], [1])
+        children = np.concatenate([c for _, c in levels])
+        assert_array_equal(np.sort(children), np.arange(1, 8))
+
+    def _check_solved(self, positions):
+        assert_array_almost_equal(positions[:4],
+                                  self.u.atoms[:4].positions)
+        assert_array_almost_equal(positions[4:8],
+                                  np.array([[110.0, 50.0, 0.0],
+                                            [110.0, 60.0, 0.0],
+                                            [110.0, 40.0, 0.0],
+                                            [120.0, 50.0, 0.0]]))
+
+    def test_unwrap_bonded(self):
+        self._load_bonds()
+        traversal = mdamath.bond_traversal(self.u.atoms.bonds.indices,
+                                           len(self.u.atoms))
+        positions = mdamath.unwrap_bonded(self.u.atoms.positions, traversal,
+                                          self.u.dimensions)
+        self._check_solved(positions)
+        # the lone atom is not moved
+        assert_array_almost_equal(positions[8], self.u.atoms[8].position)
+
+    def test_unwrap_bonded_triclinic(self):
+        self._load_bonds()
+        self.u.dimensions = [100., 100., 100., 80., 80., 80.]
+        traversal = mdamath.bond_traversal(self.u.atoms.bonds.indices,
+                                           len(self.u.atoms))
+        positions = mdamath.unwrap_bonded(self.u.atoms.positions, traversal,
+                                          self.u.dimensions)
+        self._check_solved(positions)
+
+    def test_unwrap_bonded_zero_box(self):
+        self._load_bonds()
+        traversal = mdamath.bond_traversal(self.u.atoms.bonds.indices,
+                                           len(self.u.atoms))
+        assert_raises(ValueError, mdamath.unwrap_bonded,
+                      self.u.atoms.positions, traversal,
+                      np.zeros(6, dtype=np.float32))
+
+    def test_pack_into_box_unwrap(self):
+        self._load_bonds()
+        positions = self.ag.pack_into_box(inplace=False, unwrap=True)
+        self._check_solved(positions)
+
+    def test_pack_into_box_unwrap_no_bonds(self):
+        assert_raises(NoDataError, self.ag.pack_into_box, unwrap=True)
+
 
 class Class_with_Caches(object):
     def __init__(self):
@@ -695,6 +695,49 @@ class TestPeriodicAngles_Serial(_TestPeriodicAngles):
 class TestPeriodicAngles_OpenMP(_TestPeriodicAngles):
     backend = "OpenMP"
 
+class TestCappedDistance(TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(42)
+        self.ref = (rng.rand(100, 3) * 40.0 - 5.0).astype(np.float32)
+        self.conf = (rng.rand(80, 3) * 40.0 - 5.0).astype(np.float32)
+
+    def _check(self, cutoff, box):
+        from MDAnalysis.lib.distances import capped_distance, distance_array
+
+        d = distance_array(self.ref, self.conf, box=box)
+        pairs, dist = capped_distance(self.ref, self.conf, cutoff, box=box)
+        ref_pairs = np.transpose(np.nonzero(d <= cutoff))
+        order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+
+        assert_equal(pairs[order], ref_pairs)
+        assert_almost_equal(dist[order], d[d <= cutoff], decimal=4)
+
+    def test_no_box(self):
+        self._check(4.0, None)
+
+    def test_ortho(self):
+        self._check(4.0, np.array([30, 30, 30, 90, 90, 90], dtype=np.float32))
+
+    def test_triclinic(self):
+        self._check(4.0, np.array([30, 35, 40, 80, 85, 95], dtype=np.float32))
+
+    def test_small_box(self):
+        # fewer than three cells per dimension: all pairs are compared
+        self._check(4.0, np.array([10, 10, 10, 90, 90, 90], dtype=np.float32))
+
+    def test_chunks(self):
+        from MDAnalysis.lib.distances import capped_distance, iter_capped_distance
+
+        box = np.array([30, 30, 30, 90, 90, 90], dtype=np.float32)
+        pairs = capped_distance(self.ref, self.conf, 4.0, box=box,
+                                return_distances=False)
+        chunks = np.concatenate([p for p, d in iter_capped_distance(
+            self.ref, self.conf, 4.0, box=box, max_pairs=50)])
+
+        assert_equal(len(chunks), len(pairs))
+        assert_equal(set(map(tuple, chunks)), set(map(tuple, pairs)))
+
+
 class TestDistanceBackendSelection(object):
     def __init__(self):
         self.positions = np.random.rand(10, 3)
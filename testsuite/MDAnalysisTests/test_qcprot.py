@@ -40,7 +40,8 @@ import numpy as np
 
 import MDAnalysis.lib.qcprot as qcp
 
-from numpy.testing import assert_almost_equal, assert_array_almost_equal
+from numpy.testing import (assert_almost_equal, assert_array_almost_equal,
+                           assert_equal, assert_raises)
 from nose.plugins.attrib import attr
 import MDAnalysis.analysis.rms as rms
 
@@ -172,3 +173,58 @@ def test_weights():
     q = np.array([0.99861395, .022982, .04735006, -.02409085, .99944556, .022982, -.04679564, -.02409085, .99861395])
     np.testing.assert_almost_equal(q, o)
 
+
+
+class TestBatchCalcRMSD(object):
+    def setUp(self):
+        rng = np.random.RandomState(31)
+        self.refs = 5 * rng.randn(3, 20, 3)
+        self.confs = 5 * rng.randn(7, 20, 3) + 2
+        self.weights = rng.rand(20)
+
+    def tearDown(self):
+        del self.refs, self.confs, self.weights
+
+    def _reference(self, weights=None):
+        rmsd = np.empty((len(self.refs), len(self.confs)))
+        rot = np.empty((len(self.refs), len(self.confs), 9))
+        for i, ref in enumerate(self.refs):
+            for j, conf in enumerate(self.confs):
+                a = ref - np.average(ref, axis=0, weights=weights)
+                b = conf - np.average(conf, axis=0, weights=weights)
+                rmsd[i, j] = qcp.CalcRMSDRotationalMatrix(
+                    a, b, len(a), rot[i, j], weights)
+        return rmsd, rot.reshape(rmsd.shape + (3, 3))
+
+    def test_rmsd_rotations(self):
+        rmsd, rot = qcp.BatchCalcRMSDRotationalMatrix(
+            self.refs, self.confs, rotations=True)
+        ref_rmsd, ref_rot = self._reference()
+        assert_array_almost_equal(rmsd, ref_rmsd)
+        assert_array_almost_equal(rot, ref_rot)
+
+    def test_weights(self):
+        rmsd = qcp.BatchCalcRMSDRotationalMatrix(self.refs, self.confs,
+                                                 weights=self.weights)
+        assert_array_almost_equal(rmsd, self._reference(self.weights)[0])
+
+    def test_float32(self):
+        rmsd = qcp.BatchCalcRMSDRotationalMatrix(
+            self.refs, self.confs.astype(np.float32))
+        assert_array_almost_equal(rmsd, self._reference()[0], 4)
+
+    def test_single(self):
+        rmsd = qcp.BatchCalcRMSDRotationalMatrix(self.refs[0], self.confs)
+        assert_equal(rmsd.shape, (len(self.confs),))
+        rmsd = qcp.BatchCalcRMSDRotationalMatrix(self.refs[0], self.confs[0])
+        assert_equal(rmsd.shape, ())
+        assert_almost_equal(rmsd, self._reference()[0][0, 0])
+
+    def test_no_center(self):
+        confs = self.confs - self.confs.mean(axis=1)[:, np.newaxis]
+        rmsd = qcp.BatchCalcRMSDRotationalMatrix(confs, confs, center=False)
+        assert_array_almost_equal(rmsd.diagonal(), np.zeros(len(confs)), 5)
+
+    def test_mismatched_atoms(self):
+        assert_raises(ValueError, qcp.BatchCalcRMSDRotationalMatrix,
+                      self.refs[:, :5], self.confs)